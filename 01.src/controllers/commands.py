@@ -1,6 +1,7 @@
 # ohCHA_RigManager/01/src/controllers/commands.py
 # Description: [Refactored] Removed legacy 'Rigging Commands' (Biped/Weight).
 #              Now focuses on Edit Mesh and Skinning commands only.
+#              - NEW: BatchMeshCommand (many nodes x many fixes, one MaxScript call / undo record).
 
 from pymxs import runtime as rt
 import traceback
@@ -53,6 +54,15 @@ class AddSkinCommand(BaseCommand):
         super().__init__(n, "Add Skin"); self.limit = limit; self.dq = dq
     def _run(self): return edit_mesh_logic.finalize_add_skin(self.node, self.limit, self.dq)
 
+class BatchMeshCommand(BaseCommand):
+    """results: {node handle: error text} after execute() ("" = OK)."""
+    def __init__(self, nodes, ops, limit=4, dq=False):
+        super().__init__(None, f"Batch ({', '.join(ops)}) x{len(nodes)}")
+        self.nodes = list(nodes); self.ops = list(ops); self.limit = limit; self.dq = dq; self.results = {}
+    def _run(self):
+        self.results = edit_mesh_logic.batch_apply(self.nodes, self.ops, self.limit, self.dq)
+        return bool(self.results) and not any(self.results.values())
+
 # --- Skinning Commands ---
 class SkinHideCommand(BaseCommand):
     def __init__(self, type, uns): super().__init__(None, f"Hide {type}"); self.type = type; self.uns = uns
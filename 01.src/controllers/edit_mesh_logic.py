@@ -1,35 +1,44 @@
 # ohCHA_RigManager/01/src/controllers/edit_mesh_logic.py
 # Description: [Refactored] Cleaned up imports, removed mock classes, and added type hinting.
 #              Ensures strict dependency on 'utils.ohcha_max_utils'.
+#              - PERF: Fix actions are compiled MaxScript snippets (no temp file per command).
+#              - PERF: scan_and_check_scene() reads every check input in one MaxScript call
+#                (ohCHA_MeshLogic.scanSceneMeshes) and evaluates the checks column-wise.
+#              - PERF: MeshCheckCache keeps results by node handle; NodeEventCallback marks changed nodes
+#                dirty so a refresh only rescans those (and reports added / removed handles).
+#              - Checks live in controllers.mesh_checks (cheap ones on refresh, geometry ones on demand).
+#              - Geometry check results are reused across sessions via mesh_result_store (fingerprint cache).
+#              - NEW: batch_apply(): fixes / finalize for many nodes in one MaxScript call and one undo record.
+#              - NEW: Progressive full scan (begin_full_scan / scan_chunk / end_full_scan) for time-sliced refresh.
+#              - FIXED: run_all_checks() evaluates through mesh_check_registry (tolerances live in mesh_checks only);
+#                the duplicated per-node scale / pivot checks are removed.
+#              - FIXED: Chunked geometry checks (flush=False) write the result cache once, via flush_geometry_results().
 
-import textwrap
 from pymxs import runtime as rt
 
 # ⭐️ Strict Import: 실제 유틸리티가 없으면 툴이 동작하지 않도록 명확히 에러를 띄웁니다.
 try:
     from utils.ohcha_max_utils import (
         OchaError,
-        execute_mxs_as_file,
         is_valid_mesh
     )
+    from utils.mxs_snippets import mxs_snippets
 except ImportError as e:
     rt.print(f"❌ [edit_mesh_logic] Critical Import Error: {e}")
     raise
-
-
-def check_identity_scale(node) -> dict:
-    """
-    노드의 스케일이 (1,1,1)인지 검사합니다.
-    """
-    scale_val = node.scale
-    tolerance = 1e-5
-    # Point3 비교 시 각 성분별 오차 체크
-    has_issue = (
-        abs(scale_val.x - 1.0) > tolerance or
-        abs(scale_val.y - 1.0) > tolerance or
-        abs(scale_val.z - 1.0) > tolerance
-    )
-    return {"has_issue": has_issue, "value": scale_val}
+try:
+    from controllers.mesh_checks import mesh_check_registry
+except ImportError as e:
+    rt.print(f"❌ [edit_mesh_logic] Critical Import Error: {e}")
+    raise
+try:
+    from controllers.mesh_result_store import mesh_result_store
+except ImportError:
+    mesh_result_store = None
+try:
+    from utils.mxs_loader import mxs_loader
+except ImportError:
+    mxs_loader = None
 
 
 def check_existing_skin(node) -> dict:
@@ -42,17 +51,6 @@ def check_existing_skin(node) -> dict:
     return {"has_issue": False, "value": None}
 
 
-def check_pivot_not_at_origin(node) -> dict:
-    """
-    피벗이 월드 원점(0,0,0)에 있는지 검사합니다.
-    """
-    pivot_pos = node.pivot
-    tolerance = 1e-5
-    dist = rt.distance(pivot_pos, rt.Point3(0, 0, 0))
-    has_issue = dist > tolerance
-    return {"has_issue": has_issue, "value": pivot_pos}
-
-
 def get_scene_meshes() -> list[dict]:
     """
     씬 내의 유효한 지오메트리(숨김/동결 제외)를 수집합니다.
@@ -70,30 +68,327 @@ def run_all_checks(node) -> dict:
     """
     if not is_valid_mesh(node):
         return {}
+    return mesh_check_registry.run_cheap(_scan_columns([node]))[0]
+
+
+# ----------------------------------------------------------------------------
+# Bulk Scan (One Round Trip)
+# ----------------------------------------------------------------------------
+
+_SCAN_COLUMNS = ("nodes", "names", "handles", "anims", "sx", "sy", "sz", "skins", "px", "py", "pz")
+
+
+def _scan_columns(nodes) -> dict:
+    """Scan columns for the given (valid mesh) nodes, read per node through pymxs."""
+    cols = {k: [] for k in _SCAN_COLUMNS}
+    for node in nodes:
+        s, p = node.scale, node.pivot
+        skin = check_existing_skin(node)["value"] or ""
+        row = (node, node.name, node.handle, rt.getHandleByAnim(node), s.x, s.y, s.z, skin, p.x, p.y, p.z)
+        for k, v in zip(_SCAN_COLUMNS, row):
+            cols[k].append(v)
+    return cols
+
+
+def _scan_nodes_fallback(nodes) -> dict:
+    """MaxScript 모듈을 쓸 수 없을 때: 노드별 pymxs 읽기로 같은 컬럼을 만듭니다."""
+    return _scan_columns([n for n in nodes if is_valid_mesh(n) and not n.isHidden and not n.isFrozen])
+
+
+def _bulk_scan(fn_name: str, *args):
+    if mxs_loader is None or not mxs_loader.require("ohcha_mesh_logic"): return None
+    try:
+        raw = getattr(rt.ohCHA_MeshLogic, fn_name)(*args)
+        return {k: list(col) for k, col in zip(_SCAN_COLUMNS, raw)}
+    except Exception as e:
+        rt.print(f"⚠️ [edit_mesh_logic] Bulk scan failed, using per-node scan: {e}")
+        return None
+
+
+def scan_scene_meshes() -> dict:
+    """
+    씬의 검사 대상 메쉬와 검사 입력값을 컬럼 단위로 한 번에 가져옵니다.
+    Returns {"nodes", "names", "handles", "anims", "sx", "sy", "sz", "skins", "px", "py", "pz"} (equal-length lists).
+    """
+    return _bulk_scan("scanSceneMeshes") or _scan_nodes_fallback(rt.objects)
+
 
-    results = {
-        "non_uniform_scale": check_identity_scale(node),
-        "existing_skin": check_existing_skin(node),
-        "pivot_not_at_origin": check_pivot_not_at_origin(node),
-    }
+def list_scene_candidates() -> list[dict]:
+    """Candidate meshes without check inputs: [{"name", "node", "handle", "anim", "results": None}]."""
+    cols = None
+    if mxs_loader is not None and mxs_loader.require("ohcha_mesh_logic"):
+        try:
+            cols = [list(c) for c in rt.ohCHA_MeshLogic.listCandidates()]
+        except Exception as e:
+            rt.print(f"⚠️ [edit_mesh_logic] Candidate list failed, using per-node scan: {e}")
+    if cols is None:
+        nodes = [m["node"] for m in get_scene_meshes()]
+        cols = [nodes, [n.name for n in nodes], [n.handle for n in nodes], [rt.getHandleByAnim(n) for n in nodes]]
+    return [{"name": name, "node": node, "handle": int(h), "anim": int(a), "results": None}
+            for node, name, h, a in zip(*cols)]
+
+
+def scan_anim_handles(anim_handles) -> dict:
+    """scan_scene_meshes() for a subset of nodes (anim handles); gone / non-candidate nodes are left out."""
+    anim_handles = [int(h) for h in anim_handles]
+    return (_bulk_scan("scanAnimHandles", rt.Array(*anim_handles))
+            or _scan_nodes_fallback([rt.getAnimByHandle(h) for h in anim_handles]))
+
+
+def evaluate_checks(scan: dict) -> list[dict]:
+    """
+    스캔 컬럼 전체에 대해 검사를 한 번에 평가합니다.
+    Returns [{"name", "node", "handle", "anim", "results"}] with the same result dicts as run_all_checks()
+    (cheap checks only; see run_geometry_checks()).
+    """
+    results = mesh_check_registry.run_cheap(scan)
+    rows = zip(scan["nodes"], scan["names"], scan["handles"], scan["anims"], results)
+    return [{"name": name, "node": node, "handle": int(handle), "anim": int(anim), "results": res}
+            for node, name, handle, anim, res in rows]
+
+
+def run_geometry_checks(node) -> dict:
+    """
+    On-demand (expensive) geometry checks for one mesh: degenerate faces, isolated vertices,
+    non-manifold edges, duplicate vertices, unwelded seams. Geometry is read once for all of them.
+    Unchanged meshes are answered from the persistent fingerprint cache.
+    """
+    if not is_valid_mesh(node): return {}
+    if mesh_result_store is None: return mesh_check_registry.run_expensive(node)
+    return mesh_result_store.run([node])[0].get(int(node.handle), {})
+
+
+def run_geometry_checks_batch(nodes, report: bool = True, flush: bool = True) -> dict:
+    """Geometry checks for many meshes; only meshes missing from the fingerprint cache are checked.
+    report=False skips the summary line, flush=False defers the cache write (the tab calls this per
+    scheduler chunk and calls flush_geometry_results() when the run ends)."""
+    nodes = [n for n in nodes if is_valid_mesh(n)]
+    if mesh_result_store is None:
+        return {int(n.handle): mesh_check_registry.run_expensive(n) for n in nodes}
+    results, hits, misses = mesh_result_store.run(nodes, flush=flush)
+    if report: rt.print(f"🔍 [edit_mesh_logic] Geometry checks: {misses} run, {hits} from cache.")
     return results
 
 
+def flush_geometry_results() -> bool:
+    """Writes pending geometry results (after chunked run_geometry_checks_batch(flush=False) calls)."""
+    return mesh_result_store.flush() if mesh_result_store is not None else True
+
+
+def cached_geometry_results(node):
+    """Stored geometry results for an unchanged mesh (no checks are run), or None."""
+    if mesh_result_store is None or not is_valid_mesh(node): return None
+    return mesh_result_store.lookup(node)
+
+
+def scan_and_check_scene() -> list[dict]:
+    """get_scene_meshes() + run_all_checks() for the whole scene, in one MaxScript round trip."""
+    return evaluate_checks(scan_scene_meshes())
+
+
+# ----------------------------------------------------------------------------
+# Incremental Results Cache
+# ----------------------------------------------------------------------------
+
+TRACKER_CALLBACK_ID = "ohCHA_MeshTracker"
+
+# 검사 결과에 영향을 주는 노드 이벤트 (transform, modifier stack, geometry, name, hide/freeze, add/delete)
+_TRACKED_NODE_EVENTS = (
+    "added", "deleted", "nameChanged", "linkChanged", "modelStructured", "modelOtherEvent",
+    "geometryChanged", "topologyChanged", "controllerStructured", "controllerOtherEvent",
+    "hideChanged", "freezeChanged",
+)
+_SCENE_RESET_CALLBACKS = ("filePostOpen", "filePostMerge", "systemPostReset", "systemPostNew")
+
+
+class MeshCheckCache:
+    """
+    node handle -> scan entry (evaluate_checks 결과).
+    While tracking, NodeEventCallback records the anim handles of changed nodes; refresh() rescans only those.
+    Without tracking (or after a scene reset) the next refresh() is a full scan.
+    """
+
+    def __init__(self):
+        self.entries = {}     # node handle -> entry (scene order)
+        self._by_anim = {}    # anim handle -> node handle
+        self._dirty = set()   # anim handles
+        self._full = True
+        self._node_cb = None
+        self._general_cbs = []  # keeps the Python callables alive while registered
+
+    @property
+    def is_tracking(self) -> bool:
+        return self._node_cb is not None
+
+    def _on_node_event(self, ev, anim_handles):
+        # Called inside Max notifications: record only.
+        self._dirty.update(int(h) for h in anim_handles)
+
+    def invalidate(self, *args):
+        """Forces a full rescan on the next refresh()."""
+        self._full = True
+        self._dirty.clear()
+
+    def start_tracking(self):
+        if self.is_tracking: return
+        try:
+            handlers = {ev: self._on_node_event for ev in _TRACKED_NODE_EVENTS}
+            self._node_cb = rt.NodeEventCallback(**handlers)
+        except Exception as e:
+            self._node_cb = None
+            rt.print(f"⚠️ [edit_mesh_logic] NodeEventCallback 등록 실패 (full rescans): {e}")
+            return
+        cb_id = rt.Name(TRACKER_CALLBACK_ID)
+        for cb_name in _SCENE_RESET_CALLBACKS:
+            fn = self.invalidate
+            try:
+                rt.callbacks.addScript(rt.Name(cb_name), fn, id=cb_id)
+                self._general_cbs.append(fn)
+            except Exception as e:
+                rt.print(f"⚠️ [edit_mesh_logic] callbacks.addScript #{cb_name} 실패: {e}")
+
+    def stop_tracking(self):
+        """Changes made while not tracking are unknown, so the next refresh() rescans everything."""
+        if not self.is_tracking: return
+        try:
+            rt.callbacks.removeScripts(id=rt.Name(TRACKER_CALLBACK_ID))
+        except Exception:
+            pass
+        self._general_cbs = []
+        self._node_cb = None
+        try:
+            rt.gc(light=True)
+        except Exception:
+            pass
+        self.invalidate()
+
+    def _store(self, entry):
+        self.entries[entry["handle"]] = entry
+        self._by_anim[entry["anim"]] = entry["handle"]
+
+    @property
+    def needs_full_scan(self) -> bool:
+        return self._full or not self.is_tracking
+
+    # --- Progressive full scan (driven by the UI scheduler) ---
+    def begin_full_scan(self) -> list[dict]:
+        """Resets the cache to the current candidates (results None) and returns them in scene order."""
+        stubs = list_scene_candidates()
+        self.entries, self._by_anim = {}, {}
+        for e in stubs: self._store(e)
+        self._dirty.clear()
+        return stubs
+
+    def scan_chunk(self, anim_handles):
+        """Scans / evaluates a chunk of a full scan. Returns (entries, removed_handles)."""
+        entries = evaluate_checks(scan_anim_handles(anim_handles))
+        seen = {e["anim"] for e in entries}
+        removed = []
+        for ah in anim_handles:
+            if ah in seen: continue
+            h = self._by_anim.pop(ah, None)
+            if h is not None and self.entries.pop(h, None) is not None: removed.append(h)
+        for e in entries: self._store(e)
+        return entries, removed
+
+    def end_full_scan(self):
+        self._full = not self.is_tracking
+
+    def refresh(self):
+        """
+        Returns (changed_entries, removed_handles, full).
+        full=True: 'changed_entries' is the whole list (rebuild); otherwise patch only those handles.
+        """
+        if self._full or not self.is_tracking:
+            entries = scan_and_check_scene()
+            self.entries, self._by_anim = {}, {}
+            for e in entries: self._store(e)
+            self._dirty.clear()
+            self._full = not self.is_tracking
+            return entries, [], True
+
+        if not self._dirty: return [], [], False
+        dirty, self._dirty = self._dirty, set()
+
+        changed = evaluate_checks(scan_anim_handles(dirty))
+        seen = {e["anim"] for e in changed}
+        removed = []
+        for ah in dirty - seen:
+            h = self._by_anim.pop(ah, None)
+            if h is not None and self.entries.pop(h, None) is not None: removed.append(h)
+        for e in changed: self._store(e)
+        return changed, removed, False
+
+
+mesh_check_cache = MeshCheckCache()
+
+
 # ----------------------------------------------------------------------------
 # Fix Actions (Commands)
 # ----------------------------------------------------------------------------
 
+_NODE = "ohCHA_Logic_TargetNode"
+
+mxs_snippets.register("reset_xform", _NODE, """
+    undo "Apply Reset XForm" on (
+        ResetXForm ohCHA_Logic_TargetNode
+        maxOps.CollapseNodeTo ohCHA_Logic_TargetNode 1 true
+    )
+""")
+
+mxs_snippets.register("lock_all_transforms", _NODE,
+                      'undo "Lock All Transforms" on (setTransformLockFlags ohCHA_Logic_TargetNode #all)')
+
+mxs_snippets.register("delete_skin_modifier", _NODE, """
+    undo "Delete Skin Modifier" on (
+        for i = ohCHA_Logic_TargetNode.modifiers.count to 1 by -1 do (
+            if isKindOf ohCHA_Logic_TargetNode.modifiers[i] Skin do ( deleteModifier ohCHA_Logic_TargetNode i )
+        )
+    )
+""")
+
+mxs_snippets.register("move_pivot_to_origin", _NODE,
+                      'undo "Move Pivot to Origin" on (ohCHA_Logic_TargetNode.pivot = [0,0,0])')
+
+mxs_snippets.register("enable_all_inheritance", _NODE,
+                      'undo "Enable All Inheritance" on (setInheritanceFlags ohCHA_Logic_TargetNode #all)')
+
+mxs_snippets.register("add_skin", (_NODE, "boneLimit", "useDQ"), """
+    undo "Add and Configure Skin" on
+    (
+        try
+        (
+            addModifier ohCHA_Logic_TargetNode (Skin())
+
+            if (ohCHA_Logic_TargetNode.modifiers[#Skin] != undefined) then
+            (
+                ohCHA_Logic_TargetNode.modifiers[#Skin].bone_Limit = boneLimit
+                ohCHA_Logic_TargetNode.modifiers[#Skin].enableDQ = useDQ
+
+                -- UI 갱신을 위해 선택 및 패널 활성화
+                select ohCHA_Logic_TargetNode
+                modPanel.setCurrentObject ohCHA_Logic_TargetNode.modifiers[#Skin]
+
+                true
+            )
+            else
+            (
+                false
+            )
+        )
+        catch
+        (
+            false
+        )
+    )
+""")
+
+
 def apply_reset_xform(node) -> bool:
     """
     Reset XForm을 적용하고 스택을 합칩니다.
     """
-    mxs_code = (
-        "undo \"Apply Reset XForm\" on ("
-        "ResetXForm ohCHA_Logic_TargetNode; "
-        "maxOps.CollapseNodeTo ohCHA_Logic_TargetNode 1 true"
-        ")"
-    )
-    result = execute_mxs_as_file(mxs_code, node=node)
+    result = mxs_snippets.call_on_node("reset_xform", node)
     return result is not None
 
 
@@ -101,8 +396,7 @@ def lock_all_transforms(node) -> bool:
     """
     모든 트랜스폼(이동/회전/크기)을 잠급니다.
     """
-    mxs_code = "undo \"Lock All Transforms\" on (setTransformLockFlags ohCHA_Logic_TargetNode #all)"
-    result = execute_mxs_as_file(mxs_code, node=node)
+    result = mxs_snippets.call_on_node("lock_all_transforms", node)
     return result is not None
 
 
@@ -110,14 +404,7 @@ def delete_skin_modifier(node) -> bool:
     """
     모든 Skin 모디파이어를 삭제합니다.
     """
-    mxs_code = (
-        "undo \"Delete Skin Modifier\" on ("
-        "for i = ohCHA_Logic_TargetNode.modifiers.count to 1 by -1 do ("
-        "if isKindOf ohCHA_Logic_TargetNode.modifiers[i] Skin do ("
-        "deleteModifier ohCHA_Logic_TargetNode i"
-        ")))"
-    )
-    result = execute_mxs_as_file(mxs_code, node=node)
+    result = mxs_snippets.call_on_node("delete_skin_modifier", node)
     return result is not None
 
 
@@ -125,8 +412,7 @@ def move_pivot_to_origin(node) -> bool:
     """
     피벗을 (0,0,0)으로 이동시킵니다.
     """
-    mxs_code = "undo \"Move Pivot to Origin\" on (ohCHA_Logic_TargetNode.pivot = [0,0,0])"
-    result = execute_mxs_as_file(mxs_code, node=node)
+    result = mxs_snippets.call_on_node("move_pivot_to_origin", node)
     return result is not None
 
 
@@ -134,8 +420,7 @@ def enable_all_inheritance(node) -> bool:
     """
     상속 플래그를 모두 켭니다 (R/S/T).
     """
-    mxs_code = "undo \"Enable All Inheritance\" on (setInheritanceFlags ohCHA_Logic_TargetNode #all)"
-    result = execute_mxs_as_file(mxs_code, node=node)
+    result = mxs_snippets.call_on_node("enable_all_inheritance", node)
     return result is not None
 
 
@@ -144,42 +429,58 @@ def finalize_add_skin(node, bone_limit: int = 4, use_dq: bool = False) -> bool:
     최종 단계: Skin 모디파이어를 추가하고 설정을 적용합니다.
     실패 시 OchaError를 발생시켜 상위 컨트롤러에서 잡도록 합니다.
     """
-    mxs_bool = "on" if use_dq else "off"
+    result = mxs_snippets.call_on_node("add_skin", node, int(bone_limit), bool(use_dq))
 
-    # textwrap을 사용하여 MaxScript 코드의 들여쓰기와 가독성을 유지
-    mxs_code_configure = textwrap.dedent(f"""
-    undo "Add and Configure Skin" on
-    (
-        try
-        (
-            addModifier ohCHA_Logic_TargetNode (Skin())
+    if result is not True:
+        raise OchaError(f"Skin 모디파이어 추가/설정에 실패했습니다.\n(Node: {node.name})")
 
-            if (ohCHA_Logic_TargetNode.modifiers[#Skin] != undefined) then
-            (
-                ohCHA_Logic_TargetNode.modifiers[#Skin].bone_Limit = {bone_limit}
-                ohCHA_Logic_TargetNode.modifiers[#Skin].enableDQ = {mxs_bool}
+    return True
 
-                -- UI 갱신을 위해 선택 및 패널 활성화
-                select ohCHA_Logic_TargetNode
-                modPanel.setCurrentObject ohCHA_Logic_TargetNode.modifiers[#Skin]
 
-                true 
-            )
-            else
-            (
-                false 
-            )
-        )
-        catch
-        (
-            false 
-        )
-    )
-    """)
+# ----------------------------------------------------------------------------
+# Batch Fix / Finalize (One Transaction)
+# ----------------------------------------------------------------------------
 
-    result = execute_mxs_as_file(mxs_code_configure, node=node)
+OP_RESET_XFORM = "reset_xform"
+OP_DELETE_SKIN = "delete_skin"
+OP_PIVOT_ORIGIN = "pivot_origin"
+OP_LOCK = "lock"
+OP_INHERIT = "inherit"
+OP_ADD_SKIN = "add_skin"
+BATCH_OPS = (OP_RESET_XFORM, OP_DELETE_SKIN, OP_PIVOT_ORIGIN, OP_LOCK, OP_INHERIT, OP_ADD_SKIN)
 
-    if result is not True:
-        raise OchaError(f"Skin 모디파이어 추가/설정에 실패했습니다.\n(Node: {node.name})")
+# Check id -> op that fixes it
+FIX_OPS = {
+    "non_uniform_scale": OP_RESET_XFORM,
+    "existing_skin": OP_DELETE_SKIN,
+    "pivot_not_at_origin": OP_PIVOT_ORIGIN,
+}
+
+
+def finalize_ops(opts: dict) -> list[str]:
+    """EditMeshTab finalize options -> ordered op list (lock, inheritance, skin)."""
+    ops = []
+    if opts.get("lock_transforms"): ops.append(OP_LOCK)
+    if opts.get("enable_inheritance"): ops.append(OP_INHERIT)
+    if opts.get("add_skin"): ops.append(OP_ADD_SKIN)
+    return ops
 
-    return True
\ No newline at end of file
+
+def batch_apply(nodes, ops, bone_limit: int = 4, use_dq: bool = False) -> dict:
+    """
+    'ops' 를 모든 노드에 순서대로 적용합니다: MaxScript 1회 호출, Undo 1회, 리드로우 중지.
+    Returns {node handle: error text ("" = every op succeeded)}.
+    """
+    unknown = [o for o in ops if o not in BATCH_OPS]
+    if unknown: raise OchaError(f"Unknown batch op: {', '.join(unknown)}")
+    nodes = [n for n in nodes if n and rt.isValidNode(n)]
+    if not nodes or not ops: return {}
+    if mxs_loader is None or not mxs_loader.require("ohcha_mesh_logic"):
+        raise OchaError("ohcha_mesh_logic 스크립트를 불러올 수 없습니다.")
+
+    try:
+        handles, errors = rt.ohCHA_MeshLogic.batchApply(
+            rt.Array(*nodes), rt.Array(*(rt.Name(o) for o in ops)), int(bone_limit), bool(use_dq))
+    except Exception as e:
+        raise OchaError(f"Batch Error: {e}")
+    return {int(h): str(err).strip() for h, err in zip(handles, errors) if int(h) >= 0}
@@ -1,6 +1,8 @@
 # ohCHA_RigManager/01/src/controllers/group_controller.py
-# Description: [v1.2.4] Changed storage: Removed MaxFileName dependency.
-#              Groups are now persistent per Mesh Name.
+# Description: [v1.3.0] Set-based membership + bone->group reverse index.
+#              - Batch assign / remove / move, lazy persistence (dirty flag + flush()).
+#              - get_groups_for_ui result cached until the bone list or the groups change.
+#              Groups are persistent per Mesh Name (file format unchanged).
 
 import os
 import json
@@ -13,42 +15,83 @@ try:
 except ImportError:
     get_project_root = lambda: ""
 
+UNGROUPED_KEY = "[Ungrouped]"
+
+
 class GroupController:
     def __init__(self):
         self.node = None
-        self.groups_data = {}
+        self._members = {}           # group name -> set(bone_id), insertion order = UI order
+        self._bone_to_group = {}     # bone_id -> group name (a bone belongs to at most one group)
+        self._dirty = False
+        self._revision = 0
+        self._ui_cache_key = None
+        self._ui_cache = None
+
+    @property
+    def groups_data(self) -> dict:
+        """Serializable view, same layout as the .ohchaGroups file."""
+        return {"groups": {name: sorted(ids) for name, ids in self._members.items()}}
+
+    @property
+    def is_dirty(self) -> bool:
+        return self._dirty
 
     def set_current_node(self, node):
         if node and rt.isValidNode(node):
             if self.node != node:
+                self.flush()
                 self.node = node
                 self.load_groups()
         else:
+            self.flush()
             self.node = None
-            self.groups_data = {}
+            self._set_groups({})
 
     def _get_group_file_path(self):
         if not self.node or not rt.isValidNode(self.node): return None
         project_root = get_project_root()
         if not project_root: return None
-        
+
         cache_dir = os.path.join(project_root, "data", "skin_cache")
         os.makedirs(cache_dir, exist_ok=True)
-        
+
         # ⭐️ [Fix] Removed MaxFileName. Use Node Name only.
         node_name_safe = re.sub(r'[\\/*?:"<>|]', "_", self.node.name).replace(" ", "_")
         return os.path.join(cache_dir, f"{node_name_safe}.ohchaGroups")
 
+    def _set_groups(self, groups: dict):
+        self._members = {}
+        self._bone_to_group = {}
+        for name, ids in groups.items():
+            members = self._members.setdefault(name, set())
+            for bone_id in ids:
+                # Legacy files may list a bone twice; the first group wins.
+                if bone_id in self._bone_to_group: continue
+                members.add(bone_id)
+                self._bone_to_group[bone_id] = name
+        self._dirty = False
+        self._touch()
+
+    def _touch(self):
+        self._revision += 1
+        self._ui_cache_key = None
+        self._ui_cache = None
+
+    def _mark_dirty(self):
+        self._dirty = True
+        self._touch()
+
     def load_groups(self):
         filepath = self._get_group_file_path()
         if filepath and os.path.exists(filepath):
             try:
                 with open(filepath, 'r', encoding='utf-8') as f:
-                    self.groups_data = json.load(f)
+                    self._set_groups(json.load(f).get("groups", {}))
                     return
             except Exception:
                 pass
-        self.groups_data = {"groups": {}}
+        self._set_groups({})
 
     def save_groups(self):
         filepath = self._get_group_file_path()
@@ -56,65 +99,112 @@ class GroupController:
         try:
             with open(filepath, 'w', encoding='utf-8') as f:
                 json.dump(self.groups_data, f, indent=4)
+            self._dirty = False
             return True
         except Exception:
             return False
 
+    def flush(self) -> bool:
+        """Writes pending changes (no-op when clean). Mutations only mark the data dirty."""
+        if not self._dirty: return True
+        return self.save_groups()
+
+    # --- Queries ---
+    def get_group_names(self) -> list[str]:
+        return list(self._members.keys())
+
+    def get_group_of(self, bone_id: int) -> str | None:
+        return self._bone_to_group.get(bone_id)
+
+    def get_group_members(self, name: str) -> list[int]:
+        return sorted(self._members.get(name, ()))
+
+    # --- Mutations (lazy persistence) ---
     def add_group(self, name: str) -> bool:
-        if name in self.groups_data.get("groups", {}):
+        if not name or name in self._members:
             return False
-        if "groups" not in self.groups_data:
-            self.groups_data["groups"] = {}
-        self.groups_data["groups"][name] = []
-        return self.save_groups()
+        self._members[name] = set()
+        self._mark_dirty()
+        return True
 
     def remove_group(self, name: str) -> bool:
-        if name in self.groups_data.get("groups", {}):
-            del self.groups_data["groups"][name]
-            return self.save_groups()
-        return False
-        
+        members = self._members.pop(name, None)
+        if members is None: return False
+        for bone_id in members: self._bone_to_group.pop(bone_id, None)
+        self._mark_dirty()
+        return True
+
     def rename_group(self, old_name: str, new_name: str) -> bool:
-        groups = self.groups_data.get("groups", {})
-        if old_name in groups and new_name not in groups and new_name:
-            groups[new_name] = groups.pop(old_name)
-            return self.save_groups()
-        return False
-
-    def assign_bones_to_group(self, group_name: str, bone_ids: list[int]):
-        groups = self.groups_data.get("groups", {})
-        if group_name not in groups:
+        if old_name not in self._members or new_name in self._members or not new_name:
             return False
-            
-        for name, ids in groups.items():
-            if name != group_name:
-                groups[name] = [bone_id for bone_id in ids if bone_id not in bone_ids]
-        
-        current_ids = set(groups[group_name])
-        current_ids.update(bone_ids)
-        groups[group_name] = sorted(list(current_ids))
-        
-        return self.save_groups()
-
+        # Rebuild to keep the group's position in the UI order.
+        self._members = {(new_name if n == old_name else n): ids for n, ids in self._members.items()}
+        for bone_id in self._members[new_name]: self._bone_to_group[bone_id] = new_name
+        self._mark_dirty()
+        return True
+
+    def assign_bones_to_group(self, group_name: str, bone_ids: list[int]) -> bool:
+        """Moves 'bone_ids' into 'group_name', taking them out of whatever group they were in."""
+        if group_name not in self._members:
+            return False
+        return self.assign_bones_batch({group_name: bone_ids})
+
+    def move_bones_to_group(self, bone_ids: list[int], group_name: str) -> bool:
+        return self.assign_bones_to_group(group_name, bone_ids)
+
+    def assign_bones_batch(self, assignments: dict, create_missing: bool = False) -> bool:
+        """{group_name: [bone_id, ...]} in one pass. Later groups win for bones listed twice."""
+        changed = False
+        for group_name, bone_ids in assignments.items():
+            if group_name not in self._members:
+                if not create_missing or not group_name or group_name == UNGROUPED_KEY: continue
+                self._members[group_name] = set()
+                changed = True
+            target = self._members[group_name]
+            for bone_id in bone_ids:
+                prev = self._bone_to_group.get(bone_id)
+                if prev == group_name: continue
+                if prev is not None: self._members[prev].discard(bone_id)
+                target.add(bone_id)
+                self._bone_to_group[bone_id] = group_name
+                changed = True
+        if changed: self._mark_dirty()
+        return changed
+
+    def remove_bones_from_groups(self, bone_ids: list[int]) -> int:
+        """Ungroups 'bone_ids'. Returns how many were actually removed."""
+        removed = 0
+        for bone_id in bone_ids:
+            prev = self._bone_to_group.pop(bone_id, None)
+            if prev is None: continue
+            self._members[prev].discard(bone_id)
+            removed += 1
+        if removed: self._mark_dirty()
+        return removed
+
+    # --- UI ---
     def get_groups_for_ui(self, all_bones: list[dict]) -> dict:
-        groups_ui_data = {}
-        bone_map = {b['id']: b for b in all_bones}
-        assigned_bone_ids = set()
-
-        for name in self.groups_data.get("groups", {}).keys():
-            groups_ui_data[name] = []
+        # Cache key holds the list itself so its id() cannot be recycled while cached.
+        key = (all_bones, len(all_bones), self._revision)
+        if self._ui_cache_key is not None and self._ui_cache_key[0] is all_bones \
+                and self._ui_cache_key[1:] == key[1:]:
+            return self._ui_cache
+
+        # Single pass over the bones (skin order = id order) via the reverse index.
+        groups_ui_data = {name: [] for name in self._members}
+        ungrouped_bones = []
+        lookup = self._bone_to_group
+        for b in all_bones:
+            name = lookup.get(b['id'])
+            if name is None: ungrouped_bones.append(b)
+            else: groups_ui_data[name].append(b)
 
-        for name, ids in self.groups_data.get("groups", {}).items():
-            for bone_id in ids:
-                if bone_id in bone_map:
-                    groups_ui_data[name].append(bone_map[bone_id])
-                    assigned_bone_ids.add(bone_id)
-
-        ungrouped_bones = [b for b in all_bones if b['id'] not in assigned_bone_ids]
         if ungrouped_bones:
-            groups_ui_data["[Ungrouped]"] = ungrouped_bones
-            
+            groups_ui_data[UNGROUPED_KEY] = ungrouped_bones
+
+        self._ui_cache_key = key
+        self._ui_cache = groups_ui_data
         return groups_ui_data
 
 
-group_controller_instance = GroupController()
\ No newline at end of file
+group_controller_instance = GroupController()
@@ -0,0 +1,177 @@
+# ohCHA_RigManager/01/src/controllers/group_rules.py
+# Description: [v1.0] Rule-Based Bone Grouping.
+#              - Rules: name_regex / subtree / scene_layer / region (AABB on world_pos).
+#              - Evaluated in bulk over get_skin_bone_data() rows, cached until the bone list changes.
+#              - Presets: data/group_rules/<name>.json (re-applicable across characters).
+#
+# Rule examples:
+#   {"group": "Face",   "type": "name_regex",  "pattern": "^Face_", "ignore_case": true}
+#   {"group": "L_Arm",  "type": "subtree",     "root": "Bip001 L UpperArm", "include_root": true, "depth": -1}
+#   {"group": "Props",  "type": "scene_layer", "layer": "Props"}
+#   {"group": "Left",   "type": "region",      "min": [0, null, null], "max": [null, null, null]}
+
+import os
+import re
+import json
+import collections
+from pymxs import runtime as rt
+
+try:
+    from utils.paths import get_project_root
+except ImportError:
+    get_project_root = lambda: ""
+
+RULE_TYPES = ("name_regex", "subtree", "scene_layer", "region")
+PRESET_VERSION = "1.0"
+
+
+class _BoneContext:
+    """Per bone-list lookups shared by every rule (built once per bone signature)."""
+
+    def __init__(self, bones: list[dict]):
+        self.ids = [b['id'] for b in bones]
+        self.names = [b['name'] for b in bones]
+        self.layers = [b.get('layer_name', "") for b in bones]
+        self.positions = [b.get('world_pos') or (0.0, 0.0, 0.0) for b in bones]
+        self.by_name = {b['name']: b for b in bones}
+
+        self.children = collections.defaultdict(list)
+        for b in bones:
+            self.children[b.get('parent_handle', "0")].append(b)
+
+
+class GroupRuleEngine:
+    def __init__(self):
+        self._bone_sig = None
+        self._ctx = None
+        self._results = {}
+
+    @staticmethod
+    def _signature(bones: list[dict]) -> int:
+        return hash(tuple(
+            (b['id'], b['name'], b.get('parent_handle'), b.get('layer_name'), tuple(b.get('world_pos') or ()))
+            for b in bones))
+
+    def evaluate(self, rules: list[dict], bones: list[dict]) -> dict:
+        """
+        Returns {group: [bone_id, ...]} in rule order. Rules are tried in order and a bone is
+        claimed by the first rule that matches it, so specific rules go before generic ones.
+        """
+        sig = self._signature(bones)
+        if sig != self._bone_sig:
+            self._bone_sig = sig
+            self._ctx = _BoneContext(bones)
+            self._results = {}
+
+        key = json.dumps(rules, sort_keys=True)
+        cached = self._results.get(key)
+        if cached is not None: return cached
+
+        claimed = {}
+        result = {}
+        for rule in rules:
+            group = rule.get("group")
+            if not group: continue
+            bucket = result.setdefault(group, [])
+            for bone_id in self._match(rule, self._ctx):
+                if bone_id in claimed: continue
+                claimed[bone_id] = group
+                bucket.append(bone_id)
+
+        result = {g: sorted(ids) for g, ids in result.items()}
+        self._results[key] = result
+        return result
+
+    def _match(self, rule: dict, ctx: _BoneContext) -> list[int]:
+        rtype = rule.get("type")
+        try:
+            if rtype == "name_regex":
+                flags = re.IGNORECASE if rule.get("ignore_case", True) else 0
+                pat = re.compile(rule.get("pattern", ""), flags)
+                return [i for i, n in zip(ctx.ids, ctx.names) if pat.search(n)]
+
+            if rtype == "subtree":
+                root = ctx.by_name.get(rule.get("root", ""))
+                if not root: return []
+                max_depth = rule.get("depth", -1)
+                found = [root['id']] if rule.get("include_root", True) else []
+                frontier, depth = [root], 0
+                while frontier and (max_depth < 0 or depth < max_depth):
+                    frontier = [c for b in frontier for c in ctx.children.get(b['handle'], ())]
+                    found.extend(c['id'] for c in frontier)
+                    depth += 1
+                return found
+
+            if rtype == "scene_layer":
+                target = rule.get("layer", "")
+                return [i for i, l in zip(ctx.ids, ctx.layers) if l == target]
+
+            if rtype == "region":
+                lo = rule.get("min") or [None, None, None]
+                hi = rule.get("max") or [None, None, None]
+                inside = lambda p: all((lo[a] is None or p[a] >= lo[a]) and (hi[a] is None or p[a] <= hi[a])
+                                       for a in range(3))
+                return [i for i, p in zip(ctx.ids, ctx.positions) if inside(p)]
+        except re.error as e:
+            rt.print(f"⚠️ [GroupRules] Bad pattern in '{rule.get('group')}': {e}")
+            return []
+
+        rt.print(f"⚠️ [GroupRules] Unknown rule type: {rtype}")
+        return []
+
+    def apply(self, rules: list[dict], bones: list[dict], group_controller) -> int:
+        """Evaluates 'rules' and batch-assigns the result (missing groups are created)."""
+        assignments = self.evaluate(rules, bones)
+        group_controller.assign_bones_batch(assignments, create_missing=True)
+        return sum(len(ids) for ids in assignments.values())
+
+    @staticmethod
+    def rules_from_groups(groups_data: dict, bones: list[dict]) -> list[dict]:
+        """Captures current groups as exact-name regex rules (portable to rigs with the same naming)."""
+        id_to_name = {b['id']: b['name'] for b in bones}
+        rules = []
+        for group, ids in groups_data.get("groups", {}).items():
+            names = sorted(id_to_name[i] for i in ids if i in id_to_name)
+            if not names: continue
+            pattern = "^(?:" + "|".join(re.escape(n) for n in names) + ")$"
+            rules.append({"group": group, "type": "name_regex", "pattern": pattern, "ignore_case": False})
+        return rules
+
+    # --- Presets ---
+    @staticmethod
+    def _preset_dir() -> str | None:
+        root = get_project_root()
+        if not root: return None
+        path = os.path.join(root, "data", "group_rules")
+        os.makedirs(path, exist_ok=True)
+        return path
+
+    def list_presets(self) -> list[str]:
+        d = self._preset_dir()
+        if not d: return []
+        return sorted(os.path.splitext(f)[0] for f in os.listdir(d) if f.lower().endswith(".json"))
+
+    def save_preset(self, name: str, rules: list[dict]) -> bool:
+        d = self._preset_dir()
+        if not d or not name: return False
+        safe = re.sub(r'[\\/*?:"<>|]', "_", name)
+        try:
+            with open(os.path.join(d, f"{safe}.json"), 'w', encoding='utf-8') as f:
+                json.dump({"version": PRESET_VERSION, "rules": rules}, f, indent=4)
+            return True
+        except Exception as e:
+            rt.print(f"❌ [GroupRules] Save Error: {e}")
+            return False
+
+    def load_preset(self, name: str) -> list[dict]:
+        d = self._preset_dir()
+        if not d: return []
+        try:
+            with open(os.path.join(d, f"{name}.json"), 'r', encoding='utf-8') as f:
+                return json.load(f).get("rules", [])
+        except Exception as e:
+            rt.print(f"❌ [GroupRules] Load Error: {e}")
+            return []
+
+
+group_rule_engine = GroupRuleEngine()
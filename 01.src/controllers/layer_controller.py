@@ -1,18 +1,121 @@
 # ohCHA_RigManager/01/src/controllers/layer_controller.py
-# Description: [v20.52] Layer Controller Update.
+# Description: [v20.55] Scene Catalog / Hierarchy Diff / Batch Presets.
+#              - PERF: load_layer_preset sends the whole preset (topologically ordered name / parent arrays) to
+#                ohCHA_LayerLogic.applyLayerPreset: one call, one undo record, redraw off.
+#              - NEW: read_layer_preset / diff_layer_preset (preview against the scene before applying).
+#              - NEW: diff_layer_hierarchy(): added / removed / renamed / reparented between two snapshots
+#                (the Layer tool patches its tree with it instead of rebuilding).
+#              - PERF: get_scene_objects reads name / handle / type / layer / hidden of every node in ONE
+#                MaxScript call (ohCHA_LayerLogic.getSceneCatalog, columnar arrays); sorting / filtering run
+#                in Python on those rows.
+#              - REMOVED: SceneCatalog node-event tracking (no caller kept a catalog alive, so it never paid off).
 #              - UPDATED: get_scene_objects retrieves Layer Name and Type.
 
 import pymxs
 import json
 from pymxs import runtime as rt
 
+try:
+    from utils.mxs_loader import mxs_loader
+except ImportError:
+    mxs_loader = None
+
+
+def _ensure_layer_logic():
+    if mxs_loader is None: return hasattr(rt, "ohCHA_LayerLogic")
+    return mxs_loader.require("ohcha_layer_logic")
+
+
+def _catalog_rows(cols) -> list[dict]:
+    names, handles, types, layers, hidden = (list(c) for c in cols)
+    return [{"name": str(n), "handle": int(h), "type": str(t), "layer": str(l), "hidden": bool(hd)}
+            for n, h, t, l, hd in zip(names, handles, types, layers, hidden)]
+
+
+def read_scene_catalog() -> list[dict]:
+    """{"name", "handle", "type", "layer", "hidden"} of every scene node (scene order), one MaxScript call."""
+    if not _ensure_layer_logic(): return []
+    try:
+        return _catalog_rows(rt.ohCHA_LayerLogic.getSceneCatalog())
+    except Exception as e:
+        rt.print(f"❌ [LayerController] Scene catalog read failed: {e}")
+        return []
+
+
+def hierarchy_snapshot(layers) -> dict:
+    """get_layer_hierarchy() rows -> {name: parent name or None} (LayerManager order)."""
+    return {l["name"]: l.get("parent") or None for l in layers}
+
+
+def diff_layer_hierarchy(old: dict, new: dict) -> dict:
+    """
+    Minimal changes turning snapshot 'old' into 'new' ({name: parent}).
+    Returns {"renamed": {old: new}, "removed": [...], "added": [...], "reparented": [...]}
+    ('added' / 'reparented' are in 'new' order, so parents come before their children).
+    A removed and an added layer are treated as a rename when they have the same parent and the same
+    child layers and that pairing is unambiguous.
+    """
+    removed = [n for n in old if n not in new]
+    added = [n for n in new if n not in old]
+
+    renamed = {}
+    if removed and added:
+        def children(snap):
+            kids = {}
+            for c, p in snap.items(): kids.setdefault(p, set()).add(c)
+            return kids
+        old_kids, new_kids = children(old), children(new)
+        old_keys, new_keys = {}, {}
+        for n in removed: old_keys.setdefault((old[n], frozenset(old_kids.get(n, ()))), []).append(n)
+        for n in added: new_keys.setdefault((new[n], frozenset(new_kids.get(n, ()))), []).append(n)
+        for k, olds in old_keys.items():
+            news = new_keys.get(k)
+            if len(olds) == 1 and news and len(news) == 1: renamed[olds[0]] = news[0]
+        if renamed:
+            gone = set(renamed.values())
+            removed = [n for n in removed if n not in renamed]
+            added = [n for n in added if n not in gone]
+
+    was = {n: o for o, n in renamed.items()}
+
+    def old_parent(name):
+        p = old.get(was.get(name, name))
+        return renamed.get(p, p)
+
+    reparented = [n for n in new if n not in added and old_parent(n) != new[n]]
+    return {"renamed": renamed, "removed": removed, "added": added, "reparented": reparented}
+
+
+def order_layer_preset(layers) -> list[dict]:
+    """
+    Preset rows (without layer "0") in topological order, parents first.
+    Parents outside the preset are kept as given (applyLayerPreset skips missing ones); cycles are cut.
+    """
+    by_name = {}
+    for l in layers:
+        if l.get("name") and l["name"] != "0": by_name[l["name"]] = l.get("parent") or None
+
+    ordered, state = [], {}  # state: 1 = visiting, 2 = done
+    for root in by_name:
+        stack = [root]
+        while stack:
+            name = stack[-1]
+            if state.get(name) == 2: stack.pop(); continue
+            parent = by_name[name]
+            if state.get(name) is None:
+                state[name] = 1
+                if parent in by_name and state.get(parent) != 2:
+                    if state.get(parent) == 1: by_name[name] = None  # cycle
+                    else: stack.append(parent); continue
+            state[name] = 2
+            ordered.append({"name": name, "parent": by_name[name]})
+            stack.pop()
+    return ordered
 
-class LayerController:
-    def __init__(self):
-        pass
 
+class LayerController:
     def _ensure_logic(self):
-        return hasattr(rt, "ohCHA_LayerLogic")
+        return _ensure_layer_logic()
 
     def get_layer_hierarchy(self):
         if not self._ensure_logic(): return []
@@ -46,39 +149,22 @@ class LayerController:
         p_name = parent_name if parent_name else ""
         return rt.ohCHA_LayerLogic.setLayerParent(child_name, p_name)
 
-    # ⭐️ Updated to include Layer Name and Type
-    def get_scene_objects(self):
-        objs = []
-        for o in rt.objects:
-            if rt.isValidNode(o) and not o.isHidden:
-                # Identify Type
-                o_type = "Object"
-                if rt.isKindOf(o, rt.Biped_Object):
-                    o_type = "Biped"
-                elif rt.isKindOf(o, rt.BoneGeometry):
-                    o_type = "Bone"
-                elif rt.isKindOf(o, rt.Helper):
-                    o_type = "Helper"
-                elif rt.isKindOf(o, rt.GeometryClass):
-                    o_type = "Geometry"
-                elif rt.isKindOf(o, rt.Shape):
-                    o_type = "Shape"
-                elif rt.isKindOf(o, rt.Light):
-                    o_type = "Light"
-                elif rt.isKindOf(o, rt.Camera):
-                    o_type = "Camera"
-
-                # Get Layer
-                layer_name = o.layer.name
-
-                objs.append({
-                    "name": o.name,
-                    "handle": o.handle,
-                    "layer": layer_name,
-                    "type": o_type
-                })
-
-        objs.sort(key=lambda x: x["name"])
+    # ⭐️ Updated to include Layer Name and Type (one bulk read of the scene catalog)
+    def get_scene_objects(self, include_hidden=False, types=None, layer=None, text="", sort_key="name"):
+        """
+        Rows {"name", "handle", "layer", "type", "hidden"} sorted by 'sort_key'.
+        types: iterable of type names ("Bone", "Geometry", ...), layer: exact layer name,
+        text: case-insensitive substring of the node name.
+        """
+        rows = read_scene_catalog()
+        type_set = set(types) if types else None
+        needle = text.lower() if text else ""
+        objs = [r for r in rows
+                if (include_hidden or not r["hidden"])
+                and (type_set is None or r["type"] in type_set)
+                and (layer is None or r["layer"] == layer)
+                and (not needle or needle in r["name"].lower())]
+        objs.sort(key=lambda x: (x[sort_key], x["name"]))
         return objs
 
     def add_objects_to_layer(self, layer_name, obj_handles):
@@ -92,26 +178,61 @@ class LayerController:
     def save_layer_preset(self, file_path):
         if not file_path: return False
         try:
-            data = self.get_layer_hierarchy()
-            save_data = [l for l in data if l['name'] != "0"]
+            # Exported parents-first, so the preset applies in file order.
+            save_data = order_layer_preset(self.get_layer_hierarchy())
             with open(file_path, 'w', encoding='utf-8') as f:
                 json.dump(save_data, f, indent=4)
             return True
         except Exception:
             return False
 
-    def load_layer_preset(self, file_path):
-        if not file_path: return False
+    def read_layer_preset(self, file_path):
+        """Preset rows [{"name", "parent"}] in topological order, or None when the file can't be read."""
+        if not file_path: return None
         try:
             with open(file_path, 'r', encoding='utf-8') as f:
                 layers = json.load(f)
-            for l in layers: self.create_layer(l['name'])
-            for l in layers:
-                if l.get('parent') and l['parent'] != "0":
-                    self.set_layer_parent(l['name'], l['parent'])
-            return True
-        except Exception:
+            return order_layer_preset(l for l in layers if isinstance(l, dict))
+        except Exception as e:
+            rt.print(f"❌ [LayerController] Preset read failed: {e}")
+            return None
+
+    def diff_layer_preset(self, layers) -> dict:
+        """
+        What apply_layer_preset(layers) would change: {"added", "reparented", "extra", "unchanged"}.
+        'extra' = scene layers the preset doesn't mention (left untouched).
+        """
+        scene = hierarchy_snapshot(self.get_layer_hierarchy())
+        known = set(scene) | {l["name"] for l in layers}
+        added, reparented, unchanged = [], [], 0
+        for l in layers:
+            name, parent = l["name"], l["parent"]
+            if name not in scene: added.append(name)
+            elif parent and parent != "0" and parent in known and scene[name] != parent: reparented.append(name)
+            else: unchanged += 1
+        preset = {l["name"] for l in layers}
+        extra = [n for n in scene if n != "0" and n not in preset]
+        return {"added": added, "reparented": reparented, "extra": extra, "unchanged": unchanged}
+
+    def apply_layer_preset(self, layers) -> bool:
+        if not layers or not self._ensure_logic(): return False
+        names = [l["name"] for l in layers]
+        # "0" as parent was never applied by the per-layer loader: keep it that way.
+        parents = [l["parent"] if l["parent"] and l["parent"] != "0" else "" for l in layers]
+        try:
+            created, reparented, failed = rt.ohCHA_LayerLogic.applyLayerPreset(rt.Array(*names), rt.Array(*parents))
+        except Exception as e:
+            rt.print(f"❌ [LayerController] Preset apply failed: {e}")
             return False
+        failed = [str(n) for n in failed]
+        rt.print(f"✅ [LayerController] Preset: {int(created)} created, {int(reparented)} reparented"
+                 + (f", failed: {', '.join(failed)}" if failed else "."))
+        return not failed
+
+    def load_layer_preset(self, file_path):
+        layers = self.read_layer_preset(file_path)
+        if layers is None: return False
+        return self.apply_layer_preset(layers)
 
 
 layer_controller_instance = LayerController()
\ No newline at end of file
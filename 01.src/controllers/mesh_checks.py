@@ -0,0 +1,287 @@
+# ohCHA_RigManager/01/src/controllers/mesh_checks.py
+# Description: [v1.1] Pluggable Edit Mesh Check Registry.
+#              - ADDED: suite_signature() (invalidates the persistent result cache, see mesh_result_store).
+#              - Every check declares a cost class:
+#                  COST_CHEAP     : evaluated column-wise on the bulk scene scan (runs on every refresh).
+#                  COST_EXPENSIVE : evaluated on one mesh's vertex / face arrays (runs on demand).
+#              - Geometry arrays are pulled ONCE per mesh (ohCHA_MeshLogic.getMeshArrays) and shared by all
+#                expensive checks. NumPy is used when available, with a pure-Python fallback.
+#              - Duplicate / seam checks use a quantized spatial hash (half-cell offset grids).
+
+import itertools
+from collections import namedtuple
+from pymxs import runtime as rt
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+try:
+    from utils.mxs_loader import mxs_loader
+except ImportError:
+    mxs_loader = None
+
+# Bump when an expensive check's logic changes: cached results of the old suite are discarded.
+CHECK_SUITE_VERSION = 1
+
+COST_CHEAP = "cheap"
+COST_EXPENSIVE = "expensive"
+
+TOLERANCE = 1e-5        # scale / pivot
+AREA_EPSILON = 1e-10    # zero-area face
+WELD_THRESHOLD = 1e-4   # coincident vertices (scene units)
+
+# Point3 대용 (DetailActionWidget 은 .x/.y/.z 로 표시)
+Vec3 = namedtuple("Vec3", "x y z")
+
+
+class MeshCheck:
+    __slots__ = ("id", "cost", "fn")
+
+    def __init__(self, check_id: str, cost: str, fn):
+        self.id = check_id
+        self.cost = cost
+        self.fn = fn
+
+
+class MeshCheckRegistry:
+    """
+    check id -> MeshCheck. UI metadata (label / info / fix keys, order) stays in config.EDIT_MESH_CHECKS.
+    COST_CHEAP fn(scan: dict) -> [result per mesh]; COST_EXPENSIVE fn(geo: MeshArrays) -> result.
+    result = {"has_issue": bool, "value": ...} (same shape as edit_mesh_logic.run_all_checks).
+    """
+
+    def __init__(self):
+        self._checks = {}
+
+    def register(self, check_id: str, cost: str = COST_CHEAP):
+        if cost not in (COST_CHEAP, COST_EXPENSIVE): raise ValueError(f"Unknown cost class: {cost}")
+
+        def deco(fn):
+            self._checks[check_id] = MeshCheck(check_id, cost, fn)
+            return fn
+        return deco
+
+    def get(self, check_id: str):
+        return self._checks.get(check_id)
+
+    def checks(self, cost: str = None) -> list:
+        return [c for c in self._checks.values() if cost is None or c.cost == cost]
+
+    def ids(self, cost: str = None) -> list[str]:
+        return [c.id for c in self.checks(cost)]
+
+    def run_cheap(self, scan: dict) -> list[dict]:
+        """Returns one {check id: result} dict per scanned mesh."""
+        count = len(scan["nodes"])
+        per_mesh = [{} for _ in range(count)]
+        for c in self.checks(COST_CHEAP):
+            for res, r in zip(per_mesh, c.fn(scan)):
+                res[c.id] = r
+        return per_mesh
+
+    def run_expensive(self, node, check_ids=None) -> dict:
+        """Pulls the node's geometry once and runs every (or the given) expensive check on it."""
+        checks = [c for c in self.checks(COST_EXPENSIVE) if check_ids is None or c.id in check_ids]
+        if not checks: return {}
+        geo = MeshArrays.from_node(node)
+        if geo is None: return {}
+        results = {}
+        for c in checks:
+            try:
+                results[c.id] = c.fn(geo)
+            except Exception as e:
+                rt.print(f"❌ [MeshChecks] '{c.id}' failed on {geo.name}: {e}")
+        return results
+
+
+mesh_check_registry = MeshCheckRegistry()
+register = mesh_check_registry.register
+
+
+def suite_signature() -> str:
+    ids = ",".join(sorted(mesh_check_registry.ids(COST_EXPENSIVE)))
+    return f"{CHECK_SUITE_VERSION}|{ids}|{AREA_EPSILON}|{WELD_THRESHOLD}"
+
+
+# ----------------------------------------------------------------------------
+# Geometry Arrays
+# ----------------------------------------------------------------------------
+
+class MeshArrays:
+    """
+    One mesh snapshot (world space, triangulated).
+    positions: (n, 3) float array (NumPy) or list of (x, y, z); faces: (m, 3) 0-based vertex indices.
+    Derived data (edge counts, border vertices) is computed once and shared by the checks.
+    """
+
+    def __init__(self, name: str, flat_positions, flat_faces):
+        self.name = name
+        if np is not None:
+            self.positions = np.asarray(flat_positions, dtype=np.float64).reshape(-1, 3)
+            self.faces = np.asarray(flat_faces, dtype=np.int64).reshape(-1, 3) - 1
+        else:
+            p, f = list(flat_positions), [int(i) - 1 for i in flat_faces]
+            self.positions = [tuple(p[i:i + 3]) for i in range(0, len(p), 3)]
+            self.faces = [tuple(f[i:i + 3]) for i in range(0, len(f), 3)]
+        self._edge_counts = None
+
+    @property
+    def num_verts(self) -> int:
+        return len(self.positions)
+
+    @property
+    def num_faces(self) -> int:
+        return len(self.faces)
+
+    @classmethod
+    def from_node(cls, node):
+        if mxs_loader is not None and not mxs_loader.require("ohcha_mesh_logic"): return None
+        try:
+            flat_pos, flat_faces = rt.ohCHA_MeshLogic.getMeshArrays(node)
+        except Exception as e:
+            rt.print(f"❌ [MeshChecks] Geometry read failed: {e}")
+            return None
+        return cls(str(node.name), list(flat_pos), list(flat_faces))
+
+    def edge_counts(self):
+        """(edge keys a*n+b with a<b, face count per edge). Hidden triangle diagonals count like any edge."""
+        if self._edge_counts is not None: return self._edge_counts
+        n = self.num_verts
+        if np is not None:
+            f = self.faces
+            e = np.concatenate([f[:, [0, 1]], f[:, [1, 2]], f[:, [2, 0]]])
+            e = e[e[:, 0] != e[:, 1]]
+            e.sort(axis=1)
+            self._edge_counts = np.unique(e[:, 0] * n + e[:, 1], return_counts=True)
+        else:
+            counts = {}
+            for a, b, c in self.faces:
+                for u, v in ((a, b), (b, c), (c, a)):
+                    if u == v: continue
+                    k = min(u, v) * n + max(u, v)
+                    counts[k] = counts.get(k, 0) + 1
+            self._edge_counts = (list(counts), list(counts.values()))
+        return self._edge_counts
+
+    def border_vertices(self):
+        """Vertices on edges used by exactly one face (open borders)."""
+        n = self.num_verts
+        keys, counts = self.edge_counts()
+        if np is not None:
+            k = keys[counts == 1]
+            return np.unique(np.concatenate([k // n, k % n]))
+        verts = set()
+        for k, c in zip(keys, counts):
+            if c == 1: verts.update((k // n, k % n))
+        return sorted(verts)
+
+
+def _coincident(positions, indices, threshold: float) -> int:
+    """
+    Number of vertices (among 'indices') that share a position with another one.
+    Spatial hash: positions are snapped to a grid of cell 'threshold', once per combination of 0 / half-cell
+    offsets on each axis (8 grids), so any pair closer than threshold / 2 per axis shares a cell in one of them.
+    """
+    if len(indices) < 2: return 0
+    offsets = list(itertools.product((0.0, 0.5), repeat=3))
+    if np is not None:
+        pts = positions[indices]
+        dup = np.zeros(len(pts), dtype=bool)
+        for offset in offsets:
+            cells = np.floor(pts / threshold + np.asarray(offset)).astype(np.int64)
+            _, inverse, counts = np.unique(cells, axis=0, return_inverse=True, return_counts=True)
+            dup |= counts[inverse.reshape(-1)] > 1
+        return int(dup.sum())
+
+    dup = set()
+    for ox, oy, oz in offsets:
+        cells = {}
+        for i in indices:
+            x, y, z = positions[i]
+            key = (int((x / threshold + ox) // 1), int((y / threshold + oy) // 1), int((z / threshold + oz) // 1))
+            cells.setdefault(key, []).append(i)
+        for members in cells.values():
+            if len(members) > 1: dup.update(members)
+    return len(dup)
+
+
+# ----------------------------------------------------------------------------
+# Cheap Checks (bulk scan columns)
+# ----------------------------------------------------------------------------
+
+@register("non_uniform_scale", COST_CHEAP)
+def _check_scale(scan):
+    return [{"has_issue": abs(x - 1.0) > TOLERANCE or abs(y - 1.0) > TOLERANCE or abs(z - 1.0) > TOLERANCE,
+             "value": Vec3(x, y, z)}
+            for x, y, z in zip(scan["sx"], scan["sy"], scan["sz"])]
+
+
+@register("existing_skin", COST_CHEAP)
+def _check_skin(scan):
+    return [{"has_issue": bool(s), "value": s or None} for s in scan["skins"]]
+
+
+@register("pivot_not_at_origin", COST_CHEAP)
+def _check_pivot(scan):
+    tol_sq = TOLERANCE * TOLERANCE
+    return [{"has_issue": x * x + y * y + z * z > tol_sq, "value": Vec3(x, y, z)}
+            for x, y, z in zip(scan["px"], scan["py"], scan["pz"])]
+
+
+# ----------------------------------------------------------------------------
+# Expensive Checks (per-mesh geometry)
+# ----------------------------------------------------------------------------
+
+def _count_result(count: int):
+    return {"has_issue": count > 0, "value": count if count > 0 else None}
+
+
+@register("degenerate_faces", COST_EXPENSIVE)
+def _check_degenerate_faces(geo: MeshArrays):
+    """Zero-area triangles, including faces that repeat a vertex index."""
+    if geo.num_faces == 0: return _count_result(0)
+    if np is not None:
+        v = geo.positions[geo.faces]
+        area2 = np.linalg.norm(np.cross(v[:, 1] - v[:, 0], v[:, 2] - v[:, 0]), axis=1)
+        return _count_result(int((area2 <= 2.0 * AREA_EPSILON).sum()))
+
+    count, p = 0, geo.positions
+    for a, b, c in geo.faces:
+        ax, ay, az = p[a]
+        ux, uy, uz = p[b][0] - ax, p[b][1] - ay, p[b][2] - az
+        vx, vy, vz = p[c][0] - ax, p[c][1] - ay, p[c][2] - az
+        cx, cy, cz = uy * vz - uz * vy, uz * vx - ux * vz, ux * vy - uy * vx
+        if (cx * cx + cy * cy + cz * cz) ** 0.5 <= 2.0 * AREA_EPSILON: count += 1
+    return _count_result(count)
+
+
+@register("isolated_vertices", COST_EXPENSIVE)
+def _check_isolated_vertices(geo: MeshArrays):
+    if geo.num_verts == 0: return _count_result(0)
+    if np is not None:
+        used = np.bincount(geo.faces.ravel(), minlength=geo.num_verts) if geo.num_faces else np.zeros(geo.num_verts)
+        return _count_result(int((used == 0).sum()))
+    used = {i for f in geo.faces for i in f}
+    return _count_result(geo.num_verts - len(used))
+
+
+@register("non_manifold_edges", COST_EXPENSIVE)
+def _check_non_manifold_edges(geo: MeshArrays):
+    """Edges shared by more than two faces."""
+    _, counts = geo.edge_counts()
+    if np is not None: return _count_result(int((counts > 2).sum()))
+    return _count_result(sum(1 for c in counts if c > 2))
+
+
+@register("duplicate_vertices", COST_EXPENSIVE)
+def _check_duplicate_vertices(geo: MeshArrays):
+    idx = np.arange(geo.num_verts) if np is not None else range(geo.num_verts)
+    return _count_result(_coincident(geo.positions, idx, WELD_THRESHOLD))
+
+
+@register("unwelded_seams", COST_EXPENSIVE)
+def _check_unwelded_seams(geo: MeshArrays):
+    """Open-border vertices lying on top of another border vertex (split but visually closed seams)."""
+    return _count_result(_coincident(geo.positions, geo.border_vertices(), WELD_THRESHOLD))
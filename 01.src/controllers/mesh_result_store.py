@@ -0,0 +1,132 @@
+# ohCHA_RigManager/01/src/controllers/mesh_result_store.py
+# Description: [v1.0] Persistent Geometry-Check Result Cache.
+#              - data/mesh_check_cache.json: fingerprint -> expensive check results.
+#              - Fingerprint = vertex / face count + world bbox + sampled vertex & face hash
+#                (ohCHA_MeshLogic.getGeometryFingerprints, one MaxScript call for many nodes).
+#              - The whole file is dropped when the check suite signature changes (version, thresholds, ids).
+#              - Loaded lazily, written only when new results were added (flush()).
+#              - FIXED: run(flush=False) for chunked runs; the caller flushes once when the whole run ends.
+
+import os
+import json
+from pymxs import runtime as rt
+
+try:
+    from utils.paths import get_project_root
+    from utils.mxs_loader import mxs_loader
+    from controllers.mesh_checks import mesh_check_registry, suite_signature
+except ImportError as e:
+    rt.print(f"❌ [MeshResultStore] Import Error: {e}")
+    raise
+
+CACHE_FILE = "mesh_check_cache.json"
+MAX_ENTRIES = 20000
+FINGERPRINT_SAMPLES = 64
+
+
+def fingerprint_nodes(nodes) -> list:
+    """Fingerprint string per node (None for invalid / unreadable nodes), in one MaxScript call."""
+    nodes = list(nodes)
+    if not nodes or not mxs_loader.require("ohcha_mesh_logic"): return [None] * len(nodes)
+    try:
+        cols = [list(c) for c in rt.ohCHA_MeshLogic.getGeometryFingerprints(rt.Array(*nodes), FINGERPRINT_SAMPLES)]
+    except Exception as e:
+        rt.print(f"❌ [MeshResultStore] Fingerprint Error: {e}")
+        return [None] * len(nodes)
+
+    prints = []
+    for nv, nf, x0, y0, z0, x1, y1, z1, h in zip(*cols):
+        if nv < 0: prints.append(None); continue
+        prints.append(f"{nv}:{nf}:{x0:.4f},{y0:.4f},{z0:.4f}:{x1:.4f},{y1:.4f},{z1:.4f}:{h}")
+    return prints
+
+
+class MeshResultStore:
+    def __init__(self, filename: str = CACHE_FILE):
+        self.filename = filename
+        self._entries = None  # fingerprint -> results (insertion order = age)
+        self._suite = None
+        self._dirty = False
+
+    def _path(self) -> str | None:
+        root = get_project_root()
+        if not root: return None
+        data_dir = os.path.join(root, "data")
+        os.makedirs(data_dir, exist_ok=True)
+        return os.path.join(data_dir, self.filename)
+
+    def _ensure_loaded(self):
+        suite = suite_signature()
+        if self._entries is not None and self._suite == suite: return
+        self._suite = suite
+        self._entries = {}
+        path = self._path()
+        if not path or not os.path.exists(path): return
+        try:
+            with open(path, 'r', encoding='utf-8') as f:
+                data = json.load(f)
+            if data.get("suite") == suite:
+                self._entries = data.get("entries", {})
+        except Exception as e:
+            rt.print(f"⚠️ [MeshResultStore] Cache ignored ({e})")
+
+    def get(self, fingerprint: str):
+        if not fingerprint: return None
+        self._ensure_loaded()
+        return self._entries.get(fingerprint)
+
+    def put(self, fingerprint: str, results: dict):
+        if not fingerprint or not results: return
+        self._ensure_loaded()
+        self._entries.pop(fingerprint, None)
+        self._entries[fingerprint] = results
+        while len(self._entries) > MAX_ENTRIES:
+            del self._entries[next(iter(self._entries))]
+        self._dirty = True
+
+    def flush(self) -> bool:
+        if not self._dirty: return True
+        path = self._path()
+        if not path: return False
+        try:
+            with open(path, 'w', encoding='utf-8') as f:
+                json.dump({"suite": self._suite, "entries": self._entries}, f)
+            self._dirty = False
+            return True
+        except Exception as e:
+            rt.print(f"❌ [MeshResultStore] Save Error: {e}")
+            return False
+
+    def clear(self):
+        self._entries = {}
+        self._dirty = True
+        self.flush()
+
+    # --- Check Runs ---
+    def run(self, nodes, force: bool = False, flush: bool = True):
+        """
+        Expensive checks for 'nodes' with cache reuse: one fingerprint call, checks only for misses.
+        Returns ({node handle: results}, hits, misses). Results are stored and flushed once
+        (flush=False leaves the write to the caller's flush()).
+        """
+        nodes = [n for n in nodes if n and rt.isValidNode(n)]
+        out, hits, misses = {}, 0, 0
+        for node, fp in zip(nodes, fingerprint_nodes(nodes)):
+            res = None if force else self.get(fp)
+            if res is not None:
+                hits += 1
+            else:
+                res = mesh_check_registry.run_expensive(node)
+                misses += 1
+                self.put(fp, res)
+            out[int(node.handle)] = res
+        if flush: self.flush()
+        return out, hits, misses
+
+    def lookup(self, node):
+        """Cached results for one node, or None (costs one fingerprint, no checks)."""
+        if not node or not rt.isValidNode(node): return None
+        return self.get(fingerprint_nodes([node])[0])
+
+
+mesh_result_store = MeshResultStore()
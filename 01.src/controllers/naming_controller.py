@@ -1,26 +1,142 @@
 # ohCHA_RigManager/01/src/controllers/naming_controller.py
+# Description: [v1.2] Batch Rename.
+#              - PERF: Lazy preview: set_params() only compiles; new_name(row) renders single rows on demand
+#                (virtualized table), compute_summary() does the one full pass (names, collisions, counts).
+#              - PERF: load_selection reads handle / name / parent of the whole selection in ONE MaxScript call.
+#              - PERF: Names come from a compiled template (naming_engine); token columns are cached between
+#                previews, so a parameter edit only recomputes what depends on it.
+#              - NEW: Collision check against a hashed index of scene names (flag, or auto-resolve).
 import pymxs
 from pymxs import runtime as rt
 
+try:
+    from controllers.naming_engine import (
+        CompiledTemplate, SceneNameIndex, TemplateError, template_from_params
+    )
+except ImportError as e:
+    rt.print(f"❌ [NamingController] Import Error: {e}")
+    raise
+try:
+    from utils.mxs_loader import mxs_loader
+except ImportError:
+    mxs_loader = None
+
+MAX_CACHED_COLUMNS = 64
+
+
+def _ensure_naming_logic():
+    if mxs_loader is None: return hasattr(rt, "ohCHA_NamingLogic")
+    return mxs_loader.require("ohcha_naming_logic")
+
 
 class NamingController:
     def __init__(self):
         self._current_objects = []  # List of dicts {handle, original_name, new_name}
+        self._originals = ()
+        self._parents = ()
+        self._columns = {}          # token column cache (see CompiledTemplate.render)
+        self._template = None
+        self._scene_index = None
+        self.collisions = []        # bool per object, from the last full pass
+        self.template_error = ""
+        self._params = {}
+        self._names = None          # full pass result (None = rows are rendered lazily)
+        self._row_names = {}        # lazily rendered rows
 
     def load_selection(self):
         """Loads currently selected objects in Max."""
         self._current_objects = []
-        for obj in rt.selection:
-            if rt.isValidNode(obj):
-                self._current_objects.append({
-                    "handle": obj.handle,
-                    "original_name": obj.name,
-                    "new_name": obj.name
-                })
+        rows = []
+        if _ensure_naming_logic():
+            try:
+                handles, names, parents = rt.ohCHA_NamingLogic.getSelectionInfo()
+                rows = list(zip((int(h) for h in handles), (str(n) for n in names), (str(p) for p in parents)))
+            except Exception as e:
+                rt.print(f"❌ [NamingController] Selection read failed: {e}")
         # Sort by name for UX
-        self._current_objects.sort(key=lambda x: x["original_name"])
+        rows.sort(key=lambda r: r[1])
+        self._current_objects = [{"handle": h, "original_name": n, "new_name": n} for h, n, _ in rows]
+        self._originals = tuple(r[1] for r in rows)
+        self._parents = tuple(r[2] for r in rows)
+        self._columns = {}
+        self._scene_index = None
+        self.collisions = [False] * len(rows)
+        self._names, self._row_names = None, {}
         return len(self._current_objects)
 
+    # --- Lazy Preview ---
+    def row_count(self) -> int:
+        return len(self._originals)
+
+    def original_name(self, row: int) -> str:
+        return self._originals[row]
+
+    def set_params(self, params):
+        """Compiles the template for 'params'; names are rendered on demand afterwards."""
+        self._params = dict(params)
+        self._names, self._row_names = None, {}
+        self.collisions = []
+        if len(self._columns) > MAX_CACHED_COLUMNS: self._columns = {}
+        try:
+            self._compile(self._params)
+            self.template_error = ""
+        except TemplateError as e:
+            # Half-typed template: keep the names unchanged until it compiles.
+            self.template_error = str(e)
+            self._template = None
+
+    def new_name(self, row: int) -> str:
+        if self._names is not None: return self._names[row]
+        name = self._row_names.get(row)
+        if name is None:
+            if self._template is None or self.template_error: name = self._originals[row]
+            else: name = self._template.render_row(row, self._originals, self._parents, self._params, self._columns)
+            self._row_names[row] = name
+        return name
+
+    def collides(self, row: int):
+        """True / False after compute_summary(), None before."""
+        return self.collisions[row] if row < len(self.collisions) else None
+
+    def has_summary(self) -> bool:
+        return self._names is not None
+
+    def compute_summary(self) -> dict:
+        """Full pass: every name (+ duplicate resolving), collisions and counts."""
+        originals = self._originals
+        if self.template_error or self._template is None:
+            new_names = list(originals)
+        else:
+            new_names = self._template.render(originals, self._parents, self._params, self._columns)
+        index = self.scene_index()
+        if self._params.get("resolve", False): new_names = index.resolve(originals, new_names)
+        self.collisions = index.collisions(originals, new_names)
+        self._names, self._row_names = new_names, {}
+
+        for item, name in zip(self._current_objects, new_names): item["new_name"] = name
+        changed = sum(1 for a, b in zip(originals, new_names) if a != b)
+        return {"changed": changed, "unchanged": len(originals) - changed, "collisions": sum(self.collisions)}
+
+    def scene_index(self, rebuild=False) -> SceneNameIndex:
+        """Scene names, read in one call and kept until the next load / rename."""
+        if self._scene_index is None or rebuild:
+            names = []
+            if _ensure_naming_logic():
+                try:
+                    names = [str(n) for n in rt.ohCHA_NamingLogic.getSceneNames()]
+                except Exception as e:
+                    rt.print(f"❌ [NamingController] Scene name read failed: {e}")
+            self._scene_index = SceneNameIndex(names)
+        return self._scene_index
+
+    def _compile(self, params):
+        template = params.get("template") or template_from_params(params)
+        regex = params.get("regex", "")
+        t = self._template
+        if t is None or t.template != template or (t.regex is not None and t.regex.pattern != (regex or "(.*)")):
+            self._template = CompiledTemplate(template, regex)
+        return self._template
+
     def get_preview_data(self, params):
         """
         Calculates new names based on parameters.
@@ -28,70 +144,39 @@ class NamingController:
             prefix: str, suffix: str,
             base_name: str, use_base: bool,
             rem_first: int, rem_last: int,
-            use_num: bool, start: int, step: int, padding: int
+            use_num: bool, start: int, step: int, padding: int,
+            template: str (overrides the rules above), regex: str (for {0}~{9}),
+            resolve: bool (auto-rename duplicates)
         }
+        Sets self.collisions (per row) and self.template_error.
         """
         if not self._current_objects: return []
+        self.set_params(params)
+        self.compute_summary()
+        return list(zip(self._originals, self._names))
 
-        prefix = params.get("prefix", "")
-        suffix = params.get("suffix", "")
-        base_name = params.get("base_name", "")
-        use_base = params.get("use_base", False)
-        rem_first = params.get("rem_first", 0)
-        rem_last = params.get("rem_last", 0)
-        use_num = params.get("use_num", False)
-        start_num = params.get("start", 1)
-        step_num = params.get("step", 1)
-        padding = params.get("padding", 3)
-
-        result_list = []
-        current_num = start_num
-
-        for item in self._current_objects:
-            orig = item["original_name"]
-
-            # 1. Base Name Logic
-            core_name = base_name if use_base and base_name else orig
-
-            # 2. Remove Characters (only if not using base name)
-            if not use_base:
-                if rem_first > 0:
-                    core_name = core_name[rem_first:]
-                if rem_last > 0 and len(core_name) > rem_last:
-                    core_name = core_name[:-rem_last]
-
-            # 3. Numbering
-            num_str = ""
-            if use_num:
-                # Python f-string padding: 0{padding}d
-                fmt = f"{{:0{padding}d}}"
-                num_str = fmt.format(current_num)
-                current_num += step_num
-
-            # 4. Combine
-            final_name = f"{prefix}{core_name}{suffix}{num_str}"
-
-            item["new_name"] = final_name
-            result_list.append((orig, final_name))
-
-        return result_list
-
-    def apply_rename(self):
-        """Calls MaxScript to apply changes."""
+    def apply_rename(self, params=None):
+        """
+        Calls MaxScript to apply changes.
+        With params the preview is recomputed against a fresh scene index first; returns False while
+        names still collide (see self.collisions).
+        """
         if not self._current_objects: return False
+        if params is not None:
+            self._scene_index = None
+            self.get_preview_data(params)
+            if any(self.collisions): return False
 
-        handles = []
-        new_names = []
-
-        for item in self._current_objects:
-            handles.append(item["handle"])
-            new_names.append(item["new_name"])
+        changed = [i for i in self._current_objects if i["new_name"] != i["original_name"]]
+        if not changed: return True
 
         # Call MS
-        mxs_handles = rt.Array(*(int(h) for h in handles))
-        mxs_names = rt.Array(*(str(n) for n in new_names))
+        mxs_handles = rt.Array(*(int(i["handle"]) for i in changed))
+        mxs_names = rt.Array(*(str(i["new_name"]) for i in changed))
 
-        return rt.ohCHA_NamingLogic.renameObjects(mxs_handles, mxs_names)
+        ok = rt.ohCHA_NamingLogic.renameObjects(mxs_handles, mxs_names)
+        self._scene_index = None
+        return ok
 
 
 naming_controller_instance = NamingController()
\ No newline at end of file
@@ -0,0 +1,198 @@
+# ohCHA_RigManager/01/src/controllers/naming_engine.py
+# Description: [v1.1] Batch Rename Engine.
+#              - Templates are compiled once into literal / token parts; rendering builds one column per token
+#                (cached by the inputs it depends on) and joins them row-wise in a single pass.
+#              - render_row(): one row on demand (virtualized preview), reusing cached columns when present.
+#              - Tokens:  {name}  original after Rem First / Rem Last     {orig}  original name
+#                         {parent} parent node name    {side}  L / R (from the name)    {##}  counter ('#' = pad)
+#                         {0} ~ {9}  regex match / capture groups on the original name    {{ }}  literal braces
+#              - SceneNameIndex: hashed (case-insensitive) scene names -> collision flags / auto-resolve.
+
+import re
+import collections
+
+try:
+    from utils.ohcha_search_index import detect_side
+except ImportError:
+    detect_side = lambda name: None
+
+_TOKEN_RE = re.compile(r"\{\{|\}\}|\{([^{}]*)\}|[{}]")
+_NAMED_TOKENS = ("name", "orig", "parent", "side")
+_TRAILING_DIGITS = re.compile(r"^(.*?)(\d+)$")
+
+
+class TemplateError(ValueError):
+    pass
+
+
+def escape_literal(text: str) -> str:
+    return text.replace("{", "{{").replace("}", "}}")
+
+
+def parse_template(template: str) -> list[tuple]:
+    """Returns [(kind, arg)]: ("lit", text) / ("tok", name) / ("num", pad) / ("grp", index)."""
+    parts, pos = [], 0
+    for m in _TOKEN_RE.finditer(template):
+        if m.start() > pos: parts.append(("lit", template[pos:m.start()]))
+        pos = m.end()
+        text = m.group(0)
+        if text in ("{{", "}}"):
+            parts.append(("lit", text[0]))
+            continue
+        token = m.group(1)
+        if token is None: raise TemplateError(f"Unbalanced brace at {m.start()}")
+        token = token.strip().lower()
+        if token in _NAMED_TOKENS: parts.append(("tok", token))
+        elif token and set(token) == {"#"}: parts.append(("num", len(token)))
+        elif token.isdigit() and len(token) == 1: parts.append(("grp", int(token)))
+        else: raise TemplateError(f"Unknown token {{{token}}}")
+    if pos < len(template): parts.append(("lit", template[pos:]))
+
+    # Merge adjacent literals
+    merged = []
+    for kind, arg in parts:
+        if kind == "lit" and merged and merged[-1][0] == "lit": merged[-1] = ("lit", merged[-1][1] + arg)
+        else: merged.append((kind, arg))
+    return merged
+
+
+def template_from_params(params: dict) -> str:
+    """The classic rules (prefix / base name / suffix / numbering) as a template."""
+    core = "{name}"
+    if params.get("use_base", False):
+        core = escape_literal(params["base_name"]) if params.get("base_name") else "{orig}"
+    num = "{" + "#" * max(1, params.get("padding", 3)) + "}" if params.get("use_num", False) else ""
+    return f"{escape_literal(params.get('prefix', ''))}{core}{escape_literal(params.get('suffix', ''))}{num}"
+
+
+def _remove_chars(name: str, rem_first: int, rem_last: int) -> str:
+    if rem_first > 0: name = name[rem_first:]
+    if rem_last > 0 and len(name) > rem_last: name = name[:-rem_last]
+    return name
+
+
+class CompiledTemplate:
+    """
+    parse_template() result plus the inputs each part depends on.
+    render() takes the source columns (originals, parents) and a column cache shared between renders,
+    so editing the prefix re-joins cached columns and editing the counter recomputes only the counter.
+    """
+
+    def __init__(self, template: str, regex: str = ""):
+        self.template = template
+        self.parts = parse_template(template)
+        self.regex = None
+        if any(k == "grp" for k, _ in self.parts):
+            try:
+                self.regex = re.compile(regex or "(.*)")
+            except re.error as e:
+                raise TemplateError(f"Invalid regex: {e}")
+            for k, g in self.parts:
+                if k == "grp" and g > self.regex.groups: raise TemplateError(f"Regex has no group {g}")
+
+    def render(self, originals, parents, params: dict, cache: dict = None) -> list[str]:
+        cache = {} if cache is None else cache
+        count = len(originals)
+        columns = []
+        for kind, arg in self.parts:
+            if kind == "lit":
+                columns.append((arg,) * count)
+                continue
+            key = self._column_key(kind, arg, params)
+            col = cache.get(key)
+            if col is None:
+                col = cache[key] = self._column(kind, arg, originals, parents, params)
+            columns.append(col)
+        if not columns: return [""] * count
+        if len(columns) == 1: return list(columns[0])
+        return ["".join(row) for row in zip(*columns)]
+
+    def render_row(self, i: int, originals, parents, params: dict, cache: dict = None) -> str:
+        """Name of row 'i' only (cached columns are used when they exist, nothing is added to the cache)."""
+        out = []
+        for kind, arg in self.parts:
+            if kind == "lit":
+                out.append(arg)
+                continue
+            col = cache.get(self._column_key(kind, arg, params)) if cache else None
+            out.append(col[i] if col is not None else self._value(kind, arg, i, originals[i], parents[i], params))
+        return "".join(out)
+
+    def _value(self, kind, arg, i, name, parent, params):
+        if kind == "tok":
+            if arg == "orig": return name
+            if arg == "parent": return parent
+            if arg == "side": return detect_side(name) or ""
+            return _remove_chars(name, params.get("rem_first", 0), params.get("rem_last", 0))
+        if kind == "num":
+            return f"{{:0{arg}d}}".format(params.get("start", 1) + i * params.get("step", 1))
+        m = self.regex.search(name)
+        return (m.group(arg) or "") if m else ""
+
+    def _column_key(self, kind, arg, params):
+        if kind == "tok" and arg == "name": return kind, arg, params.get("rem_first", 0), params.get("rem_last", 0)
+        if kind == "num": return kind, arg, params.get("start", 1), params.get("step", 1)
+        if kind == "grp": return kind, arg, self.regex.pattern
+        return kind, arg
+
+    def _column(self, kind, arg, originals, parents, params):
+        if kind == "tok":
+            if arg == "orig": return tuple(originals)
+            if arg == "parent": return tuple(parents)
+            if arg == "side": return tuple(detect_side(n) or "" for n in originals)
+            rem_first, rem_last = params.get("rem_first", 0), params.get("rem_last", 0)
+            return tuple(_remove_chars(n, rem_first, rem_last) for n in originals)
+        if kind == "num":
+            start, step = params.get("start", 1), params.get("step", 1)
+            fmt = f"{{:0{arg}d}}"
+            return tuple(fmt.format(start + i * step) for i in range(len(originals)))
+        # regex group
+        rx = self.regex
+        out = []
+        for n in originals:
+            m = rx.search(n)
+            out.append((m.group(arg) or "") if m else "")
+        return tuple(out)
+
+
+class SceneNameIndex:
+    """Case-insensitive scene name counts (Max name lookups ignore case)."""
+
+    def __init__(self, names=()):
+        self.counts = collections.Counter(n.lower() for n in names)
+
+    def __contains__(self, name):
+        return self.counts.get(name.lower(), 0) > 0
+
+    def collisions(self, originals, new_names) -> list[bool]:
+        """
+        True where new_names[i] would be shared: with another new name, or with a scene node outside the batch
+        (nodes in the batch give up their original names).
+        """
+        outside = self.counts.copy()
+        outside.subtract(n.lower() for n in originals)
+        batch = collections.Counter(n.lower() for n in new_names)
+        return [batch[k] > 1 or outside.get(k, 0) > 0 for k in (n.lower() for n in new_names)]
+
+    def resolve(self, originals, new_names) -> list[str]:
+        """
+        Keeps the first occurrence of each free name; later duplicates / names taken outside the batch get the
+        next free trailing number ('Arm' -> 'Arm_01', 'Arm_03' -> 'Arm_04').
+        """
+        taken = self.counts.copy()
+        taken.subtract(n.lower() for n in originals)
+        taken = {k for k, c in taken.items() if c > 0}
+        out = []
+        for name in new_names:
+            key = name.lower()
+            if key in taken:
+                m = _TRAILING_DIGITS.match(name)
+                stem, num, width = (m.group(1), int(m.group(2)), len(m.group(2))) if m else (name + "_", 0, 2)
+                while True:
+                    num += 1
+                    name = f"{stem}{num:0{width}d}"
+                    key = name.lower()
+                    if key not in taken: break
+            taken.add(key)
+            out.append(name)
+        return out
@@ -1,5 +1,7 @@
 # ohCHA_RigManager/01/src/controllers/rigging_controller.py
-# Description: [v21.36] DEBUG CONTROLLER.
+# Description: [v21.37] DEBUG CONTROLLER.
+#              - STARTUP: No fileIn at construction; structs load on first use.
+#              - LOADER: _ensure_logic_loaded delegates to utils.mxs_loader (no per-call struct probing).
 #              - STRETCH: No changes, calling updated MS logic.
 
 import pymxs
@@ -7,10 +9,15 @@ import importlib
 import os
 from pymxs import runtime as rt
 
+try:
+    from utils.config import PRODUCTION_MODE
+except ImportError:
+    PRODUCTION_MODE = False
+
 try:
     from controllers import rigging_logic
 
-    importlib.reload(rigging_logic)
+    if not PRODUCTION_MODE: importlib.reload(rigging_logic)
 except ImportError:
     rigging_logic = None
     print("❌ [RiggingController] Failed to import rigging_logic.py")
@@ -21,14 +28,26 @@ except ImportError:
     get_project_root = lambda: ""
     find_script_path = lambda x: None
 
+try:
+    from utils.mxs_loader import mxs_loader
+except ImportError:
+    mxs_loader = None
+    print("❌ [RiggingController] Failed to import mxs_loader.")
+
+RIGGING_MXS_MODULES = ("ohcha_shape_utils", "ohcha_bone_logic", "ohcha_biped_logic", "ohcha_control_logic")
+
 
 class RiggingController:
     def __init__(self):
+        # MaxScript structs are loaded on first use (every entry point calls _ensure_logic_loaded).
         print("--- [RiggingController] Init ---")
-        self._ensure_logic_loaded()
 
     def _ensure_logic_loaded(self):
-        """Checks if MaxScript structs are loaded and prints status."""
+        """Loads the rigging MaxScript modules once (reloaded only when a file changes)."""
+        if mxs_loader is not None:
+            mxs_loader.require(*RIGGING_MXS_MODULES)
+            return
+
         modules = [
             ("ohCHA_ShapeUtils", "ohcha_shape_utils"),
             ("ohCHA_BoneLogic", "ohcha_bone_logic"),
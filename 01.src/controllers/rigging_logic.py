@@ -1,5 +1,6 @@
 # ohCHA_RigManager/01/src/controllers/rigging_logic.py
-# Description: [v20.39] Foot LookAt Excluded.
+# Description: [v20.40] Foot LookAt Excluded.
+#              - PERF: snap_guide_to_vertex_center uses a compiled snippet (no per-call rt.execute).
 #              - FIXED: 'apply_guide_lookat' now skips 'Foot' guides.
 #              - REASON: Feet should remain planted/flat, not snap to toes.
 #              - PRESERVED: HandEnd creation & all other logic.
@@ -387,38 +388,48 @@ def get_guide_hierarchy_data():
         return []
 
 
-def snap_guide_to_vertex_center(guide_name):
-    cmd = f"""
-    (
-        local g = getNodeByName "{guide_name}"
-        if (isValidNode g) and (selection.count == 1) do (
-            local obj = selection[1]
-            local center = undefined
-            if (classof obj == Editable_Poly) then (
-                local vSel = polyop.getVertSelection obj as array
-                if vSel.count > 0 do (
-                    local sumPos = [0,0,0]
-                    for v in vSel do ( sumPos += polyop.getVert obj v )
-                    center = sumPos / vSel.count
-                )
-            )
-            else if (classof obj == Editable_Mesh) then (
-                local vSel = getVertSelection obj as array
-                if vSel.count > 0 do (
-                    local sumPos = [0,0,0]
-                    for v in vSel do ( sumPos += getVert obj v )
-                    center = sumPos / vSel.count
-                )
+try:
+    from utils.mxs_snippets import mxs_snippets
+except ImportError:
+    mxs_snippets = None
+
+_SNAP_GUIDE_BODY = """
+    if (isValidNode g) and (selection.count == 1) do (
+        local obj = selection[1]
+        local center = undefined
+        if (classof obj == Editable_Poly) then (
+            local vSel = polyop.getVertSelection obj as array
+            if vSel.count > 0 do (
+                local sumPos = [0,0,0]
+                for v in vSel do ( sumPos += polyop.getVert obj v )
+                center = sumPos / vSel.count
             )
-            if center != undefined do (
-                g.pos = center
-                true
+        )
+        else if (classof obj == Editable_Mesh) then (
+            local vSel = getVertSelection obj as array
+            if vSel.count > 0 do (
+                local sumPos = [0,0,0]
+                for v in vSel do ( sumPos += getVert obj v )
+                center = sumPos / vSel.count
             )
         )
+        if center != undefined do (
+            g.pos = center
+            true
+        )
     )
-    """
+"""
+if mxs_snippets: mxs_snippets.register("snap_guide_to_vertex_center", "g", _SNAP_GUIDE_BODY)
+
+
+def snap_guide_to_vertex_center(guide_name):
     try:
-        res = rt.execute(cmd)
+        guide = rt.getNodeByName(guide_name)
+        if not guide: return False
+        if mxs_snippets:
+            res = mxs_snippets.call("snap_guide_to_vertex_center", guide)
+        else:
+            res = rt.execute(f"(local g = getNodeByName \"{guide_name}\"\n{_SNAP_GUIDE_BODY})")
         return res == True
     except Exception as e:
         log(f"Snap Error: {e}")
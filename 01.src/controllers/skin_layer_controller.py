@@ -1,7 +1,18 @@
 # ohCHA_RigManager/01/src/controllers/skin_layer_controller.py
-# Description: [v20.97] FULL CODE.
+# Description: [v21.03] FULL CODE.
+#              - NEW: SkinBoneTable cache for bone queries (one signature probe per call, bulk rebuild).
+#              - NEW: Oversized sidecars are stream-loaded into packed arrays; saves are compact JSON.
+#              - NEW: Per-vertex opacity maps (feathered from masks, stored as packed base64 arrays).
+#              - NEW: Merge-down / collapse-range via affine layer composition (exact result).
+#              - NEW: Multi-source WeightClipboard (average / nearest / index paste, delta inject).
+#              - NEW: Composite weight cache + SkinWeightQuery (bulk influence / usage queries).
 #              - UPDATED: Uses 'find_script_path' to support .mse/.ms/.txt loading.
 #              - INTEGRITY: Preserved all Layer/Mask/Paint logic.
+#              - FIXED: update_mask_data saves the mask before regenerating the opacity map (drops the map
+#                when topology is unavailable); opacity map ops all reject the base layer.
+#              - FIXED: Weight clipboard pastes by bone name (refuses when the target skin lacks copied bones).
+#              - FIXED: Paste passes the target node name, so 'auto' only maps by index onto the same mesh.
+#              - FIXED: remove_unused_bones keeps bones used as mask keys (dropping them shrank the layer gate).
 
 import os
 import json
@@ -10,17 +21,22 @@ import traceback
 import collections
 import copy
 import shutil
+import bisect
+import base64
+import sys
+from array import array
 from pymxs import runtime as rt
 
 try:
     from utils.paths import get_project_root, find_script_path
-    from utils.ohcha_max_utils import UndoContext, get_selected_skin_vert_indices, get_skin_bone_data
+    from utils.ohcha_max_utils import UndoContext, get_selected_skin_vert_indices, get_skin_bone_data, SkinBoneTable
 except ImportError:
     rt.print("❌ [SkinController] 'utils' 임포트 실패")
     get_project_root = lambda: ""
     find_script_path = lambda x: None
     get_selected_skin_vert_indices = lambda m: []
     get_skin_bone_data = lambda m: []
+    SkinBoneTable = None
 
 
     class UndoContext:
@@ -30,9 +46,39 @@ except ImportError:
 
         def __exit__(self, *args): pass
 
+try:
+    from utils.ohcha_skin_stream import load_skin_file, dump_skin_file
+except ImportError:
+    rt.print("❌ [SkinController] 'ohcha_skin_stream' 임포트 실패")
+
+    def load_skin_file(path):
+        with open(path, 'r', encoding='utf-8') as f: return json.load(f)
+
+    def dump_skin_file(data, path):
+        with open(path, 'w', encoding='utf-8') as f: json.dump(data, f, indent=4)
+
+try:
+    from utils.mxs_loader import mxs_loader
+except ImportError:
+    rt.print("❌ [SkinController] 'mxs_loader' 임포트 실패")
+    mxs_loader = None
+
+try:
+    from controllers.skin_weight_query import SkinWeightQuery
+except ImportError:
+    rt.print("❌ [SkinController] 'skin_weight_query' 임포트 실패")
+    SkinWeightQuery = None
+
+try:
+    from controllers.weight_clipboard import WeightClipboard
+except ImportError:
+    rt.print("❌ [SkinController] 'weight_clipboard' 임포트 실패")
+    WeightClipboard = None
+
 
 def _load_data_manager():
     """Loads ohcha_data_utils using flexible extension check."""
+    if mxs_loader is not None: return mxs_loader.require("ohcha_data_utils")
     path = find_script_path("ohcha_data_utils")
     if path:
         try:
@@ -44,6 +90,166 @@ def _load_data_manager():
     return False
 
 
+def _iter_layer_weights(weights: dict, only_verts=None):
+    """Yields (vert_id, bone_ids, weights) from a layer's weights, optionally limited to 'only_verts'."""
+    if only_verts is None:
+        if hasattr(weights, "iter_rows"):
+            yield from weights.iter_rows()
+            return
+        for v_str, (bones, vals) in weights.items(): yield int(v_str), bones, vals
+    else:
+        for v in only_verts:
+            entry = weights.get(str(v))
+            if entry: yield int(v), entry[0], entry[1]
+
+
+def _encode_opacity_map(values: dict, feather: int) -> dict:
+    """{vert_id: 0..1} -> {"feather", "verts" (uint32 LE), "values" (uint8)} as base64 strings."""
+    verts = sorted(values)
+    v_arr = array('I', verts)
+    if sys.byteorder == "big": v_arr.byteswap()
+    quant = bytes(int(round(min(1.0, max(0.0, values[v])) * 255)) for v in verts)
+    return {"feather": int(feather),
+            "verts": base64.b64encode(v_arr.tobytes()).decode("ascii"),
+            "values": base64.b64encode(quant).decode("ascii")}
+
+
+def _decode_opacity_map(packed) -> dict | None:
+    if not packed: return None
+    v_arr = array('I')
+    v_arr.frombytes(base64.b64decode(packed.get("verts", "")))
+    if sys.byteorder == "big": v_arr.byteswap()
+    quant = base64.b64decode(packed.get("values", ""))
+    return dict(zip(v_arr, (q / 255.0 for q in quant)))
+
+
+def _layer_gate(layer: dict):
+    """
+    Returns a per-vertex opacity function for 'layer' (None result = vertex unaffected).
+    An opacity map (soft mask) supersedes the binary mask gate while the mask is enabled.
+    """
+    opacity = layer.get("opacity", 1.0)
+    mask = layer.get("mask")
+    mask_enabled = layer.get("mask_enabled", True)
+
+    omap = _decode_opacity_map(layer.get("opacity_map")) if (mask is not None and mask_enabled) else None
+    if omap is not None:
+        def gate(v_idx):
+            a = opacity * omap.get(v_idx, 0.0)
+            return a if a > 0.0 else None
+        return gate
+
+    if mask and mask_enabled:
+        masked_verts = set()
+        for v_list in mask.values(): masked_verts.update(v_list)
+        return lambda v_idx: opacity if v_idx in masked_verts else None
+    return lambda v_idx: opacity
+
+
+def _blend_terms(blend_mode: str, opacity: float):
+    """(k, scale) of the affine blend w' = k * w + scale * v, or None for unknown modes."""
+    if blend_mode == "Overwrite" and opacity >= 0.999: return 0.0, 1.0
+    if blend_mode in ("Overwrite", "Normal"): return 1.0 - opacity, opacity
+    if blend_mode == "Add": return 1.0, opacity
+    if blend_mode == "Subtract": return 1.0, -opacity
+    return None
+
+
+def _composite_layers(layers: list, only_verts=None) -> dict | None:
+    """
+    Raw (un-normalized) blend of 'layers' -> {vert_id: defaultdict(bone_id -> weight)}.
+    The first enabled layer is the base. Returns None when no layer is enabled.
+    """
+    start_index = -1
+    for i, layer in enumerate(layers):
+        if layer.get("enabled", True):
+            start_index = i
+            break
+
+    if start_index == -1:
+        return None
+
+    base_weights = layers[start_index].get("weights", {})
+    final_weights_map = {
+        v_idx: collections.defaultdict(float, zip(bones, weights))
+        for v_idx, bones, weights in _iter_layer_weights(base_weights, only_verts)
+    }
+
+    for layer in layers[start_index + 1:]:
+        if not layer.get("enabled", True): continue
+        if not layer.get("weights"): continue
+
+        blend_mode = layer.get("blend_mode", "Overwrite")
+        gate = _layer_gate(layer)
+
+        layer_data_map = {v_idx: dict(zip(bones, weights)) for v_idx, bones, weights in
+                          _iter_layer_weights(layer.get("weights", {}), only_verts)}
+
+        for v_idx, vert_weights in layer_data_map.items():
+            opacity = gate(v_idx)
+            if opacity is None: continue
+            current_weights = final_weights_map.setdefault(v_idx, collections.defaultdict(float))
+
+            if blend_mode == "Overwrite":
+                if opacity >= 0.999:
+                    current_weights.clear()
+                    current_weights.update(vert_weights)
+                else:
+                    for b_id in set(current_weights.keys()) | set(vert_weights.keys()):
+                        old_w = current_weights.get(b_id, 0.0)
+                        new_w = vert_weights.get(b_id, 0.0)
+                        current_weights[b_id] = old_w * (1.0 - opacity) + new_w * opacity
+
+            elif blend_mode == "Add":
+                for b_id, w in vert_weights.items(): current_weights[b_id] += w * opacity
+
+            elif blend_mode == "Subtract":
+                for b_id, w in vert_weights.items(): current_weights[b_id] -= w * opacity
+
+            elif blend_mode == "Normal":
+                for b_id in set(current_weights.keys()) | set(vert_weights.keys()):
+                    old_w = current_weights.get(b_id, 0.0)
+                    new_w = vert_weights.get(b_id, 0.0)
+                    current_weights[b_id] = old_w * (1.0 - opacity) + new_w * opacity
+
+    return final_weights_map
+
+
+def _compose_layer_range(layers: list, includes_base: bool) -> dict:
+    """
+    Every blend mode is affine per vertex: w' = k * w + m (k shared by all bones of that vertex).
+    Composes the enabled 'layers' (bottom -> top) into {vert_id: [k, {bone_id: m}]}.
+    'includes_base': the first enabled layer is the stack base (loads values, k = 0).
+    """
+    terms = {}
+    is_first = includes_base
+    for layer in layers:
+        if not layer.get("enabled", True): continue
+        weights = layer.get("weights", {})
+        if is_first:
+            for v_idx, bones, vals in _iter_layer_weights(weights):
+                terms[v_idx] = [0.0, dict(zip(bones, vals))]
+            is_first = False
+            continue
+        if not weights: continue
+
+        blend_mode = layer.get("blend_mode", "Overwrite")
+        gate = _layer_gate(layer)
+
+        for v_idx, bones, vals in _iter_layer_weights(weights):
+            opacity = gate(v_idx)
+            if opacity is None: continue
+            blend = _blend_terms(blend_mode, opacity)
+            if blend is None: continue
+            k, scale = blend
+            term = terms.setdefault(v_idx, [1.0, {}])
+            m = {b: w * k for b, w in term[1].items()}
+            for b, w in zip(bones, vals): m[b] = m.get(b, 0.0) + w * scale
+            term[0] *= k
+            term[1] = m
+    return terms
+
+
 DEFAULT_SKIN_DATA = {
     "version": "1.6",
     "bones": [],
@@ -65,7 +271,7 @@ class SkinLayerController:
     def __init__(self):
         self.node = None
         self.native_skin_mod = None
-        self.is_manager_loaded = _load_data_manager()
+        self._manager_loaded = False
 
         # Session State
         self.is_painting = False
@@ -75,9 +281,27 @@ class SkinLayerController:
         # Data Cache (RAM)
         self.cached_data = None
         self.backup_weights = None
-        self.clipboard_weights = {}
+        self.weight_clipboard = WeightClipboard() if WeightClipboard else None
         self.topology_cache = {}
+        self.position_cache = None
         self.cached_node_handle = None
+        self.bone_table = SkinBoneTable() if SkinBoneTable else None
+
+        # Composite Cache (invalidated by '_data_revision')
+        self._data_revision = 0
+        self._composite_cache = None
+        self._composite_revision = -1
+        self._weight_query = None
+        self._weight_query_revision = -1
+
+    @property
+    def is_manager_loaded(self) -> bool:
+        # ohcha_data_utils is fileIn'd on first use instead of at import time (mxs_loader also reloads it on change).
+        if mxs_loader is not None or not self._manager_loaded: self._manager_loaded = _load_data_manager()
+        return self._manager_loaded
+
+    def _mark_data_dirty(self):
+        self._data_revision += 1
 
     def set_current_node(self, node):
         if self.is_painting or self.is_editing_manually: return
@@ -86,7 +310,10 @@ class SkinLayerController:
         self.native_skin_mod = None
         self.cached_data = None
         self.topology_cache = {}
+        self.position_cache = None
         self.cached_node_handle = None
+        if self.bone_table: self.bone_table.reset()
+        self._mark_data_dirty()
 
         if node and rt.isValidNode(node):
             self.node = node
@@ -119,36 +346,35 @@ class SkinLayerController:
         if not sidecar_path or not os.path.exists(sidecar_path):
             return copy.deepcopy(DEFAULT_SKIN_DATA)
         try:
-            with open(sidecar_path, 'r', encoding='utf-8') as f:
-                data = json.load(f)
-                if "layers" in data:
-                    for layer in data["layers"]:
-                        if "enabled" not in layer: layer["enabled"] = True
-                        if "mask_enabled" not in layer: layer["mask_enabled"] = True
-                return data
+            data = load_skin_file(sidecar_path)
+            if "layers" in data:
+                for layer in data["layers"]:
+                    if "enabled" not in layer: layer["enabled"] = True
+                    if "mask_enabled" not in layer: layer["mask_enabled"] = True
+            return data
         except Exception:
             return copy.deepcopy(DEFAULT_SKIN_DATA)
 
     def get_layer_data_from_scene(self) -> dict:
         if self.cached_data is None:
             self.cached_data = self._load_data_from_disk()
+            self._mark_data_dirty()
         return self.cached_data
 
     def save_layer_data_to_scene(self, py_data: dict) -> bool:
         self.cached_data = py_data
+        self._mark_data_dirty()
 
         sidecar_path = self._get_sidecar_file_path()
         if not sidecar_path: return False
         try:
             if self.native_skin_mod:
                 try:
-                    bones_data = get_skin_bone_data(self.native_skin_mod)
-                    py_data["bones"] = [b['name'] for b in bones_data]
+                    py_data["bones"] = list(self.get_bone_names())
                 except:
                     pass
 
-            with open(sidecar_path, 'w', encoding='utf-8') as f:
-                json.dump(py_data, f, indent=4)
+            dump_skin_file(py_data, sidecar_path)
             return True
         except Exception:
             return False
@@ -169,8 +395,7 @@ class SkinLayerController:
     def import_skin_data(self, source_path: str) -> dict:
         if not self.native_skin_mod: return None
         try:
-            with open(source_path, 'r', encoding='utf-8') as f:
-                data = json.load(f)
+            data = load_skin_file(source_path)
 
             bone_names = data.get("bones", [])
             if bone_names:
@@ -215,7 +440,94 @@ class SkinLayerController:
                 rt.forceCompleteRedraw()
                 rt.gc(light=True)
 
-    def flatten_layers_to_weights(self, up_to_ui_index: int = -1) -> dict | None:
+    def get_composite_weights(self) -> dict | None:
+        """Full-stack composite, reused until the layer data changes. Treat as read-only."""
+        if self._composite_revision != self._data_revision:
+            self._composite_cache = self.flatten_layers_to_weights()
+            self._composite_revision = self._data_revision
+        return self._composite_cache
+
+    def get_weight_query(self):
+        """Returns a SkinWeightQuery over the composite, or None when no layer weights exist."""
+        if SkinWeightQuery is None or not self.node: return None
+        composite = self.get_composite_weights()
+        if not composite: return None
+        if self._weight_query is None or self._weight_query_revision != self._composite_revision:
+            self._weight_query = SkinWeightQuery(composite)
+            self._weight_query_revision = self._composite_revision
+        return self._weight_query
+
+    def remove_unused_bones(self) -> int | None:
+        """
+        Removes bones without weight in the composite. Bones referenced by any layer
+        (including disabled ones) or used as a mask key are kept, and layer/mask bone ids are remapped afterwards.
+        Returns None when there is no layer data to answer from (caller falls back to MaxScript).
+        """
+        query = self.get_weight_query()
+        if query is None or not self.native_skin_mod: return None
+
+        d = self.get_layer_data_from_scene()
+        referenced = set()
+        for layer in d.get("layers", []):
+            for bones, _ in layer.get("weights", {}).values(): referenced.update(bones)
+            # Mask verts gate the whole layer in flatten; a removed key would shrink the masked region.
+            referenced.update(int(b) for b in (layer.get("mask") or {}))
+
+        num_bones = int(rt.skinOps.GetNumberBones(self.native_skin_mod))
+        to_remove = [b for b in query.unused_bones(range(1, num_bones + 1)) if b not in referenced]
+        if not to_remove: return 0
+
+        removed = rt.ohCHA_SkinLogic.removeBonesByIds(self.native_skin_mod, rt.Array(*to_remove))
+        if not removed: return 0
+
+        self._remap_layer_bone_ids(d, to_remove)
+        self.save_layer_data_to_scene(d)
+        return int(removed)
+
+    def _remap_layer_bone_ids(self, d: dict, removed_ids: list):
+        """Shifts 1-based bone ids down to match a skin after 'removed_ids' were deleted."""
+        removed_sorted = sorted(removed_ids)
+        removed_set = set(removed_sorted)
+        shift = lambda b: b - bisect.bisect_left(removed_sorted, b)
+
+        for layer in d.get("layers", []):
+            weights = layer.get("weights", {})
+            for v_str, (bones, vals) in list(weights.items()):
+                weights[v_str] = [[shift(b) for b in bones], vals]
+
+            mask = layer.get("mask")
+            if mask:
+                layer["mask"] = {str(shift(int(b))): v for b, v in mask.items() if int(b) not in removed_set}
+
+    def prune_small_weights(self, threshold: float = 0.001) -> int | None:
+        """
+        Drops composite influences at or below 'threshold' and injects only the affected vertices.
+        Returns None when there is no layer data to answer from (caller falls back to MaxScript).
+        """
+        query = self.get_weight_query()
+        if query is None: return None
+
+        low_map = query.weights_below(threshold)
+        if not low_map: return 0
+
+        composite = self.get_composite_weights()
+        delta = {}
+        for v_idx, low_bones in low_map.items():
+            low = set(low_bones)
+            bones, weights = composite[v_idx]
+            kept = [(b, w) for b, w in zip(bones, weights) if b not in low]
+            total = sum(w for _, w in kept)
+            if total < 1e-6: continue
+            delta[v_idx] = ([b for b, _ in kept], [w / total for _, w in kept])
+
+        if delta: self.inject_weights_to_native_skin(delta, undo_name="ohCHA Prune Weights")
+        return len(delta)
+
+    def flatten_layers_to_weights(self, up_to_ui_index: int = -1, only_verts=None) -> dict | None:
+        """
+        Composites the layer stack into {vert_id: (bone_ids, weights)}.
+        'only_verts' restricts the pass to those vertices (delta inject after local edits).
+        """
         layer_data = self.get_layer_data_from_scene()
         layers = layer_data.get("layers", [])
 
@@ -229,65 +541,10 @@ class SkinLayerController:
         target_layers = layers[:num_layers_to_process]
         if not target_layers: return None
 
-        start_index = -1
-        for i, layer in enumerate(target_layers):
-            if layer.get("enabled", True):
-                start_index = i
-                break
-
-        if start_index == -1:
+        final_weights_map = _composite_layers(target_layers, only_verts)
+        if final_weights_map is None:
             return {}
 
-        base_layer = target_layers[start_index]
-        base_weights = base_layer.get("weights", {})
-
-        final_weights_map = {
-            int(v_idx): collections.defaultdict(float, zip(bones, weights))
-            for v_idx, (bones, weights) in base_weights.items()
-        }
-
-        for layer in target_layers[start_index + 1:]:
-            if not layer.get("enabled", True): continue
-            if not layer.get("weights"): continue
-
-            opacity = layer.get("opacity", 1.0)
-            blend_mode = layer.get("blend_mode", "Overwrite")
-            mask = layer.get("mask")
-            mask_enabled = layer.get("mask_enabled", True)
-
-            layer_data_map = {int(v_idx): dict(zip(bones, weights)) for v_idx, (bones, weights) in
-                              layer.get("weights", {}).items()}
-
-            masked_verts = set()
-            if mask and mask_enabled:
-                for v_list in mask.values(): masked_verts.update(v_list)
-
-            for v_idx, vert_weights in layer_data_map.items():
-                if mask and mask_enabled and v_idx not in masked_verts: continue
-                current_weights = final_weights_map.setdefault(v_idx, collections.defaultdict(float))
-
-                if blend_mode == "Overwrite":
-                    if opacity >= 0.999:
-                        current_weights.clear()
-                        current_weights.update(vert_weights)
-                    else:
-                        for b_id in set(current_weights.keys()) | set(vert_weights.keys()):
-                            old_w = current_weights.get(b_id, 0.0)
-                            new_w = vert_weights.get(b_id, 0.0)
-                            current_weights[b_id] = old_w * (1.0 - opacity) + new_w * opacity
-
-                elif blend_mode == "Add":
-                    for b_id, w in vert_weights.items(): current_weights[b_id] += w * opacity
-
-                elif blend_mode == "Subtract":
-                    for b_id, w in vert_weights.items(): current_weights[b_id] -= w * opacity
-
-                elif blend_mode == "Normal":
-                    for b_id in set(current_weights.keys()) | set(vert_weights.keys()):
-                        old_w = current_weights.get(b_id, 0.0)
-                        new_w = vert_weights.get(b_id, 0.0)
-                        current_weights[b_id] = old_w * (1.0 - opacity) + new_w * opacity
-
         injectable_weights = {}
         for v_idx, blended_weights_map in final_weights_map.items():
             final_bone_weights = {b: w for b, w in blended_weights_map.items() if w > 1e-6}
@@ -361,12 +618,12 @@ class SkinLayerController:
 
         target_layer["weights"] = layer_weights
         self.cached_data = all_data
+        self._mark_data_dirty()
 
     def save_bone_list_json(self, file_path: str) -> bool:
         if not self.native_skin_mod: return False
         try:
-            bones_data = get_skin_bone_data(self.native_skin_mod)
-            bone_names = [b['name'] for b in bones_data]
+            bone_names = list(self.get_bone_names())
             data = {"version": "1.0", "count": len(bone_names), "bones": bone_names}
             with open(file_path, 'w', encoding='utf-8') as f:
                 json.dump(data, f, indent=4)
@@ -396,10 +653,7 @@ class SkinLayerController:
         if not sel_verts: return False
         if ui_layer_index != -1: self.editing_layer_index = ui_layer_index
 
-        if not self.topology_cache:
-            mxs_topo = rt.ohCHA_DataUtil.getMeshTopology(self.node)
-            if not mxs_topo: return False
-            self.topology_cache = [list(adj) for adj in mxs_topo]
+        if not self._ensure_topology(): return False
 
         self._sync_layer_from_viewport_selection()
         all_data = self.get_layer_data_from_scene()
@@ -453,6 +707,7 @@ class SkinLayerController:
             target_layer["weights"] = layer_weights
 
             self.cached_data = all_data
+            self._mark_data_dirty()
             final_result = self.flatten_layers_to_weights()
             self.inject_weights_to_native_skin(final_result)
 
@@ -469,10 +724,7 @@ class SkinLayerController:
 
         if ui_layer_index != -1: self.editing_layer_index = ui_layer_index
 
-        if not self.topology_cache:
-            mxs_topo = rt.ohCHA_DataUtil.getMeshTopology(self.node)
-            if not mxs_topo: return False
-            self.topology_cache = [list(adj) for adj in mxs_topo]
+        if not self._ensure_topology(): return False
 
         process_verts = set(sel_verts)
         for v_idx in sel_verts:
@@ -552,6 +804,7 @@ class SkinLayerController:
             target_layer["weights"] = layer_weights
 
             self.cached_data = all_data
+            self._mark_data_dirty()
             final_result = self.flatten_layers_to_weights()
             self.inject_weights_to_native_skin(final_result)
 
@@ -570,36 +823,90 @@ class SkinLayerController:
             return True
         return False
 
-    def copy_vertex_weights(self):
-        if not self.native_skin_mod: return
+    def _ensure_topology(self) -> bool:
+        if not self.topology_cache:
+            mxs_topo = rt.ohCHA_DataUtil.getMeshTopology(self.node)
+            if not mxs_topo: return False
+            self.topology_cache = [list(adj) for adj in mxs_topo]
+        return True
+
+    def _get_vertex_positions(self) -> list:
+        """Local-space vertex positions [(x, y, z), ...] (1-based vert = index + 1), cached per node."""
+        if self.position_cache is None:
+            try:
+                mxs_pos = rt.ohCHA_DataUtil.getAllVertexPositions(self.node)
+                self.position_cache = [(p.x, p.y, p.z) for p in mxs_pos]
+            except Exception as e:
+                rt.print(f"⚠️ [Clipboard] Position fetch failed: {e}")
+                self.position_cache = []
+        return self.position_cache
+
+    def copy_vertex_weights(self) -> int:
+        if not self.native_skin_mod or self.weight_clipboard is None: return 0
         try:
             sel_verts = get_selected_skin_vert_indices(self.native_skin_mod)
-            if not sel_verts: return
-            vert_id = sel_verts[0]
-            count = rt.skinOps.GetVertexWeightCount(self.native_skin_mod, vert_id)
-            self.clipboard_weights = {}
-            for i in range(1, count + 1):
-                self.clipboard_weights[
-                    rt.skinOps.GetVertexWeightBoneID(self.native_skin_mod, vert_id, i)] = rt.skinOps.GetVertexWeight(
-                    self.native_skin_mod, vert_id, i)
-            rt.print(f"📋 Copied from {vert_id}")
-        except:
-            pass
+            if not sel_verts: return 0
+
+            source = self.get_composite_weights()
+            if not source:
+                # No layer data yet: one bulk read of the selection from the native skin.
+                bulk = rt.ohCHA_DataUtil.getBulkVertexWeights(self.node, rt.Array(*(int(v) for v in sel_verts)))
+                source = {int(e[0]): (list(e[1]), list(e[2])) for e in bulk} if bulk else {}
+
+            count = self.weight_clipboard.capture(source, sel_verts, self._get_vertex_positions(), self.node.name,
+                                                  bone_names=self.get_bone_names())
+            rt.print(f"📋 Copied {count} vertices from {self.node.name}")
+            return count
+        except Exception as e:
+            rt.print(f"❌ [Clipboard] Copy Error: {e}")
+            return 0
 
-    def paste_vertex_weights(self, ui_layer_index: int = -1) -> bool:
-        if not self.clipboard_weights: return False
+    def paste_vertex_weights(self, ui_layer_index: int = -1, mode: str = "auto") -> bool:
+        if self.weight_clipboard is None or self.weight_clipboard.is_empty(): return False
         if not self.native_skin_mod: return False
         if ui_layer_index != -1: self.editing_layer_index = ui_layer_index
-        bones = list(self.clipboard_weights.keys())
-        weights = list(self.clipboard_weights.values())
-        mxs_bones = rt.Array(*(int(b) for b in bones))
-        mxs_weights = rt.Array(*(float(w) for w in weights))
-        success = rt.ohCHA_SkinLogic.pasteWeightData(mxs_bones, mxs_weights)
-        if success:
-            self._sync_layer_from_viewport_selection()
-            rt.print("📋 Pasted")
-            return True
-        return False
+
+        sel_verts = get_selected_skin_vert_indices(self.native_skin_mod)
+        if not sel_verts: return False
+
+        # Bone ids are per skin: map the copied bones onto this skin by name.
+        bone_names = self.get_bone_names()
+        missing = self.weight_clipboard.missing_bones(bone_names)
+        if missing:
+            shown = ", ".join(missing[:10]) + (f" (+{len(missing) - 10})" if len(missing) > 10 else "")
+            rt.print(f"❌ [Clipboard] Paste cancelled: {self.node.name} has no bone(s) {shown} "
+                     f"(copied from {self.weight_clipboard.source_name}).")
+            return False
+
+        positions = self._get_vertex_positions() if mode in ("auto", "nearest") else None
+        resolved = self.weight_clipboard.resolve(mode, sel_verts, positions, target_bone_names=bone_names,
+                                                 target_name=self.node.name)
+        if not resolved: return False
+
+        all_data = self.get_layer_data_from_scene()
+        layers = all_data.get("layers", [])
+        target_ui_index = self.editing_layer_index if self.editing_layer_index != -1 else 0
+        data_index = self._ui_to_data_index(target_ui_index, len(layers))
+        if data_index < 0 or data_index >= len(layers): return False
+
+        target_layer = layers[data_index]
+        layer_weights = target_layer.setdefault("weights", {})
+        layer_mask = target_layer.get("mask")
+        valid_mask_verts = None
+        if layer_mask and target_layer.get("mask_enabled", True): valid_mask_verts = set(sum(layer_mask.values(), []))
+
+        changed = []
+        for v_idx, (bones, weights) in resolved.items():
+            if valid_mask_verts is not None and v_idx not in valid_mask_verts: continue
+            layer_weights[str(v_idx)] = [list(bones), [round(float(w), 6) for w in weights]]
+            changed.append(v_idx)
+        if not changed: return False
+
+        self.cached_data = all_data
+        self._mark_data_dirty()
+        self.inject_weights_to_native_skin(self.flatten_layers_to_weights(only_verts=changed), undo_name="ohCHA Paste Weights")
+        rt.print(f"📋 Pasted {len(changed)} vertices ({mode})")
+        return True
 
     def transfer_weights_on_layer(self, source_id: int, target_id: int, ui_layer_index: int) -> bool:
         if not self.node or not self.native_skin_mod: return False
@@ -680,6 +987,7 @@ class SkinLayerController:
         proc = {str(i[0]): [list(i[1]), [round(w, 6) for w in i[2]]] for i in w_data}
         d = self.get_layer_data_from_scene()
         d['layers'][data_index]['weights'] = proc
+        self._mark_data_dirty()
         if do_save: self.save_layer_data_to_scene(d)
         return d
 
@@ -724,6 +1032,61 @@ class SkinLayerController:
         self.save_layer_data_to_scene(d)
         return d
 
+    def merge_layer_down(self, ui_index: int) -> dict:
+        """Merges the layer at 'ui_index' into the one below it (UI order: higher index = lower layer)."""
+        return self.collapse_layer_range(ui_index, ui_index + 1)
+
+    def collapse_layer_range(self, ui_from: int, ui_to: int) -> dict:
+        """
+        Replaces the enabled layers between two UI indices (inclusive) with one sparse layer that
+        composites identically. Disabled layers in the range are kept, directly above the result.
+        """
+        d = self.get_layer_data_from_scene()
+        layers = d.get("layers", [])
+        total = len(layers)
+        lo = self._ui_to_data_index(max(ui_from, ui_to), total)
+        hi = self._ui_to_data_index(min(ui_from, ui_to), total)
+        if lo < 0 or hi >= total or lo >= hi: return d
+
+        range_layers = layers[lo:hi + 1]
+        enabled = [l for l in range_layers if l.get("enabled", True)]
+        disabled = [l for l in range_layers if not l.get("enabled", True)]
+        if len(enabled) < 2:
+            rt.print("⚠️ [Merge] Need at least two enabled layers in range.")
+            return d
+
+        includes_base = not any(l.get("enabled", True) for l in layers[:lo])
+        terms = _compose_layer_range(enabled, includes_base)
+        merged = {"name": range_layers[0].get("name", "Merged"), "opacity": 1.0, "enabled": True,
+                  "mask": None, "mask_enabled": True, "blend_mode": "Overwrite", "weights": {}}
+
+        # Identity terms (k = 1, m = 0) do not change the composite.
+        terms = {v: t for v, t in terms.items() if t[0] < 1.0 - 1e-9 or any(abs(w) > 1e-12 for w in t[1].values())}
+        ks = {round(t[0], 9) for t in terms.values()}
+        if includes_base: ks = {0.0}
+
+        if len(ks) <= 1:
+            k = ks.pop() if ks else 0.0
+            if k <= 1e-9: merged["blend_mode"], scale = "Overwrite", 1.0
+            elif k >= 1.0 - 1e-9: merged["blend_mode"], scale = "Add", 1.0
+            else: merged["blend_mode"], merged["opacity"], scale = "Normal", 1.0 - k, 1.0 / (1.0 - k)
+            for v_idx, (_, m) in terms.items():
+                items = [(b, w * scale) for b, w in m.items() if abs(w) > 1e-12]
+                merged["weights"][str(v_idx)] = [[b for b, _ in items], [w for _, w in items]]
+        else:
+            # Mixed per-vertex k: bake the raw composite of touched verts (exact, but lower-layer edits
+            # under those verts no longer show through).
+            rt.print("ℹ️ [Merge] Mixed blend factors, baking composite for touched vertices.")
+            baked = _composite_layers(layers[:hi + 1], only_verts=list(terms.keys())) or {}
+            for v_idx in terms:
+                items = [(b, w) for b, w in baked.get(v_idx, {}).items() if abs(w) > 1e-12]
+                merged["weights"][str(v_idx)] = [[b for b, _ in items], [w for _, w in items]]
+
+        layers[lo:hi + 1] = [merged] + disabled
+        self.save_layer_data_to_scene(d)
+        rt.print(f"✅ [Merge] {len(enabled)} layers -> '{merged['name']}' ({merged['blend_mode']}, {len(terms)} verts)")
+        return d
+
     def add_mask_to_layer(self, ui_index: int) -> dict:
         d = self.get_layer_data_from_scene()
         idx = self._ui_to_data_index(ui_index, len(d['layers']))
@@ -739,6 +1102,7 @@ class SkinLayerController:
         if 0 <= idx < len(d['layers']) and 'mask' in d['layers'][idx]:
             d['layers'][idx]['mask'] = None
             d['layers'][idx]['mask_enabled'] = True
+            d['layers'][idx].pop('opacity_map', None)
             self.save_layer_data_to_scene(d)
         return d
 
@@ -763,7 +1127,12 @@ class SkinLayerController:
                 m[sid] = sorted(list(s))
             elif sid in m:
                 del m[sid]
+            # A map that can't be rebuilt for the new mask would be stale: drop it.
+            if l.get('opacity_map') and not (m and idx > 0 and self._ensure_topology()):
+                l.pop('opacity_map', None)
             self.save_layer_data_to_scene(d)
+            if l.get('opacity_map'):
+                return self.generate_opacity_map(ui_index, l['opacity_map'].get('feather', 3))
         return d
 
     def get_mask_verts_for_bone(self, ui_index: int, bid: int) -> list:
@@ -772,6 +1141,53 @@ class SkinLayerController:
         if 0 <= idx < len(d['layers']): return d['layers'][idx].get('mask', {}).get(str(bid), [])
         return []
 
+    def generate_opacity_map(self, ui_index: int, feather: int = 3) -> dict:
+        """
+        Builds a soft opacity map from the layer mask: vertices 'feather' rings or more inside the
+        mask border get 1.0, border rings ramp down. Feathers inward so every ramped vertex has layer data.
+        """
+        d = self.get_layer_data_from_scene()
+        idx = self._ui_to_data_index(ui_index, len(d['layers']))
+        if not (0 < idx < len(d['layers'])): return d
+        layer = d['layers'][idx]
+        mask = layer.get('mask')
+        if not mask:
+            rt.print("⚠️ [Feather] Layer has no mask verts.")
+            return d
+        if not self._ensure_topology(): return d
+
+        inside = set()
+        for v_list in mask.values(): inside.update(v_list)
+        topo = self.topology_cache
+        neighbors = lambda v: topo[v - 1] if 0 < v <= len(topo) else ()
+
+        # Ring 0 = mask verts touching the outside, then BFS inward.
+        ring = {v: 0 for v in inside if any(n not in inside for n in neighbors(v))}
+        frontier = list(ring)
+        for r in range(1, max(1, feather)):
+            nxt = []
+            for v in frontier:
+                for n in neighbors(v):
+                    if n in inside and n not in ring:
+                        ring[n] = r
+                        nxt.append(n)
+            frontier = nxt
+            if not frontier: break
+
+        feather = max(1, feather)
+        values = {v: (ring[v] + 1) / (feather + 1) if v in ring else 1.0 for v in inside}
+        layer['opacity_map'] = _encode_opacity_map(values, feather)
+        self.save_layer_data_to_scene(d)
+        rt.print(f"✅ [Feather] {len(ring)} border verts feathered over {feather} rings.")
+        return d
+
+    def clear_opacity_map(self, ui_index: int) -> dict:
+        d = self.get_layer_data_from_scene()
+        idx = self._ui_to_data_index(ui_index, len(d['layers']))
+        if 0 < idx < len(d['layers']) and d['layers'][idx].pop('opacity_map', None) is not None:
+            self.save_layer_data_to_scene(d)
+        return d
+
     def set_layer_blend_mode(self, ui_index: int, mode: str) -> dict:
         d = self.get_layer_data_from_scene()
         idx = self._ui_to_data_index(ui_index, len(d['layers']))
@@ -788,8 +1204,15 @@ class SkinLayerController:
             return None
 
     def get_skin_bone_data_for_ui(self):
-        from utils.ohcha_max_utils import get_skin_bone_data
-        return get_skin_bone_data(self.native_skin_mod)
+        """Cached rows (same list object while the bone list is unchanged). Treat as read-only."""
+        if self.bone_table is None: return get_skin_bone_data(self.native_skin_mod)
+        self.bone_table.refresh(self.native_skin_mod, self.node)
+        return self.bone_table.as_dicts()
+
+    def get_bone_names(self) -> list[str]:
+        if self.bone_table is None: return [b['name'] for b in get_skin_bone_data(self.native_skin_mod)]
+        self.bone_table.refresh(self.native_skin_mod, self.node)
+        return self.bone_table.names
 
 
 skin_controller_instance = SkinLayerController()
\ No newline at end of file
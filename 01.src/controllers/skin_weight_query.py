@@ -0,0 +1,56 @@
+# ohCHA_RigManager/01/src/controllers/skin_weight_query.py
+# Description: [v1.0] Bulk Weight Query Engine.
+#              - Answers influence / bone-usage / threshold questions from the
+#                composite weights cached by SkinLayerController (no pymxs calls).
+
+import collections
+
+
+class SkinWeightQuery:
+    """
+    Composite weights ({vert_id: (bone_ids, weights)}) 위에서 동작하는 조회 엔진.
+    생성 시 한 번의 패스로 본별 사용 통계를 만들고, 이후 질의는 모두 메모리에서 처리합니다.
+    """
+
+    def __init__(self, composite_weights: dict):
+        self._weights = composite_weights or {}
+
+        vert_counts = collections.Counter()
+        total_weights = collections.defaultdict(float)
+        for bones, weights in self._weights.values():
+            vert_counts.update(bones)
+            for b, w in zip(bones, weights):
+                total_weights[b] += w
+
+        self._vert_counts = vert_counts
+        self._total_weights = total_weights
+
+    def is_empty(self) -> bool:
+        return not self._weights
+
+    def influences(self, vert_ids) -> set:
+        """Returns the set of bone ids influencing any of the given vertices."""
+        w = self._weights
+        return set().union(*(w[v][0] for v in vert_ids if v in w))
+
+    def bone_usage(self) -> dict:
+        """Returns {bone_id: (vertex_count, total_weight)} for every weighted bone."""
+        return {b: (cnt, self._total_weights[b]) for b, cnt in self._vert_counts.items()}
+
+    def used_bones(self) -> set:
+        return set(self._vert_counts)
+
+    def unused_bones(self, all_bone_ids) -> list[int]:
+        """Returns the bone ids from 'all_bone_ids' that carry no weight at all."""
+        used = self._vert_counts
+        return [b for b in all_bone_ids if b not in used]
+
+    def weights_below(self, threshold: float, vert_ids=None) -> dict:
+        """Returns {vert_id: [bone_id, ...]} for influences whose weight is <= threshold."""
+        w = self._weights
+        source = w.items() if vert_ids is None else ((v, w[v]) for v in vert_ids if v in w)
+        result = {}
+        for v, (bones, weights) in source:
+            low = [b for b, val in zip(bones, weights) if val <= threshold]
+            if low: result[v] = low
+        return result
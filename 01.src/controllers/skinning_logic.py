@@ -1,30 +1,22 @@
 # ohCHA_RigManager/01.src/controllers/skinning_logic.py
-# Description: [v20.96] Support .mse/.ms/.txt Loading.
+# Description: [v20.97] MaxScript loading goes through the central mxs_loader (load once, reload on change).
 
 import os
 from pymxs import runtime as rt
 
 try:
-    from utils.paths import find_script_path
+    from utils.mxs_loader import mxs_loader
 except ImportError:
-    find_script_path = lambda x: None
+    mxs_loader = None
+    rt.print("❌ [SkinLogic] 'mxs_loader' 임포트 실패")
 
 def _ensure_script_loaded():
     """
-    MaxScript 로직 파일을 찾아 로드합니다.
+    MaxScript 로직 파일을 (최초 1회 / 파일 변경 시에만) 로드합니다.
     우선순위: .mse > .ms > .txt
     """
-    path = find_script_path("ohcha_skin_logic")
-    if path:
-        try:
-            rt.fileIn(path)
-            return True
-        except Exception as e:
-            rt.print(f"❌ [SkinLogic] MS Load Error: {e}")
-            return False
-    else:
-        rt.print(f"❌ [SkinLogic] Script file missing: ohcha_skin_logic")
-        return False
+    if mxs_loader is None: return hasattr(rt, "ohCHA_SkinLogic")
+    return mxs_loader.require("ohcha_skin_logic")
 
 def hide_selection(hide_type: str, hide_unselected: bool):
     if not _ensure_script_loaded(): return
@@ -0,0 +1,217 @@
+# ohCHA_RigManager/01/src/controllers/weight_clipboard.py
+# Description: [v1.1] Multi-Source Weight Clipboard.
+#              - Captures many vertices at once from the cached composite (no skinOps calls).
+#              - FIXED: Bone ids are skin-local: the source bone names are captured too and paste maps them
+#                to the target skin's ids by name (missing bones are reported, see missing_bones).
+#              - Paste Modes: average / nearest (grid hash on positions) / index.
+#              - FIXED: 'auto' only picks index when the ids match or the source is the same mesh (same node or
+#                vertex count); otherwise nearest. Nearest aligns a disjoint target bbox onto the source bbox and
+#                walks only the shell cells of each ring, clamped to the grid bounds.
+
+import collections
+import math
+
+PASTE_MODES = ("auto", "average", "nearest", "index")
+
+
+class WeightClipboard:
+    """
+    복사된 버텍스 웨이트 저장소. 노드가 바뀌어도 유지되므로 캐릭터 간 복사에 사용할 수 있습니다.
+    entries: {vert_id: (bone_ids, weights)}, positions: {vert_id: (x, y, z)} (Local Space)
+    bone_names: source skin bone names (bone id b -> bone_names[b - 1]); empty = ids are used as-is.
+    """
+
+    def __init__(self):
+        self.clear()
+
+    def clear(self):
+        self.entries = {}
+        self.positions = {}
+        self.source_name = ""
+        self.source_vert_count = 0
+        self.bone_names = []
+        self._grid = None
+
+    def is_empty(self) -> bool:
+        return not self.entries
+
+    def capture(self, weights_map: dict, vert_ids, positions=None, source_name: str = "", bone_names=None) -> int:
+        """
+        Stores weights (and positions, if given) for every vertex of 'vert_ids' found in 'weights_map'.
+        bone_names: the source skin's bone names, so the weights can be pasted onto another skin.
+        """
+        self.clear()
+        for v in vert_ids:
+            entry = weights_map.get(v)
+            if entry and entry[0]:
+                self.entries[v] = (list(entry[0]), list(entry[1]))
+        if positions:
+            self.positions = {v: positions[v - 1] for v in self.entries if 0 < v <= len(positions)}
+        self.source_name = source_name
+        self.source_vert_count = len(positions) if positions else 0
+        self.bone_names = list(bone_names or [])
+        return len(self.entries)
+
+    def used_bone_ids(self) -> set:
+        return {b for bones, _ in self.entries.values() for b in bones}
+
+    def missing_bones(self, target_bone_names) -> list[str]:
+        """Names of copied bones (with weight) that the target skin doesn't have."""
+        if not self.bone_names: return []
+        target = set(target_bone_names)
+        missing = []
+        for b in sorted(self.used_bone_ids()):
+            name = self.bone_names[b - 1] if 0 < b <= len(self.bone_names) else f"#{b}"
+            if name not in target: missing.append(name)
+        return missing
+
+    def _bone_map(self, target_bone_names) -> dict | None:
+        """source bone id -> target bone id (by name). None = no remap (no names on either side)."""
+        if not self.bone_names or target_bone_names is None: return None
+        target_ids = {}
+        for i, name in enumerate(target_bone_names):
+            target_ids.setdefault(name, i + 1)
+        return {b: target_ids.get(self.bone_names[b - 1]) if 0 < b <= len(self.bone_names) else None
+                for b in self.used_bone_ids()}
+
+    def resolve(self, mode: str, target_verts, target_positions=None, target_bone_names=None,
+                target_name: str = "") -> dict:
+        """
+        Returns {target_vert: (bone_ids, weights)} for the requested paste mode.
+        With target_bone_names the bone ids are those of the target skin (bones it lacks are left out;
+        check missing_bones() first). target_positions: every vertex of the target mesh (Local Space).
+        """
+        if not self.entries or not target_verts: return {}
+        if mode == "auto": mode = self._pick_auto_mode(target_verts, target_positions, target_name)
+
+        if mode == "index": result = self._resolve_index(target_verts)
+        elif mode == "nearest" and target_positions and self.positions:
+            result = self._resolve_nearest(target_verts, target_positions)
+        else:
+            avg = self.average()
+            result = {v: avg for v in target_verts} if avg[0] else {}
+
+        bone_map = self._bone_map(target_bone_names)
+        if bone_map is None: return result
+        return {v: e for v, e in ((v, self._remap_entry(e, bone_map)) for v, e in result.items()) if e[0]}
+
+    @staticmethod
+    def _remap_entry(entry, bone_map) -> tuple:
+        accum = collections.OrderedDict()
+        for b, w in zip(*entry):
+            t = bone_map.get(b)
+            if t is not None: accum[t] = accum.get(t, 0.0) + w
+        return (list(accum), list(accum.values()))
+
+    def _same_mesh(self, target_positions, target_name: str) -> bool:
+        if target_name and target_name == self.source_name: return True
+        return bool(self.source_vert_count and target_positions) and len(target_positions) == self.source_vert_count
+
+    def _pick_auto_mode(self, target_verts, target_positions, target_name: str = "") -> str:
+        # Index mapping is only meaningful between the same vertex ids / the same mesh.
+        if len(self.entries) == 1: return "average"
+        if set(target_verts) == self.entries.keys(): return "index"
+        if len(target_verts) == len(self.entries) and self._same_mesh(target_positions, target_name): return "index"
+        if target_positions and self.positions: return "nearest"
+        return "average"
+
+    def average(self) -> tuple:
+        accum = collections.defaultdict(float)
+        for bones, weights in self.entries.values():
+            for b, w in zip(bones, weights): accum[b] += w
+        total = sum(accum.values())
+        if total < 1e-6: return ([], [])
+        items = sorted(accum.items(), key=lambda x: x[1], reverse=True)
+        return ([b for b, _ in items], [w / total for _, w in items])
+
+    def _resolve_index(self, target_verts) -> dict:
+        # Same ids -> direct copy. Same count -> ordinal mapping (sorted order) onto the matching selection.
+        if all(v in self.entries for v in target_verts):
+            return {v: self.entries[v] for v in target_verts}
+        if len(target_verts) == len(self.entries):
+            return dict(zip(sorted(target_verts), (self.entries[v] for v in sorted(self.entries))))
+        return {v: self.entries[v] for v in target_verts if v in self.entries}
+
+    # --- Nearest (Uniform Grid Hash) ---
+    def _build_grid(self):
+        pts = self.positions
+        xs = [p[0] for p in pts.values()]
+        ys = [p[1] for p in pts.values()]
+        zs = [p[2] for p in pts.values()]
+        extent = max(max(xs) - min(xs), max(ys) - min(ys), max(zs) - min(zs), 1e-4)
+        cell = max(extent / max(1.0, len(pts) ** (1.0 / 3.0)), 1e-4)
+
+        grid = collections.defaultdict(list)
+        for v, p in pts.items():
+            grid[(int(math.floor(p[0] / cell)), int(math.floor(p[1] / cell)), int(math.floor(p[2] / cell)))].append(v)
+        keys = list(grid.keys())
+        lo = tuple(min(k[i] for k in keys) for i in range(3))
+        hi = tuple(max(k[i] for k in keys) for i in range(3))
+        self._grid = (cell, grid, lo, hi)
+
+    @staticmethod
+    def _shell(c, r, lo, hi):
+        """Cells at Chebyshev distance r from c, clipped to the grid bounds [lo, hi]."""
+        cx, cy, cz = c
+        if r == 0:
+            yield c
+            return
+        ys = range(max(cy - r, lo[1]), min(cy + r, hi[1]) + 1)
+        zs = range(max(cz - r, lo[2]), min(cz + r, hi[2]) + 1)
+        for x in (cx - r, cx + r):
+            if lo[0] <= x <= hi[0]:
+                for y in ys:
+                    for z in zs: yield (x, y, z)
+        for x in range(max(cx - r + 1, lo[0]), min(cx + r - 1, hi[0]) + 1):
+            for y in (cy - r, cy + r):
+                if lo[1] <= y <= hi[1]:
+                    for z in zs: yield (x, y, z)
+            for y in range(max(cy - r + 1, lo[1]), min(cy + r - 1, hi[1]) + 1):
+                for z in (cz - r, cz + r):
+                    if lo[2] <= z <= hi[2]: yield (x, y, z)
+
+    def _nearest(self, p) -> int | None:
+        cell, grid, lo, hi = self._grid
+        # Start from the grid cell closest to p: rings beyond the grid bounds are empty.
+        c = tuple(min(max(int(math.floor(p[i] / cell)), lo[i]), hi[i]) for i in range(3))
+        max_ring = max(max(c[i] - lo[i], hi[i] - c[i]) for i in range(3))
+        best_v, best_d = None, float("inf")
+        for r in range(max_ring + 1):
+            for key in self._shell(c, r, lo, hi):
+                for v in grid.get(key, ()):
+                    q = self.positions[v]
+                    d = (q[0] - p[0]) ** 2 + (q[1] - p[1]) ** 2 + (q[2] - p[2]) ** 2
+                    if d < best_d: best_v, best_d = v, d
+            # Any point in ring r+1 is at least r * cell away (also from a p clamped onto the grid).
+            if best_v is not None and best_d <= (r * cell) ** 2: break
+        return best_v
+
+    def _align_to_source(self, pts: dict) -> dict:
+        """
+        Copy between characters: when the target points' bbox doesn't overlap the source bbox, each axis
+        of the target bbox is mapped onto the source bbox (flat axes are only centered).
+        """
+        src = list(self.positions.values())
+        s_lo = [min(q[i] for q in src) for i in range(3)]
+        s_hi = [max(q[i] for q in src) for i in range(3)]
+        t_lo = [min(q[i] for q in pts.values()) for i in range(3)]
+        t_hi = [max(q[i] for q in pts.values()) for i in range(3)]
+        if all(t_lo[i] <= s_hi[i] and s_lo[i] <= t_hi[i] for i in range(3)): return pts
+
+        scale, offset = [], []
+        for i in range(3):
+            t_ext, s_ext = t_hi[i] - t_lo[i], s_hi[i] - s_lo[i]
+            k = s_ext / t_ext if t_ext > 1e-6 and s_ext > 1e-6 else 1.0
+            scale.append(k)
+            offset.append((s_lo[i] + s_hi[i]) * 0.5 - (t_lo[i] + t_hi[i]) * 0.5 * k)
+        return {v: tuple(q[i] * scale[i] + offset[i] for i in range(3)) for v, q in pts.items()}
+
+    def _resolve_nearest(self, target_verts, target_positions) -> dict:
+        if self._grid is None: self._build_grid()
+        pts = {v: target_positions[v - 1] for v in target_verts if 0 < v <= len(target_positions)}
+        if not pts: return {}
+        result = {}
+        for v, p in self._align_to_source(pts).items():
+            src = self._nearest(p)
+            if src is not None: result[v] = self.entries[src]
+        return result
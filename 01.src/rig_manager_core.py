@@ -1,5 +1,11 @@
 # ohCHA_RigManager/01/src/rig_manager_core.py
-# Description: [v22.01] CORE FINAL.
+# Description: [v22.04] CORE FINAL.
+#              - PERF: Edit Mesh fixes / finalize on several meshes run as one batch (one undo record).
+#              - PERF: PRODUCTION_MODE startup (no reloads, tabs built on first activation) + timing breakdown.
+#              - FIXED: The startup timer is reset per window; module imports only count for the first window.
+#              - PERF: Max selection sync is event driven (MaxEventBridge) instead of a 200 ms poll.
+#              - FIXED: Skin bone-list picks raise no Max callback -> a 200 ms skinOps.GetSelectedBone poll runs
+#                only while the Skin modifier is the modpanel object and the Skinning tab is shown.
 #              - COMPATIBILITY: Updated to support Refactored SkinningTab (v22.01).
 #              - SIGNAL: Explicitly maps signals from split widgets (Hide/Utils/Layer).
 
@@ -16,8 +22,12 @@ from PySide6.QtGui import *
 rt.print("✅ [Import Check] Loading rig_manager_core...")
 
 try:
+    from utils.ohcha_timing import startup_timer
+    startup_timer.reset()
+    from utils.config import PRODUCTION_MODE
+
     import utils.translator
-    importlib.reload(utils.translator)
+    if not PRODUCTION_MODE: importlib.reload(utils.translator)
     translator = utils.translator.translator
 
     # ⭐️ Essential Utils
@@ -27,8 +37,10 @@ try:
     from controllers import main_logic, edit_mesh_logic, skinning_logic, commands
     from controllers.skin_layer_controller import skin_controller_instance
     from controllers.group_controller import group_controller_instance
-    from controllers import rigging_controller
-    importlib.reload(rigging_controller)
+    from controllers.group_rules import group_rule_engine
+    if not PRODUCTION_MODE:
+        from controllers import rigging_controller
+        importlib.reload(rigging_controller)
 
     # ⭐️ Config & UI Base
     from utils.paths import get_project_root, get_icon_path
@@ -41,6 +53,10 @@ try:
     )
     from ui.ohcha_ui_base import OchaBaseWindow, show_tool_instance
     from ui.ohcha_ui_widgets import OchaLanguageMenu
+    from utils.ohcha_event_bridge import MaxEventBridge, EVT_SCENE, EVT_MODPANEL
+    from utils.mxs_loader import mxs_loader
+    # Imports run once per module load (PRODUCTION_MODE never reloads): reported by the first window only.
+    _import_seconds = startup_timer.mark("imports")
 
 except ImportError as e:
     rt.print(f"❌ [Import Error] CRITICAL: A module failed to load: {e}")
@@ -51,12 +67,18 @@ except ImportError as e:
 def import_class_from_path(path):
     module_name, class_name = path.rsplit('.', 1)
     module = importlib.import_module(module_name)
-    importlib.reload(module)
+    if not PRODUCTION_MODE: importlib.reload(module)
     return getattr(module, class_name)
 
 
 class RigManagerWindow(OchaBaseWindow):
     def __init__(self):
+        global _import_seconds
+        startup_timer.reset()
+        if _import_seconds is not None:
+            startup_timer.add("imports", _import_seconds)
+            _import_seconds = None
+
         # 1. Load Language Setting
         initial_lang = "en"
         try:
@@ -79,13 +101,22 @@ class RigManagerWindow(OchaBaseWindow):
         self.resize(540, 650) # Slightly taller for split UI
         self._is_sidebar_expanded = True
 
-        # Sync Timer (Max Selection -> UI)
-        self.sync_timer = QTimer(self)
-        self.sync_timer.setInterval(200)
-        self.sync_timer.timeout.connect(self._sync_max_selection_to_ui)
-        self.sync_timer.start()
+        # Max Selection -> UI (event driven; callbacks are only registered while the window is shown)
+        self.event_bridge = MaxEventBridge(self)
+        self.event_bridge.eventsPosted.connect(self._on_max_events)
         self._last_selected_bone_id = -1
 
+        # Bone picks in the Skin modifier's list raise no callback: cheap fallback poll, gated by _update_bone_poll()
+        self.bone_poll_timer = QTimer(self)
+        self.bone_poll_timer.setInterval(200)
+        self.bone_poll_timer.timeout.connect(self._sync_max_selection_to_ui)
+
+        # Group persistence is lazy: mutations only mark dirty, this debounced timer writes the file.
+        self.group_save_timer = QTimer(self)
+        self.group_save_timer.setSingleShot(True)
+        self.group_save_timer.setInterval(1500)
+        self.group_save_timer.timeout.connect(group_controller_instance.flush)
+
         # UI Components
         self.logo = QLabel("ohCHA")
         self.logo.setObjectName("SidebarLogo")
@@ -99,21 +130,17 @@ class RigManagerWindow(OchaBaseWindow):
         self.lang_menu.cur = initial_lang
         self.lang_menu._upd_btn()
 
-        self.tabs = {}
+        self.tabs = {}           # built tabs only (lazy in PRODUCTION_MODE)
+        self._tab_configs = {}
         self.btns = {}
         self.btn_group = QButtonGroup(self)
         self.btn_group.setExclusive(True)
+        startup_timer.mark("window base")
 
-        # Dynamic Tab Loading
+        # Sidebar buttons for every configured tab; the tab widgets are built by _ensure_tab()
         for t_config in TABS_CONFIG:
             tid = t_config["id"]
-            try:
-                TabClass = import_class_from_path(t_config["cls_path"])
-                self.tabs[tid] = TabClass()
-            except Exception as e:
-                rt.print(f"❌ Failed to load tab '{tid}': {e}")
-                traceback.print_exc()
-                continue
+            self._tab_configs[tid] = t_config
 
             btn = QPushButton()
             btn.setCheckable(True)
@@ -129,13 +156,54 @@ class RigManagerWindow(OchaBaseWindow):
 
         self._setup_ui()
         self._connect()
+        startup_timer.mark("sidebar / layout")
+
+        for tid in self._tab_configs:
+            if not PRODUCTION_MODE or tid == DEFAULT_TAB_ID:
+                self._ensure_tab(tid)
         self.retranslate()
+        startup_timer.mark("retranslate")
 
         # Set Default Tab
-        if DEFAULT_TAB_ID in self.btns:
+        default_tab = self.tabs.get(DEFAULT_TAB_ID)
+        if default_tab is not None:
             self.btns[DEFAULT_TAB_ID].setChecked(True)
-            self.stack.setCurrentWidget(self.tabs[DEFAULT_TAB_ID])
+            self.stack.setCurrentWidget(default_tab)
             QTimer.singleShot(100, lambda: self.adjustSize())
+        startup_timer.report()
+        if not PRODUCTION_MODE: mxs_loader.report()
+
+    def _ensure_tab(self, tid):
+        """Builds, stacks and wires a tab on first use. Returns None if the tab failed to load."""
+        if tid in self.tabs: return self.tabs[tid]
+        t_config = self._tab_configs.get(tid)
+        if not t_config: return None
+        try:
+            with startup_timer.stage(f"build tab '{tid}'"):
+                TabClass = import_class_from_path(t_config["cls_path"])
+                tab = TabClass()
+        except Exception as e:
+            rt.print(f"❌ Failed to load tab '{tid}': {e}")
+            traceback.print_exc()
+            self.btns[tid].setEnabled(False)
+            return None
+
+        self.tabs[tid] = tab
+        self.stack.addWidget(tab)
+        self._connect_tab(tid, tab)
+        if hasattr(tab, 'retranslate_ui'):
+            try: tab.retranslate_ui()
+            except Exception as e: rt.print(f"⚠️ [Retranslate] Error: {e}")
+        if PRODUCTION_MODE and tid != DEFAULT_TAB_ID:
+            label, dt = startup_timer.stages[-1]
+            rt.print(f"🕒 [Startup] {label}: {dt * 1000:.1f} ms")
+        return tab
+
+    def _on_sidebar_clicked(self, tid):
+        tab = self._ensure_tab(tid)
+        if tab is None: return
+        self._on_tab_changed(tab)
+        if tid == "skinning": self._on_skin_tab_selected()
 
     def _setup_ui(self):
         self.sidebar = QWidget()
@@ -173,9 +241,6 @@ class RigManagerWindow(OchaBaseWindow):
         self.stack = QStackedWidget()
         self.stack.setSizePolicy(QSizePolicy.Policy.Preferred, QSizePolicy.Policy.Preferred)
 
-        for t in self.tabs.values():
-            self.stack.addWidget(t)
-
         main_l = QHBoxLayout(self)
         main_l.setContentsMargins(0, 0, 0, 0)
         main_l.setSpacing(0)
@@ -189,26 +254,23 @@ class RigManagerWindow(OchaBaseWindow):
         self.lang_menu.languageChanged.connect(self.on_language_changed)
 
         for tid, btn in self.btns.items():
-            btn.clicked.connect(lambda checked=False, widget=self.tabs[tid]: self._on_tab_changed(widget))
-            if tid == "skinning":
-                btn.clicked.connect(self._on_skin_tab_selected)
+            btn.clicked.connect(lambda checked=False, tab_id=tid: self._on_sidebar_clicked(tab_id))
 
+    def _connect_tab(self, tid, t):
         # ========================================================
         # [Tab Connection] Edit Mesh
         # ========================================================
-        if "edit_mesh" in self.tabs:
-            t = self.tabs["edit_mesh"]
+        if tid == "edit_mesh":
             t.refreshRequested.connect(t._on_refresh)
             t.fixScaleRequested.connect(lambda n: self._run_command(commands.FixScaleCommand(n)))
             t.fixSkinRequested.connect(lambda n: self._run_command(commands.FixSkinCommand(n)))
             t.fixPivotRequested.connect(lambda n: self._run_command(commands.FixPivotCommand(n)))
-            t.finalizeRequested.connect(self._on_edit_finalize)
+            t.batchRequested.connect(self._on_edit_batch)
 
         # ========================================================
         # [Tab Connection] Skinning (Refactored)
         # ========================================================
-        if "skinning" in self.tabs:
-            t = self.tabs["skinning"]
+        if tid == "skinning":
             
             # 1. Hide Manager Signals
             t.hideSelectionRequested.connect(lambda type, uns: self._run_simple(commands.SkinHideCommand(type, uns)))
@@ -248,6 +310,9 @@ class RigManagerWindow(OchaBaseWindow):
                 explorer.removeGroupClicked.connect(self._on_remove_group)
                 explorer.renameGroupClicked.connect(self._on_rename_group)
                 explorer.assignBonesClicked.connect(self._on_assign_bones)
+                explorer.rulePresetsRequested.connect(lambda e=explorer: e.set_rule_presets(group_rule_engine.list_presets()))
+                explorer.applyRulePresetClicked.connect(self._on_apply_rule_preset)
+                explorer.saveRulePresetClicked.connect(self._on_save_rule_preset)
                 explorer.removeInfluenceRequested.connect(t._on_remove_bone_influence)
 
             # 6. Layer Manager Signals
@@ -266,6 +331,10 @@ class RigManagerWindow(OchaBaseWindow):
                 mgr.paintBlendToggled.connect(self._on_skin_paint_blend_toggled)
                 mgr.blendModeChanged.connect(self._on_skin_blend_mode_changed)
                 mgr.collapseLayersClicked.connect(self._on_skin_collapse_layers)
+                mgr.mergeDownClicked.connect(self._on_skin_merge_down)
+                mgr.collapseRangeClicked.connect(self._on_skin_collapse_range)
+                mgr.featherMaskClicked.connect(self._on_skin_feather_mask)
+                mgr.clearFeatherClicked.connect(self._on_skin_clear_feather)
                 mgr.addMaskToLayerClicked.connect(self._on_skin_add_mask_to_layer)
                 mgr.removeMaskFromLayerClicked.connect(self._on_skin_remove_mask_from_layer)
                 mgr.updateMaskDataClicked.connect(self._on_skin_update_mask_data)
@@ -277,6 +346,8 @@ class RigManagerWindow(OchaBaseWindow):
 
     def _on_tab_changed(self, widget):
         self.stack.setCurrentWidget(widget)
+        if widget == self.tabs.get("skinning"): self._sync_max_selection_to_ui()
+        self._update_bone_poll()
         QTimer.singleShot(50, lambda: self.adjustSize())
 
     def _toggle_side(self):
@@ -334,11 +405,46 @@ class RigManagerWindow(OchaBaseWindow):
         self._update_side_text()
         QTimer.singleShot(50, lambda: self.adjustSize())
 
-    def _sync_max_selection_to_ui(self):
+    def showEvent(self, event):
+        super().showEvent(event)
+        self.event_bridge.start()
+        self._sync_max_selection_to_ui()
+        self._update_bone_poll()
+
+    def hideEvent(self, event):
+        self.event_bridge.stop()
+        self.bone_poll_timer.stop()
+        super().hideEvent(event)
+
+    def changeEvent(self, event):
+        # Returning from the Skin bone list: catch bone picks that raised no Max notification.
+        if event.type() == QEvent.Type.ActivationChange and self.isActiveWindow():
+            self._sync_max_selection_to_ui()
+        super().changeEvent(event)
+
+    def _on_max_events(self, events):
+        if EVT_SCENE in events: self._last_selected_bone_id = -1
+        self._sync_max_selection_to_ui()
+        if EVT_SCENE in events or EVT_MODPANEL in events: self._update_bone_poll()
+
+    def _is_skin_panel_active(self):
+        """Skinning tab shown and the session's Skin modifier is the current modpanel object."""
         if not skin_controller_instance.node or self.stack.currentWidget() != self.tabs.get("skinning"):
-            return
+            return False
+        try:
+            return rt.modPanel.getCurrentObject() == skin_controller_instance.native_skin_mod
+        except Exception:
+            return False
+
+    def _update_bone_poll(self):
+        if self.isVisible() and self._is_skin_panel_active():
+            if not self.bone_poll_timer.isActive(): self.bone_poll_timer.start()
+        else:
+            self.bone_poll_timer.stop()
+
+    def _sync_max_selection_to_ui(self):
         try:
-            if rt.modPanel.getCurrentObject() == skin_controller_instance.native_skin_mod:
+            if self._is_skin_panel_active():
                 current_bone_id = rt.skinOps.GetSelectedBone(skin_controller_instance.native_skin_mod)
                 if current_bone_id != self._last_selected_bone_id:
                     self._last_selected_bone_id = current_bone_id
@@ -359,21 +465,21 @@ class RigManagerWindow(OchaBaseWindow):
         try: cmd.execute()
         except OchaError as e: QMessageBox.warning(self.window(), translator.get("title_error"), str(e))
 
-    def _on_edit_finalize(self, node, opts):
-        queue, log = [], []
-        if opts["lock_transforms"]: queue.append(commands.LockTransformCommand(node))
-        if opts["enable_inheritance"]: queue.append(commands.EnableInheritanceCommand(node))
-        if opts["add_skin"]: queue.append(commands.AddSkinCommand(node, opts["bone_limit"], opts["use_dq"]))
-        ok = True
-        try:
-            for c in queue:
-                if c.execute(): log.append(f"✅ {c.name}")
-                else: ok = False; log.append(f"❌ {c.name}"); break
-        except OchaError as e: ok = False; QMessageBox.warning(self.window(), translator.get("title_error"), str(e))
-        except Exception as e: ok = False; QMessageBox.critical(self.window(), translator.get("title_error"), str(e))
-        rt.print("\n".join(log))
-        if ok: QMessageBox.information(self.window(), translator.get("msg_done"), translator.get("msg_finalize_comp") + "\n\n" + "\n".join(log))
-        if "edit_mesh" in self.tabs: self.tabs["edit_mesh"]._on_refresh()
+    def _on_edit_batch(self, nodes, ops, opts):
+        # Fixes / finalize for all given meshes: one MaxScript call, one undo record, per-node results.
+        if not nodes or not ops: return
+        cmd = commands.BatchMeshCommand(nodes, ops, opts.get("bone_limit", 4), opts.get("use_dq", False))
+        ok = cmd.execute()
+        log = self.tabs["edit_mesh"].apply_batch_results(cmd.results) if "edit_mesh" in self.tabs else []
+        rt.print("\n".join([f"{'✅' if ok else '⚠️'} {cmd.name}"] + log))
+        if not cmd.results:
+            QMessageBox.warning(self.window(), translator.get("title_error"), f"{cmd.name} Failed")
+        elif opts or not ok:
+            failed = [l for l in log if l.startswith("❌")]
+            msg = translator.get("msg_batch_result").format(len(cmd.results) - len(failed), len(cmd.results))
+            if opts: msg = translator.get("msg_finalize_comp") + "\n\n" + msg
+            box = QMessageBox.information if ok else QMessageBox.warning
+            box(self.window(), translator.get("msg_done"), msg + ("\n\n" + "\n".join(failed[:20]) if failed else ""))
 
     def _get_selected_node(self):
         if rt.selection.count != 1:
@@ -399,6 +505,7 @@ class RigManagerWindow(OchaBaseWindow):
             skin_tab.layer_manager_widget.set_session_active(False)
             skin_tab.bone_explorer.clear_list()
             skin_tab.bone_explorer.hide()
+        self._update_bone_poll()
 
     def _on_skin_load_layers(self):
         data = skin_controller_instance.get_layer_data_from_scene()
@@ -411,6 +518,7 @@ class RigManagerWindow(OchaBaseWindow):
         if not skin_tab: return
         skin_controller_instance.set_current_node(node)
         group_controller_instance.set_current_node(node)
+        self._update_bone_poll()
 
         if QMessageBox.question(self.window(), translator.get("title_import_base"), translator.get("msg_import_base").format(node.name), QMessageBox.StandardButton.Yes | QMessageBox.StandardButton.No) == QMessageBox.StandardButton.Yes:
             rt.execute(f"select $'{node.name}'; max modify mode")
@@ -433,6 +541,13 @@ class RigManagerWindow(OchaBaseWindow):
         skin_tab.bone_explorer.populate_bones(bone_data)
         if show_on_update: skin_tab.bone_explorer.show()
 
+    def _schedule_group_save(self):
+        if group_controller_instance.is_dirty: self.group_save_timer.start()
+
+    def closeEvent(self, event):
+        group_controller_instance.flush()
+        super().closeEvent(event)
+
     def _on_bone_explorer_view_changed(self):
         self._update_bone_explorer(show_on_update=True)
 
@@ -440,12 +555,14 @@ class RigManagerWindow(OchaBaseWindow):
         text, ok = QInputDialog.getText(self, translator.get("pop_add_group_title"), translator.get("pop_add_group_label"))
         if ok and text:
             if not group_controller_instance.add_group(text): QMessageBox.warning(self, translator.get("title_error"), translator.get("pop_group_exists").format(text))
+            self._schedule_group_save()
             self._update_bone_explorer(True)
 
     def _on_remove_group(self, group_name):
         if not group_name or group_name == "[Ungrouped]": return
         if QMessageBox.question(self, translator.get("pop_remove_group_title"), translator.get("pop_remove_group_msg").format(group_name)) == QMessageBox.StandardButton.Yes:
             group_controller_instance.remove_group(group_name)
+            self._schedule_group_save()
             self._update_bone_explorer(True)
 
     def _on_rename_group(self, old_name):
@@ -453,10 +570,11 @@ class RigManagerWindow(OchaBaseWindow):
         new_name, ok = QInputDialog.getText(self, translator.get("pop_rename_group_title"), translator.get("pop_rename_group_label"), text=old_name)
         if ok and new_name and new_name != old_name:
             if not group_controller_instance.rename_group(old_name, new_name): QMessageBox.warning(self, translator.get("title_error"), translator.get("pop_rename_fail"))
+            self._schedule_group_save()
             self._update_bone_explorer(True)
 
     def _on_assign_bones(self, group_name):
-        if not group_name or group_name == "[Ungrouped]":
+        if not group_name:
             QMessageBox.information(self, translator.get("title_info"), translator.get("pop_assign_select_group"))
             return
         skin_tab = self.tabs.get("skinning")
@@ -465,19 +583,46 @@ class RigManagerWindow(OchaBaseWindow):
         if not selected_bone_ids:
             QMessageBox.information(self, translator.get("title_info"), translator.get("pop_assign_select_bones"))
             return
-        group_controller_instance.assign_bones_to_group(group_name, selected_bone_ids)
+        # Assigning to [Ungrouped] takes the bones out of their groups.
+        if group_name == "[Ungrouped]": group_controller_instance.remove_bones_from_groups(selected_bone_ids)
+        else: group_controller_instance.assign_bones_to_group(group_name, selected_bone_ids)
+        self._schedule_group_save()
+        self._update_bone_explorer(True)
+
+    def _on_apply_rule_preset(self, preset_name):
+        if not skin_controller_instance.node: return
+        rules = group_rule_engine.load_preset(preset_name)
+        if not rules: return
+        # Region rules read bone positions, which the bone table signature does not track.
+        if skin_controller_instance.bone_table: skin_controller_instance.bone_table.invalidate()
+        count = group_rule_engine.apply(rules, skin_controller_instance.get_skin_bone_data_for_ui(), group_controller_instance)
+        rt.print(f"✅ [GroupRules] '{preset_name}': {count} bones grouped.")
+        self._schedule_group_save()
         self._update_bone_explorer(True)
 
+    def _on_save_rule_preset(self):
+        if not skin_controller_instance.node: return
+        name, ok = QInputDialog.getText(self, translator.get("ctx_rules_save"), translator.get("pop_rule_preset_label"))
+        if ok and name:
+            rules = group_rule_engine.rules_from_groups(group_controller_instance.groups_data, skin_controller_instance.get_skin_bone_data_for_ui())
+            if group_rule_engine.save_preset(name, rules): rt.print(f"✅ [GroupRules] Preset saved: {name} ({len(rules)} rules)")
+
     def _on_remove_unused_bones(self):
         if skin_controller_instance.node:
             try:
-                if rt.ohCHA_SkinLogic.removeUnusedBones(): self._update_bone_explorer(True)
+                removed = skin_controller_instance.remove_unused_bones()
+                if removed is None: removed = rt.ohCHA_SkinLogic.removeUnusedBones()
+                if removed:
+                    self._update_bone_explorer(True)
+                    self._update_skin_layer_ui(skin_controller_instance.get_layer_data_from_scene())
             except Exception as e: QMessageBox.critical(self, translator.get("title_error"), f"{e}")
 
     def _on_remove_zero_weights(self):
         if not skin_controller_instance.node: return
         try:
-            if rt.ohCHA_SkinLogic.pruneWeights(0.001): rt.print("✅ Zero weights pruned.")
+            pruned = skin_controller_instance.prune_small_weights(0.001)
+            if pruned is not None: rt.print(f"✅ Zero weights pruned ({pruned} vertices).")
+            elif rt.ohCHA_SkinLogic.pruneWeights(0.001): rt.print("✅ Zero weights pruned.")
         except Exception as e: rt.print(f"❌ Prune Error: {e}")
 
     def _on_save_skin(self):
@@ -526,10 +671,14 @@ class RigManagerWindow(OchaBaseWindow):
             QMessageBox.information(self, translator.get("title_info"), translator.get("pop_find_bone_select_vert"))
             return
         try:
-            all_influences = set()
-            for v_id in vert_indices:
-                influencing_ids = rt.ohCHA_DataUtil.getVertexInfluences(skin_mod, v_id)
-                if influencing_ids: all_influences.update(list(influencing_ids))
+            query = skin_controller_instance.get_weight_query()
+            if query is not None:
+                all_influences = query.influences(vert_indices)
+            else:
+                all_influences = set()
+                for v_id in vert_indices:
+                    influencing_ids = rt.ohCHA_DataUtil.getVertexInfluences(skin_mod, v_id)
+                    if influencing_ids: all_influences.update(list(influencing_ids))
             if not all_influences:
                 QMessageBox.information(self, translator.get("title_info"), translator.get("pop_find_bone_none"))
                 return
@@ -593,7 +742,9 @@ class RigManagerWindow(OchaBaseWindow):
     def _on_weight_clipboard(self, action):
         idx = self._get_active_layer_index()
         if action == "copy": skin_controller_instance.copy_vertex_weights()
-        elif action == "paste": skin_controller_instance.paste_vertex_weights(ui_layer_index=idx)
+        elif action.startswith("paste"):
+            mode = action.split("_", 1)[1] if "_" in action else "auto"
+            skin_controller_instance.paste_vertex_weights(ui_layer_index=idx, mode=mode)
 
     def _on_weight_smooth(self):
         skin_controller_instance.apply_smooth_to_active_layer(ui_layer_index=self._get_active_layer_index())
@@ -692,6 +843,35 @@ class RigManagerWindow(OchaBaseWindow):
             self._on_skin_inject()
             QMessageBox.information(self.window(), translator.get("title_complete"), translator.get("msg_collapse_complete"))
 
+    def _on_skin_merge_down(self, ui_index: int):
+        if not skin_controller_instance.node: return
+        self._update_skin_layer_ui(skin_controller_instance.merge_layer_down(ui_index))
+
+    def _on_skin_collapse_range(self, ui_index: int):
+        if not skin_controller_instance.node: return
+        layers = skin_controller_instance.get_layer_data_from_scene().get("layers", [])
+        total = len(layers)
+        # Candidates: every layer below the selected one (UI order), base included.
+        candidates = [(ui, layers[total - 1 - ui].get("name", "Unnamed")) for ui in range(ui_index + 1, total)]
+        if not candidates: return
+        items = [f"{ui}: {name}" for ui, name in candidates]
+        item, ok = QInputDialog.getItem(self.window(), translator.get("ctx_collapse_range"), translator.get("pop_collapse_range_label"), items, 0, False)
+        if ok and item:
+            ui_to = candidates[items.index(item)][0]
+            self._update_skin_layer_ui(skin_controller_instance.collapse_layer_range(ui_index, ui_to))
+
+    def _on_skin_feather_mask(self, ui_index: int):
+        if not skin_controller_instance.node: return
+        radius, ok = QInputDialog.getInt(self.window(), translator.get("ctx_feather_mask"), translator.get("pop_feather_radius_label"), 3, 1, 50)
+        if ok:
+            self._update_skin_layer_ui(skin_controller_instance.generate_opacity_map(ui_index, radius))
+            self._on_skin_inject()
+
+    def _on_skin_clear_feather(self, ui_index: int):
+        if not skin_controller_instance.node: return
+        self._update_skin_layer_ui(skin_controller_instance.clear_opacity_map(ui_index))
+        self._on_skin_inject()
+
     def _on_skin_add_mask_to_layer(self, ui_index: int):
         data = skin_controller_instance.add_mask_to_layer(ui_index)
         self._update_skin_layer_ui(data)
@@ -749,7 +929,7 @@ class RigManagerWindow(OchaBaseWindow):
 if __name__ == "__main__":
     try:
         from ui import ohcha_ui_base
-        importlib.reload(ohcha_ui_base)
+        if not PRODUCTION_MODE: importlib.reload(ohcha_ui_base)
         ohcha_ui_base.show_tool_instance(RigManagerWindow)
     except Exception as e:
         rt.print(f"❌ [PySide] Tool Launch Error: {e}")
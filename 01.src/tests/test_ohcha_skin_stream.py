@@ -0,0 +1,36 @@
+# ohCHA_RigManager/01/src/tests/test_ohcha_skin_stream.py
+# Description: [v1.0] dump_skin_file / load round trip (row counts around the writer's batch size).
+
+import os
+import sys
+
+import pytest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from utils.ohcha_skin_stream import (PackedLayerWeights, dump_skin_file, load_skin_file,
+                                     stream_load_skin_file)
+
+
+def _packed(rows: int) -> PackedLayerWeights:
+    packed = PackedLayerWeights()
+    for v in range(1, rows + 1):
+        packed.append_row(v, [1, 2], [0.25, 0.75])
+    return packed
+
+
+@pytest.mark.parametrize("rows", [0, 1, 4096, 8192])
+@pytest.mark.parametrize("loader", [load_skin_file, stream_load_skin_file])
+def test_round_trip(tmp_path, rows, loader):
+    path = str(tmp_path / "mesh.ohchaSkin")
+    data = {"bones": ["a", "b"],
+            "layers": [{"name": "Base", "weights": _packed(rows), "mask": {"1": [1, 2]}}]}
+    dump_skin_file(data, path)
+
+    loaded = loader(path)
+    layer = loaded["layers"][0]
+    assert loaded["bones"] == ["a", "b"]
+    assert layer["name"] == "Base" and layer["mask"] == {"1": [1, 2]}
+    assert len(layer["weights"]) == rows
+    for v, (bones, weights) in dict(layer["weights"]).items():
+        assert list(bones) == [1, 2] and list(weights) == [0.25, 0.75]
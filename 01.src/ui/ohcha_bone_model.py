@@ -0,0 +1,208 @@
+# ohCHA_RigManager/01/src/ui/ohcha_bone_model.py
+# Description: [v1.1] Model/View backend for the Bone Explorer.
+#              - BoneTreeModel: flat node arrays over the cached bone rows (no per-bone QTreeWidgetItem).
+#                QModelIndex objects are created on demand by the view, so only visible rows cost anything.
+#              - BoneFilterProxyModel: filters through the model's NameSearchIndex (matches + precomputed
+#                ancestor chains), so a keystroke never re-lowercases or walks the whole tree.
+
+from PySide6.QtCore import *
+from PySide6.QtGui import *
+import collections
+
+try:
+    from utils.ohcha_search_index import NameSearchIndex
+except ImportError:
+    NameSearchIndex = None
+
+UNGROUPED_KEY = "[Ungrouped]"
+VIEW_LIST, VIEW_HIERARCHY, VIEW_LAYER, VIEW_CUSTOM = "view_default", "view_hierarchy", "view_scene_layer", "view_custom"
+
+_COLOR_LAYER = "#f5b041"
+_COLOR_GROUP = "#a9d0f5"
+_COLOR_UNGROUPED = "#777"
+
+
+class BoneTreeModel(QAbstractItemModel):
+    """
+    노드 0 = (보이지 않는) 루트. 각 노드는 인덱스 하나로 표현되고 internalId 로 전달됩니다.
+    Group nodes (layer / custom group headers) have bone id None and are not selectable.
+    """
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self._group_font = QFont()
+        self._group_font.setBold(True)
+        self._colors = {c: QColor(c) for c in (_COLOR_LAYER, _COLOR_GROUP, _COLOR_UNGROUPED)}
+        self._reset_nodes()
+
+    def _reset_nodes(self):
+        self._text = [""]
+        self._lower = [""]
+        self._bone = [None]
+        self._color = [None]
+        self._parent = [-1]
+        self._row = [0]
+        self._children = [[]]
+        self._nodes_by_bone = collections.defaultdict(list)
+        self.search_index = None
+
+    def _add(self, parent: int, text: str, bone_id=None, color=None) -> int:
+        node = len(self._text)
+        self._text.append(text)
+        self._lower.append(text.lower())
+        self._bone.append(bone_id)
+        self._color.append(color)
+        self._parent.append(parent)
+        self._row.append(len(self._children[parent]))
+        self._children.append([])
+        self._children[parent].append(node)
+        if bone_id is not None: self._nodes_by_bone[bone_id].append(node)
+        return node
+
+    # --- Population ---
+    def set_view(self, mode: str, data, desc: bool = False):
+        """Rebuilds the node arrays for a view mode. 'data' is a bone row list (dict of lists for VIEW_CUSTOM)."""
+        self.beginResetModel()
+        self._reset_nodes()
+        if data:
+            if mode == VIEW_HIERARCHY: self._build_hierarchy(data)
+            elif mode == VIEW_LAYER: self._build_layers(data, desc)
+            elif mode == VIEW_CUSTOM: self._build_custom(data, desc)
+            else:
+                for b in sorted(data, key=lambda x: x['name'], reverse=desc): self._add(0, b['name'], b['id'])
+        if NameSearchIndex: self.search_index = NameSearchIndex(self._text, self._parent)
+        self.endResetModel()
+
+    def clear(self):
+        self.beginResetModel()
+        self._reset_nodes()
+        self.endResetModel()
+
+    def _build_hierarchy(self, data):
+        # Parents are added before children: walk from the roots using a parent->children map.
+        kids = collections.defaultdict(list)
+        handles = {b['handle'] for b in data if b.get('handle')}
+        for b in data:
+            if not b.get('handle'): continue
+            p = b.get('parent_handle')
+            kids[p if p in handles else None].append(b)
+        stack = [(0, b) for b in reversed(kids[None])]
+        while stack:
+            parent, b = stack.pop()
+            node = self._add(parent, b['name'], b['id'])
+            stack.extend((node, c) for c in reversed(kids.get(b['handle'], ())))
+
+    def _build_layers(self, data, desc):
+        g = collections.defaultdict(list)
+        for b in data: g[b.get('layer_name', '0')].append(b)
+        for name in sorted(g.keys(), reverse=desc):
+            p = self._add(0, name, None, _COLOR_LAYER)
+            for b in sorted(g[name], key=lambda x: x['name']): self._add(p, b['name'], b['id'])
+
+    def _build_custom(self, data, desc):
+        for name in sorted(data.keys(), reverse=desc):
+            p = self._add(0, name, None, _COLOR_GROUP if name != UNGROUPED_KEY else _COLOR_UNGROUPED)
+            for b in sorted(data[name], key=lambda x: x['name']): self._add(p, b['name'], b['id'])
+
+    # --- Node access ---
+    def node_of(self, index: QModelIndex) -> int:
+        return index.internalId() if index.isValid() else 0
+
+    def node_at(self, row: int, parent: QModelIndex) -> int:
+        return self._children[self.node_of(parent)][row]
+
+    def node_lower(self, node: int) -> str:
+        return self._lower[node]
+
+    def nodes_of_bones(self, bone_ids) -> list[int]:
+        return [n for b in bone_ids for n in self._nodes_by_bone.get(b, ())]
+
+    def node_text(self, node: int) -> str:
+        return self._text[node]
+
+    def node_bone(self, node: int):
+        return self._bone[node]
+
+    def node_parent(self, node: int) -> int:
+        return self._parent[node]
+
+    def node_count(self) -> int:
+        return len(self._text)
+
+    def index_of_node(self, node: int) -> QModelIndex:
+        if node <= 0: return QModelIndex()
+        return self.createIndex(self._row[node], 0, node)
+
+    def indexes_of_bone(self, bone_id) -> list:
+        return [self.index_of_node(n) for n in self._nodes_by_bone.get(bone_id, ())]
+
+    # --- QAbstractItemModel ---
+    def index(self, row, column, parent=QModelIndex()):
+        kids = self._children[self.node_of(parent)]
+        if column != 0 or not (0 <= row < len(kids)): return QModelIndex()
+        return self.createIndex(row, 0, kids[row])
+
+    def parent(self, index=None):
+        if index is None: return super().parent()
+        if not index.isValid(): return QModelIndex()
+        return self.index_of_node(self._parent[index.internalId()])
+
+    def rowCount(self, parent=QModelIndex()):
+        if parent.isValid() and parent.column() != 0: return 0
+        return len(self._children[self.node_of(parent)])
+
+    def columnCount(self, parent=QModelIndex()):
+        return 1
+
+    def hasChildren(self, parent=QModelIndex()):
+        return bool(self._children[self.node_of(parent)])
+
+    def flags(self, index):
+        if not index.isValid(): return Qt.ItemFlag.NoItemFlags
+        if self._bone[index.internalId()] is None: return Qt.ItemFlag.ItemIsEnabled
+        return Qt.ItemFlag.ItemIsEnabled | Qt.ItemFlag.ItemIsSelectable
+
+    def data(self, index, role=Qt.ItemDataRole.DisplayRole):
+        if not index.isValid(): return None
+        node = index.internalId()
+        if role == Qt.ItemDataRole.DisplayRole or role == Qt.ItemDataRole.ToolTipRole:
+            return self._text[node]
+        if role == Qt.ItemDataRole.UserRole:
+            return self._bone[node]
+        if self._bone[node] is None:
+            if role == Qt.ItemDataRole.ForegroundRole and self._color[node]: return self._colors[self._color[node]]
+            if role == Qt.ItemDataRole.FontRole: return self._group_font
+        return None
+
+
+class BoneFilterProxyModel(QSortFilterProxyModel):
+    """Shows the nodes of a precomputed 'visible' set (search matches or an id whitelist, plus their ancestors)."""
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self._visible = None
+        self._text = ""
+        self.setDynamicSortFilter(False)
+
+    def set_filters(self, text: str = "", ids=None):
+        src = self.sourceModel()
+        index = src.search_index
+        self._text = (text or "").lower()
+        if ids is not None:
+            nodes = src.nodes_of_bones(ids)
+            self._visible = index.visible_for(nodes) if index else set(nodes)
+            # Without an index, fall back to recursive filtering for the parents.
+            self.setRecursiveFilteringEnabled(index is None)
+        elif index is not None:
+            self._visible = index.query(text)[1]
+            self.setRecursiveFilteringEnabled(False)
+        else:
+            self._visible = None
+            self.setRecursiveFilteringEnabled(True)
+        self.invalidateFilter()
+
+    def filterAcceptsRow(self, source_row, source_parent):
+        src = self.sourceModel()
+        node = src.node_at(source_row, source_parent)
+        if self._visible is not None: return node in self._visible
+        return self._text in src.node_lower(node)
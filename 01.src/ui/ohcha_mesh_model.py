@@ -0,0 +1,122 @@
+# ohCHA_RigManager/01/src/ui/ohcha_mesh_model.py
+# Description: [v1.0] Edit Mesh List Model.
+#              - One row per scanned mesh, addressed by node handle (rows can be patched / streamed in).
+#              - entry = {"name", "node", "handle", "anim", "results", "error"}; results None = not scanned yet.
+#              - Shows a non-selectable placeholder row when empty.
+#              - FIXED: flags() returns NoItemFlags for invalid indexes.
+
+from PySide6.QtCore import Qt, QAbstractListModel, QModelIndex
+from PySide6.QtGui import QColor
+
+ISSUE_COLOR = QColor("#E74C3C")
+PENDING_COLOR = QColor("#888888")
+
+
+class MeshListModel(QAbstractListModel):
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self._entries = []
+        self._row_of = {}
+        self.placeholder = ""
+
+    # --- Qt API ---
+    def rowCount(self, parent=QModelIndex()):
+        if parent.isValid(): return 0
+        return len(self._entries) or (1 if self.placeholder else 0)
+
+    def flags(self, index):
+        if not index.isValid() or not self._entries: return Qt.ItemFlag.NoItemFlags
+        return Qt.ItemFlag.ItemIsEnabled | Qt.ItemFlag.ItemIsSelectable
+
+    def data(self, index, role=Qt.ItemDataRole.DisplayRole):
+        if not index.isValid(): return None
+        if not self._entries:
+            return self.placeholder if role == Qt.ItemDataRole.DisplayRole else None
+        e = self._entries[index.row()]
+        if role == Qt.ItemDataRole.DisplayRole: return e["name"]
+        if role == Qt.ItemDataRole.ForegroundRole:
+            if e["results"] is None: return PENDING_COLOR
+            if any(r and r.get("has_issue") for r in e["results"].values()): return ISSUE_COLOR
+            return None
+        if role == Qt.ItemDataRole.ToolTipRole: return e.get("error") or None
+        if role == Qt.ItemDataRole.UserRole: return e["handle"]
+        return None
+
+    # --- Access ---
+    @property
+    def entries(self) -> list[dict]:
+        return self._entries
+
+    def entry(self, row: int):
+        return self._entries[row] if 0 <= row < len(self._entries) else None
+
+    def entry_of(self, handle: int):
+        row = self._row_of.get(handle)
+        return None if row is None else self._entries[row]
+
+    def row_of(self, handle: int):
+        return self._row_of.get(handle)
+
+    def index_of(self, handle: int) -> QModelIndex:
+        row = self._row_of.get(handle)
+        return QModelIndex() if row is None else self.index(row, 0)
+
+    def set_placeholder(self, text: str):
+        self.placeholder = text
+        if not self._entries:
+            self.beginResetModel()
+            self.endResetModel()
+
+    # --- Mutation ---
+    def reset(self, entries):
+        self.beginResetModel()
+        self._entries = [dict(e, error=e.get("error", "")) for e in entries]
+        self._row_of = {e["handle"]: i for i, e in enumerate(self._entries)}
+        self.endResetModel()
+
+    def upsert(self, entry: dict):
+        """Updates the row of entry['handle'] (keeping geometry results / error) or appends a new row."""
+        row = self._row_of.get(entry["handle"])
+        if row is None:
+            if not self._entries and self.placeholder:
+                self.beginResetModel()
+                self._entries.append(dict(entry, error=""))
+                self._row_of[entry["handle"]] = 0
+                self.endResetModel()
+                return
+            row = len(self._entries)
+            self.beginInsertRows(QModelIndex(), row, row)
+            self._entries.append(dict(entry, error=""))
+            self._row_of[entry["handle"]] = row
+            self.endInsertRows()
+            return
+        self._entries[row] = dict(entry, error=self._entries[row].get("error", ""))
+        idx = self.index(row, 0)
+        self.dataChanged.emit(idx, idx)
+
+    def merge_results(self, handle: int, results: dict):
+        row = self._row_of.get(handle)
+        if row is None: return None
+        e = self._entries[row]
+        e["results"] = dict(e["results"] or {}, **results)
+        idx = self.index(row, 0)
+        self.dataChanged.emit(idx, idx)
+        return e["results"]
+
+    def set_error(self, handle: int, error: str):
+        row = self._row_of.get(handle)
+        if row is None: return
+        self._entries[row]["error"] = error
+        idx = self.index(row, 0)
+        self.dataChanged.emit(idx, idx)
+
+    def remove(self, handles):
+        rows = sorted((self._row_of[h] for h in handles if h in self._row_of), reverse=True)
+        if not rows: return
+        if len(rows) == len(self._entries):
+            return self.reset([])
+        for row in rows:
+            self.beginRemoveRows(QModelIndex(), row, row)
+            del self._entries[row]
+            self.endRemoveRows()
+        self._row_of = {e["handle"]: i for i, e in enumerate(self._entries)}
@@ -0,0 +1,58 @@
+# ohCHA_RigManager/01/src/ui/ohcha_naming_model.py
+# Description: [v1.0] Naming Preview Model.
+#              - Two columns (current / new name) read straight from NamingController: the view only asks for
+#                the rows on screen, and new names are rendered per row until the controller's full pass exists.
+#              - New name color: collision (red) / unchanged (gray) / changed (teal).
+
+from PySide6.QtCore import Qt, QAbstractTableModel, QModelIndex
+from PySide6.QtGui import QColor
+
+NEW_COLOR = QColor("#00FFCC")
+SAME_COLOR = QColor("#888888")
+COLLIDE_COLOR = QColor("#E74C3C")
+
+
+class NamingPreviewModel(QAbstractTableModel):
+    def __init__(self, controller, parent=None):
+        super().__init__(parent)
+        self.controller = controller
+        self._rows = 0
+        self._headers = ["Current Name", "New Name"]
+
+    # --- Qt API ---
+    def rowCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else self._rows
+
+    def columnCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else 2
+
+    def headerData(self, section, orientation, role=Qt.ItemDataRole.DisplayRole):
+        if role == Qt.ItemDataRole.DisplayRole and orientation == Qt.Orientation.Horizontal:
+            return self._headers[section]
+        return None
+
+    def data(self, index, role=Qt.ItemDataRole.DisplayRole):
+        if not index.isValid() or index.row() >= self._rows: return None
+        row, col = index.row(), index.column()
+        if role == Qt.ItemDataRole.DisplayRole:
+            return self.controller.original_name(row) if col == 0 else self.controller.new_name(row)
+        if role == Qt.ItemDataRole.ForegroundRole and col == 1:
+            if self.controller.collides(row): return COLLIDE_COLOR
+            if self.controller.new_name(row) == self.controller.original_name(row): return SAME_COLOR
+            return NEW_COLOR
+        return None
+
+    # --- Updates ---
+    def set_headers(self, headers):
+        self._headers = list(headers)
+        self.headerDataChanged.emit(Qt.Orientation.Horizontal, 0, 1)
+
+    def refresh(self):
+        """Row count from the controller; the view re-reads only the visible cells."""
+        rows = self.controller.row_count() if self.controller else 0
+        if rows != self._rows:
+            self.beginResetModel()
+            self._rows = rows
+            self.endResetModel()
+        elif rows:
+            self.dataChanged.emit(self.index(0, 0), self.index(rows - 1, 1))
@@ -5,13 +5,18 @@ from PySide6.QtWidgets import QApplication, QDialog, QWidget
 from PySide6.QtCore import Qt
 import importlib
 
+try:
+    from utils.config import PRODUCTION_MODE
+except ImportError:
+    PRODUCTION_MODE = False
+
 try:
     from ui import ohcha_ui_styles
 
-    importlib.reload(ohcha_ui_styles)
+    if not PRODUCTION_MODE:
+        importlib.reload(ohcha_ui_styles)
+        rt.print("✅ [PySide] 'ohcha_ui_styles' 모듈 강제 리로드 성공.")
     from ui.ohcha_ui_styles import get_current_theme_style, set_current_theme
-
-    rt.print("✅ [PySide] 'ohcha_ui_styles' 모듈 강제 리로드 성공.")
 except ImportError as e:
     rt.print(f"❌ [PySide] 테마 관리자('ohcha_ui_styles') 임포트 실패: {e}")
     raise
@@ -38,7 +43,7 @@ class OchaBaseWindow(QDialog):
         self.apply_theme()
 
     def apply_theme(self):
-        importlib.reload(ohcha_ui_styles)
+        if not PRODUCTION_MODE: importlib.reload(ohcha_ui_styles)
         style_sheet = ohcha_ui_styles.get_current_theme_style()
         self.setStyleSheet(style_sheet)
 
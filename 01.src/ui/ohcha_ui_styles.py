@@ -96,7 +96,7 @@ QGroupBox::title {
     background-color: #4a4a4a;
     border-radius: 4px;
 }
-QListWidget, QTableWidget, QTreeWidget { /* QTreeWidget 추가 */
+QListWidget, QTableWidget, QTreeView { /* QTreeView: QTreeWidget + model views */
     background-color: #2b2b2b;
     border: 1px solid #555;
     border-radius: 4px;
@@ -105,7 +105,7 @@ QTableWidget::item {
     padding: 8px; /* Increased padding for table cells */
     border-bottom: 1px solid #3c3c3c;
 }
-QTableWidget::item:selected, QListWidget::item:selected, QTreeWidget::item:selected { background-color: #007ACC; }
+QTableWidget::item:selected, QListWidget::item:selected, QTreeView::item:selected { background-color: #007ACC; }
 QHeaderView::section {
     background-color: #4a4a4a;
     color: #D0D0D0;
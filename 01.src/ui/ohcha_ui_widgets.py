@@ -1,5 +1,7 @@
 # ohCHA_RigManager/01/src/ui/ohcha_ui_widgets.py
-# Description: [v21.55] REFACTORED WIDGETS.
+# Description: [v21.56] REFACTORED WIDGETS.
+#              - PERF: OchaBoneListExplorer runs on BoneTreeModel + BoneFilterProxyModel (QTreeView).
+#              - PERF: Search uses the shared NameSearchIndex, debounced (prefix / regex / L-R side queries).
 #              - FIX: OchaBoneListExplorer retranslate_ui now correctly updates view modes.
 #              - FIX: Signal consistency in OchaLayerManagerWidget.
 
@@ -24,6 +26,14 @@ except ImportError:
         get = lambda s, k: k
     translator = T()
 
+try:
+    from ui.ohcha_bone_model import BoneTreeModel, BoneFilterProxyModel
+except ImportError:
+    rt.print("❌ [Widgets] 'ohcha_bone_model' 임포트 실패")
+    BoneTreeModel = BoneFilterProxyModel = None
+
+SEARCH_DEBOUNCE_MS = 150
+
 
 # =================================================================
 # 1. Basic Components
@@ -618,6 +628,8 @@ class OchaWeightToolWidget(QWidget):
         self.btn_ring.clicked.connect(lambda c=False: self.selectionChanged.emit("ring"))
         self.btn_copy.clicked.connect(lambda c=False: self.clipboardClicked.emit("copy"))
         self.btn_paste.clicked.connect(lambda c=False: self.clipboardClicked.emit("paste"))
+        self.btn_paste.setContextMenuPolicy(Qt.ContextMenuPolicy.CustomContextMenu)
+        self.btn_paste.customContextMenuRequested.connect(self._on_paste_menu)
         self.btn_smooth.clicked.connect(lambda c=False: self.smoothClicked.emit())
         self.btn_heal.clicked.connect(lambda c=False: self.healClicked.emit())
         self.btn_sub.clicked.connect(lambda c=False: self.mathClicked.emit("subtract", self.spin_step.value()))
@@ -646,6 +658,13 @@ class OchaWeightToolWidget(QWidget):
         self.btn_sub.setToolTip(translator.get("tip_val_sub"))
         self.spin_step.setToolTip(translator.get("tip_val_spinner"))
 
+    def _on_paste_menu(self, pos):
+        menu = QMenu(self)
+        for mode in ["average", "nearest", "index"]:
+            menu.addAction(translator.get(f"ctx_paste_{mode}"),
+                           lambda m=mode: self.clipboardClicked.emit(f"paste_{m}"))
+        menu.exec(self.btn_paste.mapToGlobal(pos))
+
 
 class OchaBoneListExplorer(QWidget):
     boneSelectionChanged = Signal(list)
@@ -656,6 +675,9 @@ class OchaBoneListExplorer(QWidget):
     renameGroupClicked = Signal(str)
     assignBonesClicked = Signal(str)
     removeInfluenceRequested = Signal(int)
+    rulePresetsRequested = Signal()
+    applyRulePresetClicked = Signal(str)
+    saveRulePresetClicked = Signal()
 
     def __init__(self, parent=None):
         super().__init__(parent)
@@ -687,17 +709,28 @@ class OchaBoneListExplorer(QWidget):
         self.btn_rem_g = QPushButton()
         self.btn_ren_g = QPushButton()
         self.btn_asn_g = QPushButton()
+        self.btn_rules_g = QPushButton()
+        self.rules_menu = QMenu(self.btn_rules_g)
+        self.rules_menu.aboutToShow.connect(self._rebuild_rules_menu)
+        self.btn_rules_g.setMenu(self.rules_menu)
+        self._rule_presets = []
         gl.addWidget(self.btn_add_g)
         gl.addWidget(self.btn_rem_g)
         gl.addWidget(self.btn_ren_g)
+        gl.addWidget(self.btn_rules_g)
         gl.addStretch()
         gl.addWidget(self.btn_asn_g)
 
-        self.tree = QTreeWidget()
+        self.bone_model = BoneTreeModel(self)
+        self.proxy_model = BoneFilterProxyModel(self)
+        self.proxy_model.setSourceModel(self.bone_model)
+
+        self.tree = QTreeView()
+        self.tree.setModel(self.proxy_model)
         self.tree.setHeaderHidden(True)
+        self.tree.setUniformRowHeights(True)
         self.tree.setSelectionMode(QAbstractItemView.SelectionMode.ExtendedSelection)
         self.tree.setMouseTracking(True)
-        self.tree.installEventFilter(self)
 
         self.tree.setContextMenuPolicy(Qt.ContextMenuPolicy.CustomContextMenu)
         self.tree.customContextMenuRequested.connect(self._on_context_menu)
@@ -708,11 +741,16 @@ class OchaBoneListExplorer(QWidget):
         l.addWidget(self.tree)
         self.group_widget.hide()
 
-        self.search_bar.textChanged.connect(self._apply_filters)
+        self.filter_timer = QTimer(self)
+        self.filter_timer.setSingleShot(True)
+        self.filter_timer.setInterval(SEARCH_DEBOUNCE_MS)
+        self.filter_timer.timeout.connect(self._apply_filters)
+
+        self.search_bar.textChanged.connect(lambda t: self.filter_timer.start())
         self.sort_combo.currentIndexChanged.connect(self._on_view_mode_changed)
         self.sort_order_button.clicked.connect(self.viewOptionsChanged.emit)
-        self.tree.itemSelectionChanged.connect(self._on_selection_changed)
-        self.tree.itemClicked.connect(self._on_item_clicked)
+        self.tree.selectionModel().selectionChanged.connect(self._on_selection_changed)
+        self.tree.clicked.connect(self._on_item_clicked)
 
         self.btn_add_g.clicked.connect(lambda c=False: self.addGroupClicked.emit())
         self.btn_rem_g.clicked.connect(lambda c=False: self._on_remove_group_clicked())
@@ -725,10 +763,13 @@ class OchaBoneListExplorer(QWidget):
         # ⭐️ [FIX] Ensure combo box updates with translated strings
         self.lbl_view.setText(translator.get("view_label"))
         self.search_bar.setPlaceholderText(translator.get("search_ph"))
+        self.search_bar.setToolTip(translator.get("tip_search_syntax"))
         self.btn_add_g.setText(translator.get("btn_grp_add"))
         self.btn_rem_g.setText(translator.get("btn_grp_rem"))
         self.btn_ren_g.setText(translator.get("btn_grp_ren"))
         self.btn_asn_g.setText(translator.get("btn_assign"))
+        self.btn_rules_g.setText(translator.get("btn_grp_rules"))
+        self.btn_rules_g.setToolTip(translator.get("tip_grp_rules"))
 
         curr = self.sort_combo.currentIndex()
         self.sort_combo.blockSignals(True)
@@ -739,25 +780,39 @@ class OchaBoneListExplorer(QWidget):
         self.sort_combo.blockSignals(False)
 
     def _on_context_menu(self, pos):
-        item = self.tree.itemAt(pos)
-        if not item: return
-        bid = item.data(0, Qt.ItemDataRole.UserRole)
+        index = self.tree.indexAt(pos)
+        if not index.isValid(): return
+        bid = index.data(Qt.ItemDataRole.UserRole)
         if bid is None: return
         menu = QMenu(self)
         act_remove = menu.addAction(translator.get("ctx_remove_infl"))
         act_remove.triggered.connect(lambda: self.removeInfluenceRequested.emit(bid))
         menu.exec(self.tree.mapToGlobal(pos))
 
+    def set_rule_presets(self, names: list):
+        self._rule_presets = list(names)
+
+    def _rebuild_rules_menu(self):
+        # Core answers 'rulePresetsRequested' synchronously via set_rule_presets().
+        self.rulePresetsRequested.emit()
+        self.rules_menu.clear()
+        apply_menu = self.rules_menu.addMenu(translator.get("ctx_rules_apply"))
+        if not self._rule_presets:
+            apply_menu.addAction(translator.get("ctx_rules_none")).setEnabled(False)
+        for name in self._rule_presets:
+            apply_menu.addAction(name, lambda n=name: self.applyRulePresetClicked.emit(n))
+        self.rules_menu.addAction(translator.get("ctx_rules_save"), lambda: self.saveRulePresetClicked.emit())
+
     def _on_view_mode_changed(self, idx):
         key = self.view_modes[idx]
         self.group_widget.setVisible(key == "view_custom")
         self.viewOptionsChanged.emit()
 
     def _get_selected_group_name(self):
-        item = self.tree.currentItem()
-        if not item: return None
-        while item.parent(): item = item.parent()
-        if not (item.flags() & Qt.ItemIsSelectable): return item.text(0)
+        index = self.tree.currentIndex()
+        if not index.isValid(): return None
+        while index.parent().isValid(): index = index.parent()
+        if index.data(Qt.ItemDataRole.UserRole) is None: return index.data()
         return None
 
     def _on_remove_group_clicked(self):
@@ -772,177 +827,74 @@ class OchaBoneListExplorer(QWidget):
         n = self._get_selected_group_name()
         if n: self.assignBonesClicked.emit(n)
 
-    def eventFilter(self, w, e):
-        if w == self.tree and e.type() == QEvent.Type.ToolTip:
-            item = self.tree.itemAt(e.pos())
-            if item:
-                QToolTip.showText(QCursor.pos(), item.toolTip(0), self.tree)
-                return True
-        return super().eventFilter(w, e)
-
     def silent_select_bone(self, bid):
-        self.tree.blockSignals(True)
-        it = QTreeWidgetItemIterator(self.tree)
+        sel = self.tree.selectionModel()
+        sel.blockSignals(True)
+        sel.clearSelection()
         found = False
-        self.tree.clearSelection()
-        while it.value():
-            if it.value().data(0, Qt.ItemDataRole.UserRole) == bid:
-                it.value().setSelected(True)
-                self.tree.scrollToItem(it.value())
-                found = True
-                break
-            it += 1
-        self.tree.blockSignals(False)
+        for src in self.bone_model.indexes_of_bone(bid):
+            index = self.proxy_model.mapFromSource(src)
+            if not index.isValid(): continue
+            sel.select(index, QItemSelectionModel.SelectionFlag.Select)
+            sel.setCurrentIndex(index, QItemSelectionModel.SelectionFlag.NoUpdate)
+            self.tree.scrollTo(index)
+            found = True
+            break
+        sel.blockSignals(False)
+        self.tree.viewport().update()
         return found
 
     def populate_bones(self, data):
-        self.tree.blockSignals(True)
-        self.tree.clear()
         idx = self.sort_combo.currentIndex()
         key = self.view_modes[idx if idx >= 0 else 0]
         desc = self.sort_order_button.isChecked()
 
-        if not data:
-            self.tree.blockSignals(False)
-            return
-
-        if key == "view_hierarchy":
-            self._pop_tree(data)
-        elif key == "view_scene_layer":
-            self._pop_layer(data, desc)
-        elif key == "view_custom":
-            self._pop_custom(data, desc)
-        else:
-            self._pop_list(sorted(data, key=lambda x: x['name'], reverse=desc))
-
+        sel = self.tree.selectionModel()
+        sel.blockSignals(True)
+        self.bone_model.set_view(key, data, desc)
         self._apply_filters()
+        if key != "view_default": self.tree.expandAll()
         self.tree.resizeColumnToContents(0)
-        self.tree.blockSignals(False)
-
-        self.tree.setSortingEnabled(key == "view_default")
-        if key == "view_default":
-            order = Qt.SortOrder.DescendingOrder if desc else Qt.SortOrder.AscendingOrder
-            self.tree.sortItems(0, order)
-
-    def _pop_list(self, data):
-        for b in data:
-            i = QTreeWidgetItem(self.tree)
-            i.setText(0, b['name'])
-            i.setData(0, Qt.ItemDataRole.UserRole, b['id'])
-            i.setToolTip(0, b['name'])
-
-    def _pop_tree(self, data):
-        lookup = {}
-        for b in data:
-            if b.get('handle'):
-                i = QTreeWidgetItem([b['name']])
-                i.setData(0, Qt.ItemDataRole.UserRole, b['id'])
-                i.setToolTip(0, b['name'])
-                lookup[b['handle']] = i
-        for b in data:
-            if b['handle'] not in lookup: continue
-            item = lookup[b['handle']]
-            parent = lookup.get(b.get('parent_handle'))
-            if parent:
-                parent.addChild(item)
-            else:
-                self.tree.addTopLevelItem(item)
-        self.tree.expandAll()
-
-    def _pop_layer(self, data, desc):
-        g = collections.defaultdict(list)
-        for b in data: g[b.get('layer_name', '0')].append(b)
-        for name in sorted(g.keys(), reverse=desc):
-            p = QTreeWidgetItem(self.tree, [name])
-            p.setFlags(p.flags() & ~Qt.ItemIsSelectable)
-            p.setForeground(0, QColor("#f5b041"))
-            f = p.font(0);
-            f.setBold(True);
-            p.setFont(0, f)
-            for b in sorted(g[name], key=lambda x: x['name']):
-                c = QTreeWidgetItem(p, [b['name']])
-                c.setData(0, Qt.ItemDataRole.UserRole, b['id'])
-                c.setToolTip(0, b['name'])
-        self.tree.expandAll()
-
-    def _pop_custom(self, data, desc):
-        for name in sorted(data.keys(), reverse=desc):
-            p = QTreeWidgetItem(self.tree, [name])
-            p.setFlags(p.flags() & ~Qt.ItemIsSelectable)
-            col = "#a9d0f5" if name != "[Ungrouped]" else "#777"
-            p.setForeground(0, QColor(col))
-            f = p.font(0);
-            f.setBold(True);
-            p.setFont(0, f)
-            for b in sorted(data[name], key=lambda x: x['name']):
-                c = QTreeWidgetItem(p, [b['name']])
-                c.setData(0, Qt.ItemDataRole.UserRole, b['id'])
-                c.setToolTip(0, b['name'])
-        self.tree.expandAll()
+        sel.blockSignals(False)
 
     def _apply_filters(self, *args):
-        txt = self.search_bar.text().lower()
-        it = QTreeWidgetItemIterator(self.tree)
-        while it.value():
-            item = it.value()
-            name = item.text(0).lower()
-            vis = txt in name
-            is_grp = not (item.flags() & Qt.ItemIsSelectable)
-            if vis:
-                item.setHidden(False)
-                p = item.parent()
-                while p:
-                    p.setHidden(False)
-                    p = p.parent()
-            else:
-                hide = True
-                if is_grp:
-                    for i in range(item.childCount()):
-                        if not item.child(i).isHidden():
-                            hide = False
-                            break
-                if hide: item.setHidden(True)
-            it += 1
+        self.filter_timer.stop()
+        self.proxy_model.set_filters(self.search_bar.text())
 
     def filter_and_select_by_ids(self, valid_ids):
-        self.tree.blockSignals(True)
-        self.tree.clearSelection()
+        sel = self.tree.selectionModel()
+        sel.blockSignals(True)
+        sel.clearSelection()
+        self.filter_timer.stop()
+        self.search_bar.blockSignals(True)
         self.search_bar.clear()
+        self.search_bar.blockSignals(False)
+
         valid_set = set(valid_ids)
-        it = QTreeWidgetItemIterator(self.tree)
-        while it.value():
-            item = it.value()
-            bid = item.data(0, Qt.ItemDataRole.UserRole)
-            is_grp = not (item.flags() & Qt.ItemIsSelectable)
-            if not is_grp and bid is not None:
-                if bid in valid_set:
-                    item.setHidden(False)
-                    item.setSelected(True)
-                    p = item.parent()
-                    while p:
-                        p.setHidden(False)
-                        p.setExpanded(True)
-                        p = p.parent()
-                else:
-                    item.setHidden(True)
-            elif is_grp:
-                item.setHidden(True)
-            it += 1
-        self.tree.blockSignals(False)
-
-    def _on_selection_changed(self):
+        self.proxy_model.set_filters(ids=valid_set)
+        selection = QItemSelection()
+        for bid in valid_set:
+            for src in self.bone_model.indexes_of_bone(bid):
+                index = self.proxy_model.mapFromSource(src)
+                if index.isValid(): selection.select(index, index)
+        sel.select(selection, QItemSelectionModel.SelectionFlag.Select)
+        self.tree.expandAll()
+        sel.blockSignals(False)
+        self.tree.viewport().update()
+
+    def _on_selection_changed(self, *args):
         self.boneSelectionChanged.emit(self.get_selected_bone_ids())
 
-    def _on_item_clicked(self, item, c):
-        if len(self.tree.selectedItems()) <= 1:
-            bid = item.data(0, Qt.ItemDataRole.UserRole)
+    def _on_item_clicked(self, index):
+        if len(self.tree.selectionModel().selectedRows()) <= 1:
+            bid = index.data(Qt.ItemDataRole.UserRole)
             if bid is not None: self.boneClicked.emit(bid)
 
     def get_selected_bone_ids(self):
-        return [i.data(0, Qt.ItemDataRole.UserRole) for i in self.tree.selectedItems()]
+        return [i.data(Qt.ItemDataRole.UserRole) for i in self.tree.selectionModel().selectedRows()]
 
     def clear_list(self):
-        self.tree.clear()
+        self.bone_model.clear()
         self.search_bar.clear()
         self.sort_order_button.setChecked(False)
 
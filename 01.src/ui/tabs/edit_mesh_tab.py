@@ -1,11 +1,21 @@
 # ohCHA_RigManager/01/src/ui/tabs/edit_mesh_tab.py
-# Description: [v1.9.15] Fixed Table Column Widths (Action Column Stretch).
+# Description: [v1.9.18] Progressive Mesh List.
+#              - PERF: Refresh uses edit_mesh_logic.mesh_check_cache (one MaxScript call for all meshes,
+#                then only nodes changed since the last refresh) and patches the list in place.
+#              - PERF: The list is a QListView over MeshListModel. A full scan lists the meshes first, then
+#                streams results in via TimeSlicedScheduler (visible rows / selection first, 'Stop' cancels).
+#                'Check All' runs on the same scheduler. No modal dialog, no processEvents.
+#              - Change tracking runs while the tab is visible.
+#              - NEW: 'Check Geometry' runs the expensive (on-demand) checks for the selected mesh.
+#              - NEW: 'Check All' + cached geometry results are shown on selection (persistent fingerprint cache).
+#              - NEW: Multi-select. Fixes / finalize on several meshes go out as one batch (batchRequested).
+#              - FIXED: 'Check All' chunks don't write the result cache; it is flushed once when the job ends or stops.
 
 from pymxs import runtime as rt
 from PySide6.QtWidgets import (
-    QWidget, QVBoxLayout, QHBoxLayout, QPushButton, QListWidget, QListWidgetItem,
+    QWidget, QVBoxLayout, QHBoxLayout, QPushButton, QListView,
     QLabel, QTableWidget, QTableWidgetItem, QHeaderView, QGroupBox, QSplitter,
-    QStackedWidget, QAbstractItemView, QApplication, QProgressDialog,
+    QStackedWidget, QAbstractItemView, QApplication,
     QCheckBox, QMessageBox, QSpinBox
 )
 from PySide6.QtCore import Qt, Signal
@@ -29,6 +39,12 @@ try:
     from controllers import edit_mesh_logic
 except ImportError:
     edit_mesh_logic = None
+try:
+    from ui.ohcha_mesh_model import MeshListModel
+    from utils.ohcha_scheduler import TimeSlicedScheduler
+except ImportError as e:
+    rt.print(f"❌ [EditMeshTab] Import Error: {e}")
+    raise
 
 # Configuration
 from utils.config import EDIT_MESH_CHECKS
@@ -117,7 +133,7 @@ class EditMeshTab(QWidget):
     fixScaleRequested = Signal(object)
     fixSkinRequested = Signal(object)
     fixPivotRequested = Signal(object)
-    finalizeRequested = Signal(object, dict)
+    batchRequested = Signal(list, list, dict)  # nodes, ops (edit_mesh_logic.BATCH_OPS), finalize options
 
     def __init__(self, parent=None):
         super().__init__(parent)
@@ -127,6 +143,12 @@ class EditMeshTab(QWidget):
         self.current_check_results = {}
         self.current_node = None
         self.inspector_checks_data = EDIT_MESH_CHECKS
+        self.check_cache = edit_mesh_logic.mesh_check_cache if edit_mesh_logic else None
+        self.current_handle = None
+
+        self.mesh_model = MeshListModel(self)
+        self.scan_job = TimeSlicedScheduler(self._scan_work, parent=self)
+        self.geo_job = TimeSlicedScheduler(self._geo_work, chunk_size=4, parent=self)
 
         self._create_widgets()
         self._setup_layout()
@@ -134,7 +156,18 @@ class EditMeshTab(QWidget):
 
     def _create_widgets(self):
         self.refresh_btn = QPushButton()
-        self.mesh_list = QListWidget()
+        self.mesh_list = QListView()
+        self.mesh_list.setModel(self.mesh_model)
+        self.mesh_list.setUniformItemSizes(True)
+        self.mesh_list.setSelectionMode(QAbstractItemView.SelectionMode.ExtendedSelection)
+        self.progress_lbl = QLabel()
+        self.progress_lbl.setStyleSheet("color:#888;")
+        self.stop_btn = QPushButton()
+        self.progress_lbl.setVisible(False)
+        self.stop_btn.setVisible(False)
+        self.geo_btn = QPushButton()
+        self.geo_btn.setEnabled(False)
+        self.geo_all_btn = QPushButton()
 
         # Table Setup
         self.table = QTableWidget(0, 3)
@@ -196,6 +229,8 @@ class EditMeshTab(QWidget):
         left.addWidget(self.lbl_scene)
         left.addWidget(self.refresh_btn)
         left.addWidget(self.mesh_list)
+        left.addWidget(self.progress_lbl)
+        left.addWidget(self.stop_btn)
 
         # Right Panel (Splitter)
         right_split = QSplitter(Qt.Orientation.Vertical)
@@ -204,6 +239,10 @@ class EditMeshTab(QWidget):
         l1.setSpacing(5);
         l1.setContentsMargins(5, 15, 5, 5)
         l1.addWidget(self.table)
+        geo_row = QHBoxLayout()
+        geo_row.addWidget(self.geo_btn)
+        geo_row.addWidget(self.geo_all_btn)
+        l1.addLayout(geo_row)
 
         l2 = QVBoxLayout(self.grp_details)
         l2.setSpacing(5);
@@ -268,8 +307,13 @@ class EditMeshTab(QWidget):
     def retranslate_ui(self):
         # Titles
         self.refresh_btn.setText(translator.get("em_refresh_btn"))
+        self.stop_btn.setText(translator.get("btn_stop"))
         self.lbl_scene.setText(translator.get("em_scene_meshes"))
         self.finalize_btn.setText(translator.get("em_btn_finalize"))
+        self.geo_btn.setText(translator.get("em_btn_geo_checks"))
+        self.geo_btn.setToolTip(translator.get("tip_em_geo_checks"))
+        self.geo_all_btn.setText(translator.get("em_btn_geo_all"))
+        self.geo_all_btn.setToolTip(translator.get("tip_em_geo_all"))
 
         # Group Boxes
         self.grp_inspector.setTitle(translator.get("em_grp_inspector"))
@@ -312,26 +356,45 @@ class EditMeshTab(QWidget):
             w.retranslate_ui()
 
         # Mesh List Placeholder
-        if self.mesh_list.count() == 0 or self.mesh_list.item(0).data(Qt.ItemDataRole.UserRole) is None:
-            self.mesh_list.clear()
-            self.mesh_list.addItem(translator.get("msg_no_mesh"))
+        self.mesh_model.set_placeholder(translator.get("msg_no_mesh"))
 
     def _connect_signals(self):
         self.refresh_btn.clicked.connect(self._on_refresh)
-        self.mesh_list.itemSelectionChanged.connect(self._on_select)
+        self.geo_btn.clicked.connect(self._on_geometry_checks)
+        self.geo_all_btn.clicked.connect(self._on_geometry_checks_all)
+        self.mesh_list.selectionModel().selectionChanged.connect(self._on_select)
+        self.mesh_list.verticalScrollBar().valueChanged.connect(self._prioritize_visible)
+        self.stop_btn.clicked.connect(self._on_stop)
+        self.scan_job.chunkDone.connect(self._on_scan_chunk)
+        self.scan_job.progress.connect(self._on_job_progress)
+        self.scan_job.finished.connect(self._on_scan_finished)
+        self.geo_job.chunkDone.connect(self._on_geo_chunk)
+        self.geo_job.progress.connect(self._on_job_progress)
+        self.geo_job.finished.connect(self._on_geo_finished)
         self.finalize_btn.clicked.connect(self._on_finalize)
         self.toggles["skin"].toggled.connect(self._on_toggle_skin_options)
 
         # Hardcoded ID connections (mapped to config IDs)
-        if "non_uniform_scale" in self.detail_widgets:
-            self.detail_widgets["non_uniform_scale"].actionRequested.connect(
-                lambda: self.fixScaleRequested.emit(self.current_node) if self.current_node else None)
-        if "existing_skin" in self.detail_widgets:
-            self.detail_widgets["existing_skin"].actionRequested.connect(
-                lambda: self.fixSkinRequested.emit(self.current_node) if self.current_node else None)
-        if "pivot_not_at_origin" in self.detail_widgets:
-            self.detail_widgets["pivot_not_at_origin"].actionRequested.connect(
-                lambda: self.fixPivotRequested.emit(self.current_node) if self.current_node else None)
+        single_fix = {
+            "non_uniform_scale": self.fixScaleRequested,
+            "existing_skin": self.fixSkinRequested,
+            "pivot_not_at_origin": self.fixPivotRequested,
+        }
+        for cid, sig in single_fix.items():
+            if cid in self.detail_widgets:
+                self.detail_widgets[cid].actionRequested.connect(functools.partial(self._on_fix_requested, cid, sig))
+
+    def _selected_data(self) -> list[dict]:
+        rows = sorted(i.row() for i in self.mesh_list.selectionModel().selectedRows())
+        return [e for e in (self.mesh_model.entry(r) for r in rows) if e]
+
+    def _on_fix_requested(self, cid, single_signal):
+        # One mesh: the per-node command. Several: one batch over the selected meshes that have this issue.
+        targets = [d["node"] for d in self._selected_data() if ((d["results"] or {}).get(cid) or {}).get("has_issue")]
+        if len(targets) > 1:
+            self.batchRequested.emit(targets, [self.logic.FIX_OPS[cid]], {})
+        elif self.current_node:
+            single_signal.emit(self.current_node)
 
     def _on_toggle_skin_options(self, on):
         self.toggles["dq"].setEnabled(on)
@@ -347,7 +410,19 @@ class EditMeshTab(QWidget):
             "use_dq": self.toggles["dq"].isChecked(),
             "bone_limit": self.spin_bone.value()
         }
-        self.finalizeRequested.emit(self.current_node, opts)
+        nodes = [d["node"] for d in self._selected_data()] or [self.current_node]
+        self.batchRequested.emit(nodes, self.logic.finalize_ops(opts), opts)
+
+    def apply_batch_results(self, results: dict) -> list[str]:
+        """Marks failed meshes (tooltip) and patches the list; returns one log line per mesh."""
+        log = []
+        for h, err in results.items():
+            e = self.mesh_model.entry_of(h)
+            if e is None: continue
+            self.mesh_model.set_error(h, err)
+            log.append(f"❌ {e['name']}: {err}" if err else f"✅ {e['name']}")
+        self._on_refresh()
+        return log
 
     def _on_show_details(self, r):
         self.table.selectRow(r)
@@ -366,64 +441,189 @@ class EditMeshTab(QWidget):
 
             w.update_info(value, fix_key)
 
-    def _on_refresh(self):
-        # Preserve selection logic omitted for brevity, essentially full refresh
-        self.mesh_list.clear()
-        self._reset_inspector()
-        meshes = self.logic.get_scene_meshes()
-
-        if not meshes:
-            self.mesh_list.addItem(translator.get("msg_no_mesh"))
-            return
-
-        pd = QProgressDialog(translator.get("msg_scanning"), translator.get("btn_cancel"), 0, len(meshes), self)
-        pd.setMinimumDuration(0)
-        pd.setWindowModality(Qt.WindowModality.WindowModal)
-
-        for i, m in enumerate(meshes):
-            pd.setValue(i)
-            QApplication.processEvents()
-            if pd.wasCanceled(): break
+    def showEvent(self, event):
+        super().showEvent(event)
+        if self.check_cache: self.check_cache.start_tracking()
 
-            item = QListWidgetItem(m["name"])
-            res = self.logic.run_all_checks(m["node"])
-            if any(r and r.get("has_issue") for r in res.values()):
-                item.setForeground(QColor("#E74C3C"))  # Issue Color
-            item.setData(Qt.ItemDataRole.UserRole, {"node": m["node"], "results": res})
-            self.mesh_list.addItem(item)
+    def hideEvent(self, event):
+        # Tracking stops while hidden, so a running full scan would be stale anyway.
+        self.geo_job.cancel()
+        self.scan_job.cancel()
+        if self.check_cache: self.check_cache.stop_tracking()
+        super().hideEvent(event)
 
-        pd.setValue(len(meshes))
-        if self.mesh_list.count() > 0:
-            self.mesh_list.setCurrentRow(0)
+    # --- Refresh ---
+    def _on_refresh(self):
+        if self.scan_job.is_running or self.check_cache.needs_full_scan:
+            return self._start_full_scan()
+
+        QApplication.setOverrideCursor(Qt.CursorShape.WaitCursor)
+        try:
+            changed, removed, full = self.check_cache.refresh()
+        finally:
+            QApplication.restoreOverrideCursor()
+        if full: return self._rebuild_list(changed)
+
+        # Patch in place: the selection (and the inspector) survives unless its node changed.
+        self.mesh_model.remove(removed)
+        for m in changed: self.mesh_model.upsert(m)
+        if self.current_handle is not None and self.mesh_model.row_of(self.current_handle) is None:
+            self._select_first()
+        elif any(m["handle"] == self.current_handle for m in changed):
+            self._on_select()
+
+    def _rebuild_list(self, entries):
+        self.mesh_model.reset(entries)
+        self._reset_inspector()
+        self._select_first()
 
-    def _on_select(self):
+    def _select_first(self):
+        if self.mesh_model.entries:
+            self.mesh_list.setCurrentIndex(self.mesh_model.index(0, 0))
+        else:
+            self._reset_inspector()
+
+    def _start_full_scan(self):
+        self.geo_job.cancel()
+        self.scan_job.cancel(emit=False)
+        stubs = self.check_cache.begin_full_scan()
+        self._rebuild_list(stubs)
+        self.scan_job.start([e["anim"] for e in stubs])
+        self._prioritize_visible()
+
+    def _scan_work(self, anim_handles):
+        return self.check_cache.scan_chunk(anim_handles)
+
+    def _on_scan_chunk(self, result):
+        entries, removed = result
+        self.mesh_model.remove(removed)
+        for m in entries: self.mesh_model.upsert(m)
+        if any(m["handle"] == self.current_handle for m in entries): self._on_select()
+        elif self.current_handle is not None and self.mesh_model.row_of(self.current_handle) is None:
+            self._select_first()
+
+    def _on_scan_finished(self, completed):
+        if completed: self.check_cache.end_full_scan()
+        else: self.check_cache.invalidate()  # partial list: the next refresh starts over
+        self._on_job_finished(completed)
+
+    # --- Scheduler Helpers ---
+    def _on_job_progress(self, done, total):
+        self.progress_lbl.setText(f"{done} / {total}")
+        self.progress_lbl.setVisible(True)
+        self.stop_btn.setVisible(True)
+
+    def _on_job_finished(self, completed=True):
+        if self.scan_job.is_running or self.geo_job.is_running: return
+        self.progress_lbl.setVisible(False)
+        self.stop_btn.setVisible(False)
+
+    def _on_stop(self):
+        self.geo_job.cancel()
+        self.scan_job.cancel()
+
+    def _prioritize_visible(self, *args):
+        """Queued work for the selection and the rows on screen goes first."""
+        if not (self.scan_job.is_running or self.geo_job.is_running) or not self.mesh_model.entries: return
+        vp = self.mesh_list.viewport().rect()
+        top = self.mesh_list.indexAt(vp.topLeft()).row()
+        bottom = self.mesh_list.indexAt(vp.bottomLeft()).row()
+        if top < 0: top = 0
+        if bottom < 0: bottom = min(len(self.mesh_model.entries) - 1, top + 50)
+        rows = [i.row() for i in self.mesh_list.selectionModel().selectedRows()] + list(range(top, bottom + 1))
+        entries = [e for e in (self.mesh_model.entry(r) for r in rows) if e]
+        self.scan_job.prioritize([e["anim"] for e in entries])
+        self.geo_job.prioritize([e["handle"] for e in entries])
+
+    # --- Selection / Inspector ---
+    def _current_entry(self):
+        rows = [i.row() for i in self.mesh_list.selectionModel().selectedRows()]
+        if not rows: return None
+        # Inspector follows the current (last clicked) mesh; actions apply to the whole selection.
+        cur = self.mesh_list.currentIndex().row()
+        return self.mesh_model.entry(cur if cur in rows else rows[0])
+
+    def _on_select(self, *args):
         self._reset_inspector()
-        items = self.mesh_list.selectedItems()
-        if not items:
-            self.finalize_btn.setEnabled(False)
-            return
-        data = items[0].data(Qt.ItemDataRole.UserRole)
-        if not data: return
-
-        self.current_node = data["node"]
-        self.current_check_results = data.get("results", {})
-        self.finalize_btn.setEnabled(True)
+        e = self._current_entry()
+        if e is None: return
 
-        for cid, w in self.status_widgets.items():
-            r = self.current_check_results.get(cid)
-            w.setStatus("FAIL" if r and r.get("has_issue") else "PASS")
+        self.current_node = e["node"]
+        self.current_handle = e["handle"]
+        self.current_check_results = dict(e["results"] or {})
+        self.finalize_btn.setEnabled(True)
+        self.geo_btn.setEnabled(True)
+        if e["results"] is None:
+            self._prioritize_visible()
+        elif not any(cid in self.current_check_results for cid in self._expensive_ids()):
+            cached = self.logic.cached_geometry_results(self.current_node)
+            if cached: self.current_check_results = self._store_results(e["handle"], cached)
+        self._update_statuses()
 
         if self.table.currentRow() >= 0:
             self._on_show_details(self.table.currentRow())
         else:
             self._on_show_details(0)
 
+    def _update_statuses(self):
+        # Expensive checks stay gray until 'Check Geometry' has run for this mesh.
+        for cid, w in self.status_widgets.items():
+            r = self.current_check_results.get(cid)
+            if r is None:
+                w.setStatus("NOT_CHECKED")
+            else:
+                w.setStatus("FAIL" if r.get("has_issue") else "PASS")
+
+    def _expensive_ids(self):
+        return [d["id"] for d in self.inspector_checks_data if d.get("cost") == "expensive"]
+
+    def _store_results(self, handle, res):
+        """Merges geometry results into a list row (kept there until the node changes)."""
+        return dict(self.mesh_model.merge_results(handle, res) or {})
+
+    # --- Geometry Checks ---
+    def _on_geometry_checks(self):
+        if not self.current_node or self.current_handle is None: return
+        QApplication.setOverrideCursor(Qt.CursorShape.WaitCursor)
+        try:
+            res = self.logic.run_geometry_checks(self.current_node)
+        finally:
+            QApplication.restoreOverrideCursor()
+        self.current_check_results = self._store_results(self.current_handle, res)
+        self._update_statuses()
+        self._on_show_details(max(self.table.currentRow(), 0))
+
+    def _on_geometry_checks_all(self):
+        handles = [e["handle"] for e in self.mesh_model.entries]
+        if not handles: return
+        self.geo_job.start(handles)
+        self._prioritize_visible()
+
+    def _geo_work(self, handles):
+        nodes = [e["node"] for e in (self.mesh_model.entry_of(h) for h in handles) if e]
+        return self.logic.run_geometry_checks_batch(nodes, report=False, flush=False)
+
+    def _on_geo_finished(self, completed=True):
+        # Completed or stopped: chunks only stored results, write the cache file once.
+        self.logic.flush_geometry_results()
+        self._on_job_finished(completed)
+
+    def _on_geo_chunk(self, by_handle):
+        for h, res in by_handle.items():
+            merged = self._store_results(h, res)
+            if h == self.current_handle: self.current_check_results = merged
+        if self.current_handle in by_handle:
+            self._update_statuses()
+            self._on_show_details(max(self.table.currentRow(), 0))
+
     def _reset_inspector(self):
         self.current_node = None
+        self.current_handle = None
         self.current_check_results.clear()
         self.details_stack.setCurrentIndex(0)  # Welcome
         self.table.clearSelection()
         self.finalize_btn.setEnabled(False)
+        self.geo_btn.setEnabled(False)
         for w in self.status_widgets.values():
             w.setStatus("NOT_CHECKED")
 
@@ -1,5 +1,10 @@
 # ohCHA_RigManager/01/src/ui/tabs/layer_tool.py
-# Description: [v20.61] Simplified & Stable.
+# Description: [v20.64] Simplified & Stable.
+#              - Load Preset previews the diff against the scene, then applies it in one batch call.
+#              - FIXED: No scene catalog tracking from the widget (nothing here lists scene objects).
+#              - PERF: Layer tree is patched, not rebuilt: name -> item index + hierarchy snapshot,
+#                refresh applies diff_layer_hierarchy() (insert / remove / rename / reparent). Expansion and
+#                scroll position are kept. Drag & drop only sends the parents that actually changed.
 #              - REMOVED: Scene Object List (Right panel).
 #              - UPDATED: 'Assign' now uses current Max Viewport Selection.
 #              - LAYOUT: Clean vertical layout focused on Hierarchy.
@@ -25,7 +30,7 @@ except ImportError:
     translator = T()
 
 try:
-    from controllers.layer_controller import layer_controller_instance
+    from controllers.layer_controller import layer_controller_instance, hierarchy_snapshot, diff_layer_hierarchy
 except ImportError:
     layer_controller_instance = None
 
@@ -45,6 +50,8 @@ class LayerToolWidget(QWidget):
     def __init__(self, parent=None):
         super().__init__(parent)
         self.controller = layer_controller_instance
+        self._layer_items = {}     # layer name -> QTreeWidgetItem
+        self._layer_snapshot = {}  # layer name -> parent name (as shown in the tree)
 
         self._setup_ui()
         self._connect_signals()
@@ -180,50 +187,66 @@ class LayerToolWidget(QWidget):
 
     def _refresh_layers(self):
         if not self.controller: return
-
-        # Save expansion state
-        expanded_layers = []
-        it = QTreeWidgetItemIterator(self.tree_layers)
-        while it.value():
-            item = it.value()
-            if item.isExpanded(): expanded_layers.append(item.text(0))
-            it += 1
+        new = hierarchy_snapshot(self.controller.get_layer_hierarchy())
+        # Parents missing from the data are shown as top level.
+        new = {n: (p if p in new else None) for n, p in new.items()}
+        diff = diff_layer_hierarchy(self._layer_snapshot, new)
+        if not any(diff.values()): return
 
         self.tree_layers.blockSignals(True)
-        self.tree_layers.clear()
-
-        layer_data = self.controller.get_layer_hierarchy()
-
-        items = {}
-        # Create items
-        for l in layer_data:
-            item = QTreeWidgetItem([l['name']])
-            if l['name'] == "0":
-                item.setForeground(0, QColor("#AAA"))
-                item.setToolTip(0, "Default Layer (Root)")
-                item.setExpanded(True)
-            items[l['name']] = item
-
-        # Build Hierarchy
-        for l in layer_data:
-            name = l['name']
-            p_name = l['parent']
-            item = items[name]
-
-            if p_name and p_name in items:
-                items[p_name].addChild(item)
-            else:
-                self.tree_layers.addTopLevelItem(item)
-
-        # Restore expansion
-        it = QTreeWidgetItemIterator(self.tree_layers)
-        while it.value():
-            item = it.value()
-            if item.text(0) in expanded_layers:
-                item.setExpanded(True)
-            it += 1
-
-        self.tree_layers.blockSignals(False)
+        try:
+            self._apply_layer_diff(diff, new)
+        finally:
+            self.tree_layers.blockSignals(False)
+        self._layer_snapshot = new
+
+    def _apply_layer_diff(self, diff, new):
+        items = self._layer_items
+
+        # Rename in place
+        for old_name, new_name in diff["renamed"].items():
+            item = items.pop(old_name)
+            item.setText(0, new_name)
+            items[new_name] = item
+
+        # Detach moved layers first (their old parent may be about to go away)
+        moved = diff["reparented"]
+        expanded = {n: items[n].isExpanded() for n in moved}
+        for n in moved: self._detach(items[n])
+
+        for n in diff["removed"]:
+            item = items.pop(n)
+            self._detach(item)
+            # Child items still attached belong to removed layers as well
+            item.takeChildren()
+
+        for n in diff["added"]:
+            items[n] = self._make_layer_item(n)
+
+        # 'new' order: parents are attached before their children
+        for n in moved + diff["added"]:
+            p_name = new[n]
+            parent = items.get(p_name) if p_name else None
+            if parent is not None: parent.addChild(items[n])
+            else: self.tree_layers.addTopLevelItem(items[n])
+        for n, was_expanded in expanded.items():
+            items[n].setExpanded(was_expanded)
+        if "0" in diff["added"]: items["0"].setExpanded(True)
+
+    def _make_layer_item(self, name):
+        item = QTreeWidgetItem([name])
+        if name == "0":
+            item.setForeground(0, QColor("#AAA"))
+            item.setToolTip(0, "Default Layer (Root)")
+        return item
+
+    def _detach(self, item):
+        parent = item.parent()
+        if parent is not None:
+            parent.removeChild(item)
+        else:
+            idx = self.tree_layers.indexOfTopLevelItem(item)
+            if idx >= 0: self.tree_layers.takeTopLevelItem(idx)
 
     def _get_selected_layer_name(self):
         items = self.tree_layers.selectedItems()
@@ -239,9 +262,9 @@ class LayerToolWidget(QWidget):
             self._refresh_layers()
 
             # Auto Select
-            items = self.tree_layers.findItems(name, Qt.MatchFlag.MatchRecursive | Qt.MatchFlag.MatchExactly)
-            if items:
-                self.tree_layers.setCurrentItem(items[0])
+            item = self._layer_items.get(name)
+            if item is not None:
+                self.tree_layers.setCurrentItem(item)
         else:
             QMessageBox.warning(self, translator.get("layer_msg_err"), translator.get("layer_msg_fail"))
 
@@ -261,7 +284,10 @@ class LayerToolWidget(QWidget):
         new_name, ok = QInputDialog.getText(self, translator.get("layer_msg_ren_title"),
                                             translator.get("layer_msg_ren_label"), text=old_name)
         if ok and new_name:
-            self.controller.rename_layer(old_name, new_name)
+            if self.controller.rename_layer(old_name, new_name):
+                self._apply_layer_diff({"renamed": {old_name: new_name}, "removed": [], "added": [], "reparented": []}, {})
+                self._layer_snapshot = {(new_name if n == old_name else n): (new_name if p == old_name else p)
+                                        for n, p in self._layer_snapshot.items()}
             self._refresh_layers()
 
     # ⭐️ Assign Current Selection in Max to Selected Layer
@@ -292,25 +318,45 @@ class LayerToolWidget(QWidget):
 
     def _on_load_preset(self):
         path, _ = QFileDialog.getOpenFileName(self, translator.get("layer_btn_load"), "", "JSON (*.json)")
-        if path and self.controller.load_layer_preset(path):
-            self._refresh_layers()
-            QMessageBox.information(self, translator.get("layer_msg_success"), translator.get("layer_msg_loaded"))
-
-    def _on_hierarchy_changed(self):
-        self._sync_tree_to_max(self.tree_layers.invisibleRootItem())
+        if not path: return
+        layers = self.controller.read_layer_preset(path)
+        if layers is None:
+            QMessageBox.warning(self, translator.get("layer_msg_err"), translator.get("layer_msg_fail"))
+            return
 
-    def _sync_tree_to_max(self, item):
-        for i in range(item.childCount()):
-            child = item.child(i)
-            child_name = child.text(0)
+        diff = self.controller.diff_layer_preset(layers)
+        if not diff["added"] and not diff["reparented"]:
+            QMessageBox.information(self, translator.get("layer_btn_load"), translator.get("layer_msg_preset_same"))
+            return
+        msg = translator.get("layer_msg_preset_diff").format(len(diff["added"]), len(diff["reparented"]),
+                                                             diff["unchanged"])
+        res = QMessageBox.question(self, translator.get("layer_btn_load"), msg,
+                                   QMessageBox.StandardButton.Yes | QMessageBox.StandardButton.No)
+        if res != QMessageBox.StandardButton.Yes: return
 
-            parent = child.parent()
-            target_parent_name = parent.text(0) if parent else ""
+        ok = self.controller.apply_layer_preset(layers)
+        self._refresh_layers()
+        if ok:
+            QMessageBox.information(self, translator.get("layer_msg_success"), translator.get("layer_msg_loaded"))
+        else:
+            QMessageBox.warning(self, translator.get("layer_msg_err"), translator.get("layer_msg_fail"))
 
-            if child_name != "0":
-                self.controller.set_layer_parent(child_name, target_parent_name)
+    def _on_hierarchy_changed(self):
+        # The view already moved the items; send only the layers whose parent differs from the snapshot.
+        for name, parent in self._tree_parents():
+            if name == "0" or self._layer_snapshot.get(name) == parent: continue
+            self.controller.set_layer_parent(name, parent or "")
+            self._layer_snapshot[name] = parent
+        # Re-reads Max: a rejected move is put back by the diff.
+        self._refresh_layers()
 
-            self._sync_tree_to_max(child)
+    def _tree_parents(self):
+        it = QTreeWidgetItemIterator(self.tree_layers)
+        while it.value():
+            item = it.value()
+            parent = item.parent()
+            yield item.text(0), parent.text(0) if parent else None
+            it += 1
 
     def _on_layer_context_menu(self, pos):
         item = self.tree_layers.itemAt(pos)
@@ -1,17 +1,22 @@
 # ohCHA_RigManager/01/src/ui/tabs/naming_tool.py
-# Description: [v20.68] Init Crash Fix.
+# Description: [v20.70] Virtualized Preview.
+#              - PERF: Preview is a QTableView over NamingPreviewModel (only visible rows are rendered).
+#                Parameter edits are debounced; the full pass (collisions + Changed / Unchanged / Collisions
+#                summary) runs right after the visible rows are shown.
+#              [v20.69] Templates / Collisions.
+#              - NEW: Template (+ regex) field, 'Resolve Duplicates'; rows whose new name collides are red.
+#              [v20.68] Init Crash Fix.
 #              - FIXED: Moved '_toggle_num(False)' to end of '_setup_ui'.
 #              - REASON: Prevent accessing 'self.table' before it is created.
 #              - SAFETY: Added attribute check in '_update_preview'.
 
 from PySide6.QtWidgets import (
     QWidget, QVBoxLayout, QHBoxLayout, QPushButton, QLineEdit,
-    QLabel, QGroupBox, QSpinBox, QCheckBox, QTableWidget,
-    QTableWidgetItem, QHeaderView, QAbstractItemView,
+    QLabel, QGroupBox, QSpinBox, QCheckBox, QTableView,
+    QHeaderView, QAbstractItemView,
     QMessageBox, QGridLayout, QSizePolicy, QFrame
 )
-from PySide6.QtCore import Qt
-from PySide6.QtGui import QColor
+from PySide6.QtCore import Qt, QTimer
 
 try:
     from utils.translator import translator
@@ -27,11 +32,31 @@ try:
 except ImportError:
     naming_controller_instance = None
 
+try:
+    from ui.ohcha_naming_model import NamingPreviewModel
+except ImportError as e:
+    print(f"❌ [NamingTool] Import Error: {e}")
+    raise
+
+PREVIEW_DEBOUNCE_MS = 150
+
 
 class NamingToolWidget(QWidget):
     def __init__(self, parent=None):
         super().__init__(parent)
         self.controller = naming_controller_instance
+        self.preview_model = NamingPreviewModel(self.controller, self)
+
+        self._preview_timer = QTimer(self)
+        self._preview_timer.setSingleShot(True)
+        self._preview_timer.setInterval(PREVIEW_DEBOUNCE_MS)
+        self._preview_timer.timeout.connect(self._update_preview)
+        # Interval 0: runs after the visible rows have been painted
+        self._summary_timer = QTimer(self)
+        self._summary_timer.setSingleShot(True)
+        self._summary_timer.setInterval(0)
+        self._summary_timer.timeout.connect(self._update_summary)
+
         self._setup_ui()
         self._connect_signals()
         self.retranslate_ui()
@@ -53,6 +78,7 @@ class NamingToolWidget(QWidget):
             QGroupBox::title { subcontrol-origin: margin; left: 10px; padding: 0 3px; }
         """
         input_style = "background-color: #2b2b2b; border: 1px solid #555; border-radius: 3px; padding: 4px; color: #EEE;"
+        self._input_style = input_style
         spin_style = "QSpinBox { " + input_style + " } QSpinBox::up-button, QSpinBox::down-button { width: 0px; }"
 
         checkbox_style = """
@@ -134,6 +160,25 @@ class NamingToolWidget(QWidget):
         rules_grid.addWidget(self.lbl_rem_l, 2, 2)
         rules_grid.addWidget(self.spin_rem_l, 2, 3)
 
+        # Row 3: Template (overrides the rules above when not empty)
+        self.lbl_tpl = QLabel("Template:")
+        self.txt_tpl = QLineEdit()
+        self.txt_tpl.setStyleSheet(input_style)
+        self.txt_tpl.setPlaceholderText("{side}_{name}_{##}")
+        rules_grid.addWidget(self.lbl_tpl, 3, 0)
+        rules_grid.addWidget(self.txt_tpl, 3, 1, 1, 3)
+
+        # Row 4: Regex (for {0}~{9}) + Resolve Duplicates
+        self.lbl_regex = QLabel("Match:")
+        self.txt_regex = QLineEdit()
+        self.txt_regex.setStyleSheet(input_style)
+        self.txt_regex.setPlaceholderText("^(\\w+)_(\\d+)$")
+        self.chk_resolve = QCheckBox("Resolve Duplicates")
+        self.chk_resolve.setStyleSheet(checkbox_style)
+        rules_grid.addWidget(self.lbl_regex, 4, 0)
+        rules_grid.addWidget(self.txt_regex, 4, 1)
+        rules_grid.addWidget(self.chk_resolve, 4, 2, 1, 2)
+
         main_layout.addWidget(self.grp_rules)
 
         # 3. Numbering Group
@@ -176,19 +221,27 @@ class NamingToolWidget(QWidget):
         main_layout.addWidget(self.grp_num)
 
         # 4. Preview Table
-        self.table = QTableWidget(0, 2)
-        self.table.setHorizontalHeaderLabels(["Current Name", "New Name"])
+        self.table = QTableView()
+        self.table.setModel(self.preview_model)
         self.table.horizontalHeader().setSectionResizeMode(QHeaderView.ResizeMode.Stretch)
         self.table.verticalHeader().setVisible(False)
+        # Fixed row height: no per-row size hints for thousands of rows
+        self.table.verticalHeader().setSectionResizeMode(QHeaderView.ResizeMode.Fixed)
+        self.table.verticalHeader().setDefaultSectionSize(24)
         self.table.setSelectionMode(QAbstractItemView.SelectionMode.NoSelection)
         self.table.setAlternatingRowColors(True)
+        self.table.setWordWrap(False)
         self.table.setStyleSheet("""
-            QTableWidget { background-color: #222; border: 1px solid #444; border-radius: 4px; } 
-            QTableWidget::item { padding: 4px; color: #DDD; }
+            QTableView { background-color: #222; border: 1px solid #444; border-radius: 4px; } 
+            QTableView::item { padding: 4px; color: #DDD; }
             QHeaderView::section { background-color: #333; color: #DDD; border: none; padding: 4px; }
         """)
         main_layout.addWidget(self.table)
 
+        self.lbl_summary = QLabel()
+        self.lbl_summary.setStyleSheet("color: #AAA;")
+        main_layout.addWidget(self.lbl_summary)
+
         # 5. Apply Button
         self.btn_apply = QPushButton("Rename Objects")
         self.btn_apply.setFixedHeight(45)
@@ -209,28 +262,29 @@ class NamingToolWidget(QWidget):
         self.btn_apply.clicked.connect(self._on_apply)
 
         # Auto-Update Preview
-        widgets = [self.txt_base, self.txt_pre, self.txt_suf,
+        widgets = [self.txt_base, self.txt_pre, self.txt_suf, self.txt_tpl, self.txt_regex,
                    self.spin_rem_f, self.spin_rem_l,
                    self.spin_start, self.spin_step, self.spin_pad]
 
         for w in widgets:
-            if isinstance(w, QLineEdit): w.textChanged.connect(self._update_preview)
-            if isinstance(w, QSpinBox): w.valueChanged.connect(self._update_preview)
+            if isinstance(w, QLineEdit): w.textChanged.connect(self._schedule_preview)
+            if isinstance(w, QSpinBox): w.valueChanged.connect(self._schedule_preview)
 
-        self.chk_base.toggled.connect(self._update_preview)
-        self.chk_num.toggled.connect(self._update_preview)
+        self.chk_base.toggled.connect(self._schedule_preview)
+        self.chk_num.toggled.connect(self._schedule_preview)
+        self.chk_resolve.toggled.connect(self._schedule_preview)
 
     def _toggle_base(self, checked):
         self.txt_base.setEnabled(checked)
         self.spin_rem_f.setEnabled(not checked)
         self.spin_rem_l.setEnabled(not checked)
-        self._update_preview()
+        self._schedule_preview()
 
     def _toggle_num(self, checked):
         self.spin_start.setEnabled(checked)
         self.spin_step.setEnabled(checked)
         self.spin_pad.setEnabled(checked)
-        self._update_preview()
+        self._schedule_preview()
 
     def _on_load(self):
         count = self.controller.load_selection()
@@ -248,28 +302,45 @@ class NamingToolWidget(QWidget):
             "use_num": self.chk_num.isChecked(),
             "start": self.spin_start.value(),
             "step": self.spin_step.value(),
-            "padding": self.spin_pad.value()
+            "padding": self.spin_pad.value(),
+            "template": self.txt_tpl.text().strip(),
+            "regex": self.txt_regex.text(),
+            "resolve": self.chk_resolve.isChecked()
         }
 
+    def _schedule_preview(self, *args):
+        self._preview_timer.start()
+
     def _update_preview(self):
         # ⭐️ Safety Check
         if not hasattr(self, "table") or not self.controller: return
-
-        data = self.controller.get_preview_data(self._get_params())
-
-        self.table.setRowCount(len(data))
-        for i, (orig, new) in enumerate(data):
-            self.table.setItem(i, 0, QTableWidgetItem(orig))
-
-            item_new = QTableWidgetItem(new)
-            item_new.setForeground(QColor("#00FFCC"))  # Highlight new name
-            self.table.setItem(i, 1, item_new)
+        self._preview_timer.stop()
+
+        self.controller.set_params(self._get_params())
+        self.txt_tpl.setToolTip(self.controller.template_error or translator.get("tip_name_tpl"))
+        self.txt_tpl.setStyleSheet(self._input_style + ("border-color: #E74C3C;" if self.controller.template_error else ""))
+        self.preview_model.refresh()
+        self._summary_timer.start()
+
+    def _update_summary(self):
+        if not self.controller.row_count():
+            self.lbl_summary.clear()
+            return
+        s = self.controller.compute_summary()
+        self.lbl_summary.setText(translator.get("name_lbl_summary").format(s["changed"], s["unchanged"], s["collisions"]))
+        self.preview_model.refresh()  # final names / collision colors
 
     def _on_apply(self):
-        if self.controller.apply_rename():
+        self._summary_timer.stop()
+        if self.controller.apply_rename(self._get_params()):
             QMessageBox.information(self, translator.get("title_complete"),
-                                    translator.get("name_msg_success").format(self.table.rowCount()))
+                                    translator.get("name_msg_success").format(self.preview_model.rowCount()))
             self._on_load()
+        elif any(self.controller.collisions):
+            self.preview_model.refresh()
+            self._summary_timer.start()
+            QMessageBox.warning(self, translator.get("title_error"),
+                                translator.get("name_msg_collide").format(sum(self.controller.collisions)))
         else:
             QMessageBox.warning(self, translator.get("title_error"), translator.get("name_msg_no_sel"))
 
@@ -290,9 +361,13 @@ class NamingToolWidget(QWidget):
         self.lbl_start.setText(translator.get("name_lbl_start"))
         self.lbl_step.setText(translator.get("name_lbl_step"))
         self.lbl_pad.setText(translator.get("name_lbl_pad"))
+        self.lbl_tpl.setText(translator.get("name_lbl_tpl"))
+        self.txt_tpl.setToolTip(translator.get("tip_name_tpl"))
+        self.lbl_regex.setText(translator.get("name_lbl_regex"))
+        self.chk_resolve.setText(translator.get("name_chk_resolve"))
         self.btn_apply.setText(translator.get("name_btn_apply"))
 
-        self.table.setHorizontalHeaderLabels([
+        self.preview_model.set_headers([
             translator.get("name_col_curr"),
             translator.get("name_col_new")
         ])
\ No newline at end of file
@@ -1,5 +1,6 @@
 # ohCHA_RigManager/01/src/ui/tabs/rigging_tab.py
-# Description: [v21.46] RIGGING TAB FULL.
+# Description: [v21.47] RIGGING TAB FULL.
+#              - PERF: Guide search uses NameSearchIndex (built per refresh) behind a debounce timer.
 #              - FIXED: retranslate_ui refreshes names properly.
 
 from PySide6.QtWidgets import (
@@ -9,7 +10,7 @@ from PySide6.QtWidgets import (
     QLineEdit, QFrame, QGroupBox, QRadioButton, QButtonGroup, QColorDialog,
     QSizePolicy, QAbstractSpinBox, QComboBox
 )
-from PySide6.QtCore import Qt, Signal, QSize
+from PySide6.QtCore import Qt, Signal, QSize, QTimer
 from PySide6.QtGui import QColor, QFont, QIcon, QCursor
 
 try:
@@ -33,6 +34,11 @@ except ImportError:
     class OchaControllerInspector(QWidget):
         pass
 
+try:
+    from utils.ohcha_search_index import NameSearchIndex
+except ImportError:
+    NameSearchIndex = None
+
 try:
     from ui.tabs.layer_tool import LayerToolWidget
 except ImportError:
@@ -53,6 +59,9 @@ class GuideExplorerWidget(QWidget):
         super().__init__(parent)
         self.controller = controller
         self._current_guide_name = None
+        self._search_index = None
+        self._search_items = []
+        self._hidden = set()
         self._setup_ui()
 
     def _setup_ui(self):
@@ -69,7 +78,11 @@ class GuideExplorerWidget(QWidget):
         self.search_bar = QLineEdit()
         self.search_bar.setStyleSheet(
             "background-color: #222; border: 1px solid #444; padding: 4px; border-radius: 3px;")
-        self.search_bar.textChanged.connect(self._filter_list)
+        self.filter_timer = QTimer(self)
+        self.filter_timer.setSingleShot(True)
+        self.filter_timer.setInterval(150)
+        self.filter_timer.timeout.connect(lambda: self._filter_list(self.search_bar.text()))
+        self.search_bar.textChanged.connect(lambda t: self.filter_timer.start())
 
         header_layout.addWidget(self.lbl_title)
         header_layout.addWidget(self.search_bar)
@@ -108,13 +121,20 @@ class GuideExplorerWidget(QWidget):
     def retranslate_ui(self):
         self.lbl_title.setText(translator.get("rig_lbl_guide_expl"))
         self.search_bar.setPlaceholderText(translator.get("rig_ph_search"))
+        self.search_bar.setToolTip(translator.get("tip_search_syntax"))
         self.btn_snap.setText(translator.get("rig_btn_snap"))
         self.btn_mirror.setText(translator.get("rig_btn_mirror"))
 
     def refresh_list(self):
         data = self.controller.get_guide_data()
         self.tree.clear()
+        self.search_bar.blockSignals(True)
         self.search_bar.clear()
+        self.search_bar.blockSignals(False)
+        self.filter_timer.stop()
+        self._search_index = None
+        self._search_items = []
+        self._hidden = set()
         lookup = {}
 
         for g in data:
@@ -136,12 +156,39 @@ class GuideExplorerWidget(QWidget):
             else:
                 self.tree.addTopLevelItem(item)
         self.tree.expandAll()
+        self._build_search_index()
+
+    def _build_search_index(self):
+        if NameSearchIndex is None: return
+        items, parents, pos = [], [], {}
+        stack = [self.tree.topLevelItem(i) for i in reversed(range(self.tree.topLevelItemCount()))]
+        while stack:
+            item = stack.pop()
+            pos[id(item)] = len(items)
+            p = item.parent()
+            parents.append(pos[id(p)] if p is not None else -1)
+            items.append(item)
+            stack.extend(item.child(i) for i in reversed(range(item.childCount())))
+        self._search_items = items
+        self._search_index = NameSearchIndex([it.text(0) for it in items], parents)
 
     def _filter_list(self, text):
-        search_text = text.lower()
-        root = self.tree.invisibleRootItem()
-        for i in range(root.childCount()):
-            self._apply_filter_recursive(root.child(i), search_text)
+        if self._search_index is None:
+            search_text = text.lower()
+            root = self.tree.invisibleRootItem()
+            for i in range(root.childCount()):
+                self._apply_filter_recursive(root.child(i), search_text)
+            return
+
+        _, visible = self._search_index.query(text)
+        hidden = set() if visible is None else set(range(len(self._search_items))) - visible
+        # Only touch items whose state changed since the last query.
+        for i in hidden - self._hidden: self._search_items[i].setHidden(True)
+        for i in self._hidden - hidden:
+            item = self._search_items[i]
+            item.setHidden(False)
+            item.setExpanded(True)
+        self._hidden = hidden
 
     def _apply_filter_recursive(self, item, text):
         name = item.text(0).lower()
@@ -256,6 +256,10 @@ class OchaLayerManagerWidget(QFrame):
     paintBlendToggled = Signal(bool)
     blendModeChanged = Signal(int, str)
     collapseLayersClicked = Signal()
+    mergeDownClicked = Signal(int)
+    collapseRangeClicked = Signal(int)
+    featherMaskClicked = Signal(int)
+    clearFeatherClicked = Signal(int)
     addMaskToLayerClicked = Signal(int)
     removeMaskFromLayerClicked = Signal(int)
     updateMaskDataClicked = Signal(int, bool)
@@ -279,6 +283,8 @@ class OchaLayerManagerWidget(QFrame):
 
         self.layer_tree = QTreeWidget(self)
         self.layer_tree.setHeaderHidden(True)
+        self.layer_tree.setContextMenuPolicy(Qt.ContextMenuPolicy.CustomContextMenu)
+        self.layer_tree.customContextMenuRequested.connect(self._on_layer_context_menu)
 
         controls_layout = QHBoxLayout()
         controls_layout.setSpacing(2)
@@ -406,6 +412,19 @@ class OchaLayerManagerWidget(QFrame):
     def _on_paint_commit_clicked(self):
         self.paintCommitClicked.emit(self.get_selected_indices()[0])
 
+    def _on_layer_context_menu(self, pos):
+        layer_index, is_mask = self.get_selected_indices()
+        cnt = self.layer_tree.topLevelItemCount()
+        if layer_index < 0 or layer_index >= cnt - 1: return
+        menu = QMenu(self)
+        if is_mask:
+            menu.addAction(translator.get("ctx_feather_mask"), lambda: self.featherMaskClicked.emit(layer_index))
+            menu.addAction(translator.get("ctx_clear_feather"), lambda: self.clearFeatherClicked.emit(layer_index))
+        else:
+            menu.addAction(translator.get("ctx_merge_down"), lambda: self.mergeDownClicked.emit(layer_index))
+            menu.addAction(translator.get("ctx_collapse_range"), lambda: self.collapseRangeClicked.emit(layer_index))
+        menu.exec(self.layer_tree.viewport().mapToGlobal(pos))
+
     def _on_selection_changed(self, current, previous):
         layer_index, is_mask = self.get_selected_indices()
         cnt = self.layer_tree.topLevelItemCount()
@@ -1,8 +1,11 @@
 # ohCHA_RigManager/01/src/utils/config.py
-# Description: [v0.91_Beta] CONFIG UPDATE.
+# Description: [v0.93_Beta] CONFIG UPDATE.
+#              - ADDED: Geometry checks (cost 'expensive' = run on demand, see controllers.mesh_checks).
+#              - ADDED: PRODUCTION_MODE (no module reloads, lazy tabs / MaxScript).
 #              - DEFAULT TAB: Changed to 'info'.
 #              - ADDED: Tutorial & LinkedIn URLs.
 
+import os
 from pymxs import runtime as rt
 
 rt.print("✅ [Import Check] Loading utils.config...")
@@ -15,11 +18,17 @@ CONTACT_EMAIL = "ckekdnlt@naver.com"
 LINKEDIN_URL = "https://www.linkedin.com/in/ohcha"
 TUTORIAL_URL = "https://discreet-colt-bfc.notion.site/ohCHA_RigManager-Guide-2c0a37c8c303803f9ae5daf1d9fbce9f?source=copy_link"
 
+# Startup Mode
+# Production: no importlib.reload, tabs are built on first activation, MaxScript loads on first use.
+# Set the environment variable OHCHA_DEV_MODE=1 to get the old reload-everything behaviour while developing.
+PRODUCTION_MODE = os.environ.get("OHCHA_DEV_MODE", "0") != "1"
+
 # UI Constants
 SIDEBAR_EXPANDED_WIDTH = 170
 SIDEBAR_COLLAPSED_WIDTH = 60
 
 # Edit Mesh Logic Configuration
+# "cost": "cheap" checks run on every refresh, "expensive" ones only via 'Check Geometry' (default: cheap).
 EDIT_MESH_CHECKS = [
     {
         "id": "non_uniform_scale",
@@ -39,6 +48,36 @@ EDIT_MESH_CHECKS = [
         "info_key": "chk_pivot_inf",
         "fix_key": "chk_pivot_fix"
     },
+    {
+        "id": "degenerate_faces",
+        "label_key": "chk_degen_lbl",
+        "info_key": "chk_degen_inf",
+        "cost": "expensive"
+    },
+    {
+        "id": "isolated_vertices",
+        "label_key": "chk_isolated_lbl",
+        "info_key": "chk_isolated_inf",
+        "cost": "expensive"
+    },
+    {
+        "id": "non_manifold_edges",
+        "label_key": "chk_nonmanifold_lbl",
+        "info_key": "chk_nonmanifold_inf",
+        "cost": "expensive"
+    },
+    {
+        "id": "duplicate_vertices",
+        "label_key": "chk_dupverts_lbl",
+        "info_key": "chk_dupverts_inf",
+        "cost": "expensive"
+    },
+    {
+        "id": "unwelded_seams",
+        "label_key": "chk_seams_lbl",
+        "info_key": "chk_seams_inf",
+        "cost": "expensive"
+    },
 ]
 
 # Main Tab Configuration
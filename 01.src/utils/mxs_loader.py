@@ -0,0 +1,173 @@
+# ohCHA_RigManager/01/src/utils/mxs_loader.py
+# Description: [v1.1] Central MaxScript Module Loader.
+#              - ADDED: ohcha_mesh_logic (Edit Mesh bulk scan, loaded on first refresh).
+#              - Registry of the .mse/.ms/.txt modules: global struct name + dependencies.
+#              - require(): loads a module (and its deps, in order) once; reloads only when the file's
+#                mtime changes (checked at most every MTIME_CHECK_INTERVAL seconds per module).
+#              - Records load times; report() prints the registry.
+
+import os
+import time
+from pymxs import runtime as rt
+
+try:
+    from utils.paths import find_script_path
+except ImportError:
+    find_script_path = lambda x: None
+
+MTIME_CHECK_INTERVAL = 1.0
+
+# name -> (global struct / function name or None, dependencies). Order = launcher order.
+MXS_MODULES = {
+    "ohcha_data_utils": ("ohCHA_DataUtil", ()),
+    "ohcha_skin_logic": ("ohCHA_SkinLogic", ()),
+    "ohcha_layer_logic": ("ohCHA_LayerLogic", ()),
+    "ohcha_naming_logic": ("ohCHA_NamingLogic", ()),
+    "ohcha_paint_session": ("ohCHA_PaintSession", ()),
+    "set_paint_blend": ("ohCHA_SetPaintBlend", ()),
+    "open_paint_options": ("ohCHA_OpenPaintOptions", ()),
+    "ohcha_shape_utils": ("ohCHA_ShapeUtils", ()),
+    "ohcha_biped_logic": ("ohCHA_BipedLogic", ()),
+    "ohcha_bone_logic": ("ohCHA_BoneLogic", ("ohcha_shape_utils",)),
+    "ohcha_control_logic": ("ohCHA_ControlLogic", ()),
+    "ohcha_mesh_logic": ("ohCHA_MeshLogic", ()),
+}
+
+
+class _ModuleRecord:
+    __slots__ = ("path", "mtime", "load_ms", "loads", "checked_at", "adopted")
+
+    def __init__(self, path, mtime):
+        self.path = path
+        self.mtime = mtime
+        self.load_ms = 0.0
+        self.loads = 0
+        self.checked_at = time.monotonic()
+        self.adopted = False
+
+
+class MxsModuleLoader:
+    def __init__(self, modules: dict = None):
+        self.modules = dict(modules or MXS_MODULES)
+        self._records = {}
+        self._order_cache = {}
+
+    # --- Dependency Ordering ---
+    def dependency_order(self, names=None) -> list[str]:
+        """Topological order (deps first) of 'names' and everything they depend on."""
+        key = tuple(names) if names is not None else None
+        cached = self._order_cache.get(key)
+        if cached is not None: return cached
+
+        order, state = [], {}
+
+        def visit(n, chain):
+            if state.get(n) == 2: return
+            if state.get(n) == 1: raise ValueError(f"Circular MaxScript dependency: {' -> '.join(chain + [n])}")
+            state[n] = 1
+            for d in self.modules.get(n, (None, ()))[1]: visit(d, chain + [n])
+            state[n] = 2
+            order.append(n)
+
+        for n in (names if names is not None else self.modules): visit(n, [])
+        self._order_cache[key] = order
+        return order
+
+    # --- Loading ---
+    @staticmethod
+    def _global_defined(name) -> bool:
+        if not name: return True
+        try:
+            return rt.globalVars.get(rt.Name(name)) != rt.undefined
+        except Exception:
+            return False
+
+    @staticmethod
+    def _mtime(path):
+        try:
+            return os.path.getmtime(path)
+        except OSError:
+            return None
+
+    def _is_current(self, name) -> bool:
+        rec = self._records.get(name)
+        if rec is None: return False
+        now = time.monotonic()
+        if now - rec.checked_at < MTIME_CHECK_INTERVAL: return True
+        rec.checked_at = now
+        return self._mtime(rec.path) == rec.mtime and self._global_defined(self.modules.get(name, (None,))[0])
+
+    def _load(self, name) -> bool:
+        struct_name = self.modules.get(name, (None, ()))[0]
+        rec = self._records.get(name)
+        path = rec.path if rec and os.path.exists(rec.path) else find_script_path(name)
+        if not path:
+            rt.print(f"❌ [MxsLoader] Script file missing: {name}")
+            return False
+
+        mtime = self._mtime(path)
+        if rec is None and self._global_defined(struct_name) and struct_name:
+            # Already loaded by the macro launcher: adopt it without a second fileIn.
+            rec = _ModuleRecord(path, mtime)
+            rec.adopted = True
+            self._records[name] = rec
+            return True
+
+        if rec is not None and struct_name:
+            # Some modules only create their global when undefined: clear it so the new struct is used.
+            try:
+                rt.globalVars.set(rt.Name(struct_name), rt.undefined)
+            except Exception:
+                pass
+
+        t = time.perf_counter()
+        try:
+            rt.fileIn(path)
+        except Exception as e:
+            rt.print(f"❌ [MxsLoader] Load Error ({name}): {e}")
+            return False
+        load_ms = (time.perf_counter() - t) * 1000
+
+        if not self._global_defined(struct_name):
+            rt.print(f"❌ [MxsLoader] '{name}' loaded but '{struct_name}' is undefined.")
+            return False
+
+        new_rec = _ModuleRecord(path, mtime)
+        new_rec.load_ms = load_ms
+        new_rec.loads = (rec.loads if rec else 0) + 1
+        self._records[name] = new_rec
+        rt.print(f"✅ [MxsLoader] {'Reloaded' if rec else 'Loaded'} {os.path.basename(path)} ({load_ms:.1f} ms)")
+        return True
+
+    def require(self, *names) -> bool:
+        """Ensures the given modules (and their dependencies) are loaded and current."""
+        ok = True
+        for n in self.dependency_order(names):
+            if self._is_current(n): continue
+            ok = self._load(n) and ok
+        return ok
+
+    def load_all(self) -> bool:
+        return self.require(*self.modules)
+
+    def invalidate(self, name=None):
+        """Forces the next require() to re-check (or reload) 'name', or every module."""
+        if name is None: self._records.clear()
+        else: self._records.pop(name, None)
+
+    def is_loaded(self, name) -> bool:
+        return name in self._records
+
+    def report(self):
+        lines = ["📜 [MxsLoader] MaxScript modules:"]
+        for n in self.dependency_order():
+            rec = self._records.get(n)
+            if rec is None:
+                lines.append(f"    - {n:<22} (not loaded)")
+                continue
+            how = "adopted" if rec.adopted else f"{rec.load_ms:7.1f} ms x{rec.loads}"
+            lines.append(f"    - {n:<22} {how:<16} {os.path.basename(rec.path)}")
+        rt.print("\n".join(lines))
+
+
+mxs_loader = MxsModuleLoader()
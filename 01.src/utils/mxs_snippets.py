@@ -0,0 +1,101 @@
+# ohCHA_RigManager/01/src/utils/mxs_snippets.py
+# Description: [v1.0] Compiled MaxScript Snippet Registry.
+#              - Each parameterized snippet body is compiled ONCE into a MaxScript function
+#                (rt.execute of an 'fn' definition) and then called directly with pymxs values.
+#              - Replaces execute_mxs_as_file (temp file write + fileIn + delete per call).
+#              - benchmark_call_overhead(): before/after timing for the Listener.
+
+import time
+import textwrap
+from pymxs import runtime as rt
+
+try:
+    from utils.ohcha_max_utils import OchaError, execute_mxs_as_file
+except ImportError:
+    class OchaError(Exception): pass
+    execute_mxs_as_file = None
+
+_PREFIX = "ohCHA_Snip_"
+
+
+class MxsSnippetRegistry:
+    """
+    name -> (params, body). body 는 params 를 지역 변수로 사용하는 MaxScript 식입니다.
+    Errors inside a snippet are caught in MaxScript and reported as 'undefined' (None), like execute_mxs_as_file.
+    """
+
+    def __init__(self):
+        self._sources = {}
+        self._compiled = {}
+
+    def register(self, name: str, params, body: str):
+        params = tuple(params) if not isinstance(params, str) else tuple(params.split())
+        if not params: raise ValueError(f"Snippet '{name}' needs at least one parameter.")
+        self._sources[name] = (params, textwrap.dedent(body).strip())
+        self._compiled.pop(name, None)
+        return name
+
+    def is_registered(self, name: str) -> bool:
+        return name in self._sources
+
+    def source(self, name: str) -> str:
+        params, body = self._sources[name]
+        return textwrap.dedent(f"""
+        fn {_PREFIX}{name} {' '.join(params)} =
+        (
+            local result = undefined
+            try ( result = ( {body} ) )
+            catch ( format "MXS_ERROR [{name}]: %\\n" (getCurrentException()); result = undefined )
+            result
+        )
+        """)
+
+    def _compile(self, name: str):
+        if name not in self._sources: raise OchaError(f"Unknown MaxScript snippet: {name}")
+        try:
+            fn = rt.execute(self.source(name))
+        except Exception as e:
+            raise OchaError(f"Snippet Compile Error ({name}): {e}")
+        self._compiled[name] = fn
+        return fn
+
+    def call(self, name: str, *args):
+        fn = self._compiled.get(name) or self._compile(name)
+        try:
+            return fn(*args)
+        except Exception as e:
+            raise OchaError(f"Script Error ({name}): {e}")
+
+    def call_on_node(self, name: str, node, *args):
+        if not node or not rt.isValidNode(node): raise OchaError(f"Invalid Node: {node}")
+        return self.call(name, node, *args)
+
+    def invalidate(self, name: str = None):
+        """Drops compiled functions (they are recompiled on the next call)."""
+        if name is None: self._compiled.clear()
+        else: self._compiled.pop(name, None)
+
+
+mxs_snippets = MxsSnippetRegistry()
+
+mxs_snippets.register("bench_noop", "ohCHA_Logic_TargetNode", "ohCHA_Logic_TargetNode.name")
+
+
+def benchmark_call_overhead(node, iterations: int = 50):
+    """Prints the per-call overhead of execute_mxs_as_file vs. a compiled snippet (run from the Listener)."""
+    if execute_mxs_as_file is None or not rt.isValidNode(node): return None
+    t = time.perf_counter()
+    for _ in range(iterations): execute_mxs_as_file("ohCHA_Logic_TargetNode.name", node=node)
+    before = (time.perf_counter() - t) * 1000 / iterations
+
+    mxs_snippets.invalidate("bench_noop")
+    t = time.perf_counter()
+    mxs_snippets.call_on_node("bench_noop", node)
+    compile_ms = (time.perf_counter() - t) * 1000
+    t = time.perf_counter()
+    for _ in range(iterations): mxs_snippets.call_on_node("bench_noop", node)
+    after = (time.perf_counter() - t) * 1000 / iterations
+
+    rt.print(f"🕒 [MxsSnippets] temp-file fileIn: {before:.3f} ms/call | compiled snippet: {after:.3f} ms/call "
+             f"(first call incl. compile {compile_ms:.2f} ms) | x{before / max(after, 1e-6):.0f}")
+    return before, after
@@ -0,0 +1,95 @@
+# ohCHA_RigManager/01/src/utils/ohcha_event_bridge.py
+# Description: [v1.0] Max -> Qt Event Bridge (replaces the 200 ms selection polling timer).
+#              - NodeEventCallback (selection / sub-object selection, delivered on mouse-up) and
+#                general callbacks (#modPanelObjPostChange, #modPanelSubObjectLevelChanged, ...).
+#              - Callbacks only record the event name; one zero-delay Qt timer flushes them as a single
+#                'eventsPosted' emission, so bursts of Max notifications cost one UI sync.
+
+from pymxs import runtime as rt
+from PySide6.QtCore import QObject, QTimer, Signal
+
+CALLBACK_ID = "ohCHA_EventBridge"
+
+EVT_SELECTION = "selection"
+EVT_SUBOBJECT = "subobject"
+EVT_MODPANEL = "modpanel"
+EVT_SCENE = "scene"
+
+_GENERAL_CALLBACKS = {
+    "modPanelObjPostChange": EVT_MODPANEL,
+    "modPanelSubObjectLevelChanged": EVT_MODPANEL,
+    "filePostOpen": EVT_SCENE,
+    "systemPostReset": EVT_SCENE,
+    "systemPostNew": EVT_SCENE,
+}
+
+
+class MaxEventBridge(QObject):
+    eventsPosted = Signal(list)
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self._pending = set()
+        self._node_cb = None
+        self._general_cbs = []  # keeps the Python callables alive while registered
+        self._active = False
+
+        self._flush_timer = QTimer(self)
+        self._flush_timer.setSingleShot(True)
+        self._flush_timer.setInterval(0)
+        self._flush_timer.timeout.connect(self._flush)
+
+    @property
+    def is_active(self) -> bool:
+        return self._active
+
+    def post(self, event_name: str):
+        """Records an event; safe to call from inside Max callbacks (no pymxs work here)."""
+        self._pending.add(event_name)
+        if not self._flush_timer.isActive(): self._flush_timer.start()
+
+    def _flush(self):
+        if not self._pending: return
+        events = sorted(self._pending)
+        self._pending.clear()
+        self.eventsPosted.emit(events)
+
+    def start(self):
+        if self._active: return
+        try:
+            self._node_cb = rt.NodeEventCallback(
+                mouseUp=True,
+                selectionChanged=lambda *a: self.post(EVT_SELECTION),
+                subobjectSelectionChanged=lambda *a: self.post(EVT_SUBOBJECT),
+                deleted=lambda *a: self.post(EVT_SCENE))
+        except Exception as e:
+            self._node_cb = None
+            rt.print(f"⚠️ [EventBridge] NodeEventCallback 등록 실패: {e}")
+
+        cb_id = rt.Name(CALLBACK_ID)
+        for cb_name, evt in _GENERAL_CALLBACKS.items():
+            fn = (lambda e: (lambda *a: self.post(e)))(evt)
+            try:
+                rt.callbacks.addScript(rt.Name(cb_name), fn, id=cb_id)
+                self._general_cbs.append(fn)
+            except Exception as e:
+                rt.print(f"⚠️ [EventBridge] callbacks.addScript #{cb_name} 실패: {e}")
+        self._active = True
+
+    def stop(self):
+        if not self._active: return
+        self._active = False
+        self._flush_timer.stop()
+        self._pending.clear()
+        try:
+            rt.callbacks.removeScripts(id=rt.Name(CALLBACK_ID))
+        except Exception:
+            pass
+        self._general_cbs = []
+        if self._node_cb is not None:
+            # NodeEventCallbacks unregister once no longer referenced and collected.
+            self._node_cb = None
+            try:
+                rt.gc(light=True)
+            except Exception:
+                pass
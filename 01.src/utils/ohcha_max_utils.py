@@ -1,9 +1,10 @@
 # ohCHA_RigManager/01/src/utils/ohcha_max_utils.py
-# Description: [v1.9.2] Added 'world_pos' parsing to get_skin_bone_data for Hybrid Mapping.
+# Description: [v1.10.0] SkinBoneTable: columnar bone cache, rebuilt only when the Skin bone list changes.
 
 import pymxs
 from pymxs import runtime as rt
 import traceback, textwrap, tempfile, os
+from array import array
 
 
 class OchaError(Exception): pass
@@ -133,4 +134,90 @@ def get_skin_bone_data(skin_mod) -> list[dict]:
         return bone_list
     except Exception as e:
         rt.print(f"❌ [MaxUtils] get_skin_bone_data 오류: {e}")
-        return []
\ No newline at end of file
+        return []
+
+
+class SkinBoneTable:
+    """
+    Skin 본 목록의 컬럼형 캐시 (names / ids / handles / parents / layers / positions).
+    매 호출마다 getBoneSignature (본 개수 + 이름) 한 번으로 변경 여부만 확인하고,
+    바뀐 경우에만 getBoneTableColumns 한 번으로 전체를 다시 읽습니다.
+    Note: bone transforms / scene layers are NOT part of the signature; call invalidate() to force a re-read.
+    """
+
+    def __init__(self):
+        self.reset()
+
+    def reset(self):
+        self.names = []
+        self.ids = []
+        self.handles = []
+        self.parents = []
+        self.layers = []
+        self.positions = array('d')  # flat xyz
+        self._signature = None
+        self._rows = None
+
+    def invalidate(self):
+        self._signature = None
+
+    def __len__(self):
+        return len(self.names)
+
+    def refresh(self, skin_mod, owner_node=None) -> bool:
+        """Re-reads the table if the bone list changed. Returns True when a rebuild happened."""
+        if skin_mod is None or skin_mod == rt.undefined:
+            if self._signature is not None or self.names: self.reset()
+            return False
+        try:
+            sig = str(rt.ohCHA_DataUtil.getBoneSignature(skin_mod))
+        except Exception:
+            sig = None  # Older MS struct loaded: always rebuild.
+        if sig is not None and sig == self._signature: return False
+
+        try:
+            if owner_node is None or not rt.isValidNode(owner_node):
+                owner_node = rt.refs.dependentNodes(skin_mod)[0]
+            self._load_columns(owner_node)
+            self._signature = sig
+        except Exception as e:
+            rt.print(f"❌ [MaxUtils] SkinBoneTable refresh 오류: {e}")
+            self.reset()
+        return True
+
+    def _load_columns(self, owner_node):
+        try:
+            cols = rt.ohCHA_DataUtil.getBoneTableColumns(owner_node)
+            names, handles, parents, layers, xs, ys, zs = (list(c) for c in cols)
+        except AttributeError:
+            # Fallback: row-based query (pre v2.6.0 data utils).
+            rows = [list(r) for r in rt.ohCHA_DataUtil.getBoneDataWithHierarchy(owner_node)]
+            names = [r[0] for r in rows]
+            handles = [r[2] for r in rows]
+            parents = [r[3] for r in rows]
+            layers = [r[4] for r in rows]
+            xs, ys, zs = ([r[k] if len(r) >= 8 else 0.0 for r in rows] for k in (5, 6, 7))
+
+        self.names = [str(n) for n in names]
+        self.ids = list(range(1, len(self.names) + 1))
+        self.handles = [str(h) for h in handles]
+        self.parents = [str(h) for h in parents]
+        self.layers = [str(l) for l in layers]
+        pos = array('d')
+        for x, y, z in zip(xs, ys, zs): pos.extend((float(x), float(y), float(z)))
+        self.positions = pos
+        self._rows = None
+
+    def as_dicts(self) -> list[dict]:
+        """get_skin_bone_data() layout. The list is cached (same object until the next rebuild) - do not mutate."""
+        if self._rows is None:
+            p = self.positions
+            self._rows = [{
+                "name": self.names[i],
+                "id": self.ids[i],
+                "handle": self.handles[i],
+                "parent_handle": self.parents[i],
+                "layer_name": self.layers[i],
+                "world_pos": [p[i * 3], p[i * 3 + 1], p[i * 3 + 2]]
+            } for i in range(len(self.names))]
+        return self._rows
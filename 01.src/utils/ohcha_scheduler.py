@@ -0,0 +1,93 @@
+# ohCHA_RigManager/01/src/utils/ohcha_scheduler.py
+# Description: [v1.1] Time-Sliced Work Scheduler (no modal dialog, no processEvents).
+#              - Work keys are processed in chunks from a zero-delay QTimer; each tick stops once the
+#                per-frame budget is used, so the UI keeps painting and handling input between ticks.
+#              - Chunk size adapts to the measured cost per key.
+#              - prioritize() moves keys (visible rows, selection) to the front; cancel() stops at the next tick.
+#              - FIXED: an exception from work_fn is logged and cancels the job (finished(False)) instead of
+#                escaping the tick and leaving the job stuck.
+
+import time
+from collections import deque
+from pymxs import runtime as rt
+from PySide6.QtCore import QObject, QTimer, Signal
+
+FRAME_BUDGET_MS = 12.0
+
+
+class TimeSlicedScheduler(QObject):
+    chunkDone = Signal(object)    # work_fn(chunk) result
+    progress = Signal(int, int)   # done, total
+    finished = Signal(bool)       # True = completed, False = cancelled
+
+    def __init__(self, work_fn, chunk_size: int = 32, budget_ms: float = FRAME_BUDGET_MS,
+                 max_chunk: int = 512, parent=None):
+        super().__init__(parent)
+        self.work_fn = work_fn
+        self.budget_ms = budget_ms
+        self.max_chunk = max_chunk
+        self._initial_chunk = chunk_size
+        self._chunk = chunk_size
+        self._queue = deque()
+        self._queued = set()
+        self._total = 0
+        self._done = 0
+
+        self._timer = QTimer(self)
+        self._timer.setSingleShot(True)
+        self._timer.setInterval(0)
+        self._timer.timeout.connect(self._tick)
+
+    @property
+    def is_running(self) -> bool:
+        return bool(self._queue) or self._timer.isActive()
+
+    def start(self, keys):
+        self.cancel(emit=False)
+        self._queue = deque(keys)
+        self._queued = set(self._queue)
+        self._total = len(self._queue)
+        self._done = 0
+        self._chunk = self._initial_chunk
+        if self._queue: self._timer.start()
+        else: self.finished.emit(True)
+
+    def prioritize(self, keys):
+        """Moves still-queued keys to the front, keeping their given order."""
+        front = [k for k in keys if k in self._queued]
+        if not front: return
+        first = set(front)
+        self._queue = deque(front + [k for k in self._queue if k not in first])
+
+    def cancel(self, emit: bool = True):
+        was_running = self.is_running
+        self._timer.stop()
+        self._queue.clear()
+        self._queued.clear()
+        if was_running and emit: self.finished.emit(False)
+
+    def _tick(self):
+        t0 = time.perf_counter()
+        while self._queue:
+            chunk = [self._queue.popleft() for _ in range(min(self._chunk, len(self._queue)))]
+            self._queued.difference_update(chunk)
+
+            t = time.perf_counter()
+            try:
+                result = self.work_fn(chunk)
+            except Exception as e:
+                rt.print(f"❌ [Scheduler] Work failed, job cancelled: {e}")
+                self.cancel(emit=False)
+                self.finished.emit(False)
+                return
+            per_key_ms = (time.perf_counter() - t) * 1000 / len(chunk)
+            # Next chunk sized to roughly half the frame budget.
+            self._chunk = max(1, min(self.max_chunk, int(self.budget_ms * 0.5 / max(per_key_ms, 1e-3))))
+
+            self._done += len(chunk)
+            self.chunkDone.emit(result)
+            self.progress.emit(self._done, self._total)
+            if (time.perf_counter() - t0) * 1000 >= self.budget_ms: break
+
+        if self._queue: self._timer.start()
+        else: self.finished.emit(True)
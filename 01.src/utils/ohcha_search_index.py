@@ -0,0 +1,142 @@
+# ohCHA_RigManager/01/src/utils/ohcha_search_index.py
+# Description: [v1.0] Shared Name Search Index (Bone Explorer / Guide Explorer).
+#              - Built once per population: lower-case names, trigram index, sorted prefix table,
+#                L/R side tags and ancestor chains.
+#              - Query syntax:  "arm" (substring)  "^bip" (prefix)  "/_l$/" or "re:_l$" (regex)
+#                               "L: arm" / "R: ^hand" (side filter, combinable with the above)
+
+import re
+import bisect
+import collections
+
+SIDE_LEFT, SIDE_RIGHT = "L", "R"
+
+_TOKEN_SPLIT = re.compile(r"[\s_\-.:|]+")
+_SIDE_TOKENS = {"l": SIDE_LEFT, "left": SIDE_LEFT, "lf": SIDE_LEFT, "r": SIDE_RIGHT, "right": SIDE_RIGHT, "rt": SIDE_RIGHT}
+_SIDE_PREFIX = re.compile(r"^\s*([lLrR])\s*:\s*")
+
+
+def detect_side(name: str) -> str | None:
+    """'Bip001 L Thigh', 'L_Arm', 'arm_r', 'Left_Hand' -> 'L'/'R'. Returns None for center / unknown."""
+    for token in _TOKEN_SPLIT.split(name.lower()):
+        side = _SIDE_TOKENS.get(token)
+        if side: return side
+    lower = name.lower()
+    if lower.startswith("left"): return SIDE_LEFT
+    if lower.startswith("right"): return SIDE_RIGHT
+    return None
+
+
+def parse_query(text: str) -> tuple:
+    """Returns (kind, pattern, side). kind: 'all' / 'substring' / 'prefix' / 'regex'."""
+    text = text or ""
+    side = None
+    m = _SIDE_PREFIX.match(text)
+    if m:
+        side = m.group(1).upper()
+        text = text[m.end():]
+    text = text.strip()
+
+    if len(text) >= 2 and text.startswith("/") and text.endswith("/"): return "regex", text[1:-1], side
+    if text.lower().startswith("re:"): return "regex", text[3:], side
+    if text.startswith("^") and len(text) > 1: return "prefix", text[1:].lower(), side
+    if not text: return "all", "", side
+    return "substring", text.lower(), side
+
+
+class NameSearchIndex:
+    """
+    names[i] / parents[i] (-1 = root) 로 구성된 트리 또는 리스트의 검색 인덱스.
+    query() 는 일치 항목과, 일치 항목의 조상까지 포함한 '보여야 할' 집합을 돌려줍니다.
+    """
+
+    def __init__(self, names=(), parents=None):
+        self.build(names, parents)
+
+    def build(self, names, parents=None):
+        self.names = list(names)
+        self.lower = [n.lower() for n in self.names]
+        self.parents = list(parents) if parents is not None else [-1] * len(self.names)
+        self.sides = [detect_side(n) for n in self.names]
+
+        grams = collections.defaultdict(set)
+        for i, n in enumerate(self.lower):
+            for k in range(len(n) - 2): grams[n[k:k + 3]].add(i)
+        self._grams = grams
+        self._prefix_table = sorted((n, i) for i, n in enumerate(self.lower))
+        self._ancestors = [None] * len(self.names)   # filled lazily, shared through parents
+        self._last = None
+
+    def __len__(self):
+        return len(self.names)
+
+    def ancestors(self, i: int) -> tuple:
+        """Ancestor chain of 'i' (nearest first). Chains are memoized per node."""
+        chain = self._ancestors[i]
+        if chain is not None: return chain
+        path = []
+        node = i
+        while node >= 0 and self._ancestors[node] is None:
+            path.append(node)
+            node = self.parents[node]
+        tail = self._ancestors[node] if node >= 0 else ()
+        for n in reversed(path):
+            p = self.parents[n]
+            tail = () if p < 0 else (p,) + tail
+            self._ancestors[n] = tail
+        return self._ancestors[i]
+
+    def match(self, text: str) -> set | None:
+        """Indices whose own name matches 'text'. None means 'no filter' (everything matches)."""
+        kind, pattern, side = parse_query(text)
+        if kind == "all":
+            if side is None: return None
+            return {i for i, s in enumerate(self.sides) if s == side}
+
+        if kind == "substring":
+            if len(pattern) >= 3:
+                cands = None
+                for k in range(len(pattern) - 2):
+                    ids = self._grams.get(pattern[k:k + 3])
+                    if not ids: return set()
+                    cands = set(ids) if cands is None else cands & ids
+                    if not cands: return set()
+                found = {i for i in cands if pattern in self.lower[i]}
+            else:
+                found = {i for i, n in enumerate(self.lower) if pattern in n}
+        elif kind == "prefix":
+            table = self._prefix_table
+            lo = bisect.bisect_left(table, (pattern,))
+            found = set()
+            for n, i in table[lo:]:
+                if not n.startswith(pattern): break
+                found.add(i)
+        else:
+            try:
+                rx = re.compile(pattern, re.IGNORECASE)
+                found = {i for i, n in enumerate(self.names) if rx.search(n)}
+            except re.error:
+                # Half-typed pattern: behave like a literal substring until it compiles.
+                literal = pattern.lower()
+                found = {i for i, n in enumerate(self.lower) if literal in n}
+
+        if side is not None: found = {i for i in found if self.sides[i] == side}
+        return found
+
+    def query(self, text: str) -> tuple:
+        """Returns (matches, visible). Both None when the query is empty. Last result is cached."""
+        key = text or ""
+        if self._last is not None and self._last[0] == key: return self._last[1]
+        matches = self.match(key)
+        visible = None
+        if matches is not None:
+            visible = set(matches)
+            for i in matches: visible.update(self.ancestors(i))
+        self._last = (key, (matches, visible))
+        return matches, visible
+
+    def visible_for(self, indices) -> set:
+        """'indices' plus all their ancestors (for id-based filtering)."""
+        visible = set(indices)
+        for i in indices: visible.update(self.ancestors(i))
+        return visible
@@ -0,0 +1,285 @@
+# ohCHA_RigManager/01/src/utils/ohcha_skin_stream.py
+# Description: [v1.1] Streaming Loader / Writer for (legacy) .ohchaSkin sidecars.
+#              - Parses the file in chunks; each layer's 'weights' object is decoded entry by entry
+#                straight into columnar arrays (PackedLayerWeights), never as a full dict tree.
+#              - FIXED: dump_skin_file writes packed layers row by row (iter_rows) instead of rebuilding
+#                the dict tree through to_dict() on every save.
+#              - FIXED: row batches are comma-joined before each batch (an exact multiple of the batch size
+#                left a trailing ',' and an unreadable sidecar).
+#              - Small files keep using plain json.load.
+
+import os
+import json
+import bisect
+from array import array
+from collections.abc import MutableMapping
+
+STREAM_THRESHOLD_BYTES = 32 * 1024 * 1024
+_CHUNK_SIZE = 1024 * 1024
+_WS = " \t\n\r"
+
+
+class PackedLayerWeights(MutableMapping):
+    """
+    Layer 'weights' ({"vert_id": [[bone_ids], [weights]]}) stored as flat arrays.
+    Reads slice the arrays; writes/deletes go to a small overlay, so the packed base stays immutable.
+    """
+
+    def __init__(self):
+        self._verts = array('i')
+        self._offsets = array('i', [0])
+        self._bones = array('i')
+        self._weights = array('d')
+        self._is_sorted = True
+        self._index = None
+        self._overlay = {}
+        self._deleted = set()
+
+    # --- Building ---
+    def append_row(self, vert_id: int, bones, weights):
+        if self._is_sorted and self._verts and vert_id <= self._verts[-1]: self._is_sorted = False
+        self._verts.append(vert_id)
+        self._bones.extend(int(b) for b in bones)
+        self._weights.extend(float(w) for w in weights)
+        self._offsets.append(len(self._bones))
+
+    def _row(self, key) -> int | None:
+        try:
+            v = int(key)
+        except (TypeError, ValueError):
+            return None
+        if self._is_sorted:
+            i = bisect.bisect_left(self._verts, v)
+            return i if i < len(self._verts) and self._verts[i] == v else None
+        if self._index is None: self._index = {vid: i for i, vid in enumerate(self._verts)}
+        return self._index.get(v)
+
+    def _row_value(self, row: int) -> list:
+        o0, o1 = self._offsets[row], self._offsets[row + 1]
+        return [self._bones[o0:o1].tolist(), self._weights[o0:o1].tolist()]
+
+    # --- Mapping API (str keys, like the plain dict it replaces) ---
+    def __getitem__(self, key):
+        if key in self._overlay: return self._overlay[key]
+        if key in self._deleted: raise KeyError(key)
+        row = self._row(key)
+        if row is None: raise KeyError(key)
+        return self._row_value(row)
+
+    def __setitem__(self, key, value):
+        self._overlay[key] = value
+        self._deleted.discard(key)
+
+    def __delitem__(self, key):
+        found = self._overlay.pop(key, None) is not None
+        if key not in self._deleted and self._row(key) is not None:
+            self._deleted.add(key)
+            found = True
+        if not found: raise KeyError(key)
+
+    def __contains__(self, key):
+        if key in self._overlay: return True
+        return key not in self._deleted and self._row(key) is not None
+
+    def __iter__(self):
+        for v in self._verts:
+            k = str(v)
+            if k not in self._deleted or k in self._overlay: yield k
+        for k in self._overlay:
+            if self._row(k) is None: yield k
+
+    def __len__(self):
+        extra = sum(1 for k in self._overlay if self._row(k) is None)
+        return len(self._verts) - len(self._deleted) + extra
+
+    def iter_rows(self):
+        """Fast path: yields (vert_id:int, bone_ids, weights) without building str keys for the packed base."""
+        overlay, deleted = self._overlay, self._deleted
+        for row, v in enumerate(self._verts):
+            if overlay or deleted:
+                k = str(v)
+                if k in overlay:
+                    bones, weights = overlay[k]
+                    yield v, bones, weights
+                    continue
+                if k in deleted: continue
+            o0, o1 = self._offsets[row], self._offsets[row + 1]
+            yield v, self._bones[o0:o1], self._weights[o0:o1]
+        for k, (bones, weights) in overlay.items():
+            if self._row(k) is None: yield int(k), bones, weights
+
+    def copy(self):
+        clone = PackedLayerWeights.__new__(PackedLayerWeights)
+        clone.__dict__.update(self.__dict__)
+        clone._overlay = dict(self._overlay)
+        clone._deleted = set(self._deleted)
+        return clone
+
+    def to_dict(self) -> dict:
+        return {k: self[k] for k in self}
+
+
+def json_default(obj):
+    """json.dump 'default' hook so PackedLayerWeights serializes like the dict it replaces."""
+    if isinstance(obj, PackedLayerWeights): return obj.to_dict()
+    raise TypeError(f"Object of type {type(obj).__name__} is not JSON serializable")
+
+
+class _StreamCursor:
+    def __init__(self, f):
+        self._f = f
+        self._buf = ""
+        self._pos = 0
+        self._eof = False
+        self._decoder = json.JSONDecoder()
+
+    def _fill(self, size: int = _CHUNK_SIZE) -> bool:
+        if self._eof: return False
+        if self._pos > _CHUNK_SIZE:
+            self._buf = self._buf[self._pos:]
+            self._pos = 0
+        chunk = self._f.read(size)
+        if not chunk:
+            self._eof = True
+            return False
+        self._buf += chunk
+        return True
+
+    def peek(self) -> str:
+        while True:
+            while self._pos < len(self._buf) and self._buf[self._pos] in _WS: self._pos += 1
+            if self._pos < len(self._buf): return self._buf[self._pos]
+            if not self._fill(): return ""
+
+    def expect(self, ch: str):
+        got = self.peek()
+        if got != ch: raise ValueError(f"Expected '{ch}' but got '{got}' at offset {self._pos}")
+        self._pos += 1
+
+    def accept(self, ch: str) -> bool:
+        if self.peek() == ch:
+            self._pos += 1
+            return True
+        return False
+
+    def value(self):
+        """Decodes one JSON value, pulling more data until it is complete (grows geometrically)."""
+        self.peek()
+        while True:
+            try:
+                obj, end = self._decoder.raw_decode(self._buf, self._pos)
+                # A number touching the buffer end may be truncated ("0.12|34").
+                if end < len(self._buf) or self._eof:
+                    self._pos = end
+                    return obj
+            except json.JSONDecodeError:
+                if self._eof: raise
+            self._fill(max(_CHUNK_SIZE, len(self._buf) - self._pos))
+
+
+def _iter_object(cur: _StreamCursor):
+    """Yields keys of a JSON object; the caller must consume each value before the next key."""
+    cur.expect("{")
+    if cur.accept("}"): return
+    while True:
+        key = cur.value()
+        cur.expect(":")
+        yield key
+        if cur.accept(","): continue
+        cur.expect("}")
+        return
+
+
+def _read_weights(cur: _StreamCursor) -> PackedLayerWeights:
+    packed = PackedLayerWeights()
+    for key in _iter_object(cur):
+        bones, weights = cur.value()
+        packed.append_row(int(key), bones, weights)
+    return packed
+
+
+def _read_layer(cur: _StreamCursor) -> dict:
+    layer = {}
+    for key in _iter_object(cur):
+        layer[key] = _read_weights(cur) if key == "weights" else cur.value()
+    return layer
+
+
+def _read_layers(cur: _StreamCursor) -> list:
+    layers = []
+    cur.expect("[")
+    if cur.accept("]"): return layers
+    while True:
+        layers.append(_read_layer(cur))
+        if cur.accept(","): continue
+        cur.expect("]")
+        return layers
+
+
+def stream_load_skin_file(path: str) -> dict:
+    with open(path, 'r', encoding='utf-8') as f:
+        cur = _StreamCursor(f)
+        data = {}
+        for key in _iter_object(cur):
+            data[key] = _read_layers(cur) if key == "layers" else cur.value()
+        return data
+
+
+def load_skin_file(path: str, threshold: int = STREAM_THRESHOLD_BYTES) -> dict:
+    """Loads an .ohchaSkin file, streaming it when it is larger than 'threshold' bytes."""
+    if os.path.getsize(path) > threshold:
+        return stream_load_skin_file(path)
+    with open(path, 'r', encoding='utf-8') as f:
+        return json.load(f)
+
+
+_COMPACT = (",", ":")
+_WRITE_BATCH = 4096
+
+
+def _dumps(obj) -> str:
+    return json.dumps(obj, separators=_COMPACT, default=json_default)
+
+
+def _write_packed(f, packed: PackedLayerWeights):
+    """'weights' object, one row at a time (same output as json.dump of the dict)."""
+    f.write("{")
+    buf, first = [], True
+    for v, bones, weights in packed.iter_rows():
+        buf.append(f'"{v}":[{_dumps(list(bones))},{_dumps(list(weights))}]')
+        if len(buf) >= _WRITE_BATCH:
+            if not first: f.write(",")
+            f.write(",".join(buf))
+            buf, first = [], False
+    if buf:
+        if not first: f.write(",")
+        f.write(",".join(buf))
+    f.write("}")
+
+
+def _write_value(f, obj):
+    """Streams dicts / lists that may hold packed layers; anything else goes through json.dumps."""
+    if isinstance(obj, PackedLayerWeights):
+        _write_packed(f, obj)
+    elif isinstance(obj, dict):
+        f.write("{")
+        for i, (k, v) in enumerate(obj.items()):
+            if i: f.write(",")
+            f.write(_dumps(str(k)))
+            f.write(":")
+            _write_value(f, v)
+        f.write("}")
+    elif isinstance(obj, (list, tuple)) and any(isinstance(x, (dict, list, tuple)) for x in obj):
+        f.write("[")
+        for i, v in enumerate(obj):
+            if i: f.write(",")
+            _write_value(f, v)
+        f.write("]")
+    else:
+        f.write(_dumps(obj))
+
+
+def dump_skin_file(data: dict, path: str):
+    """Writes compact JSON (no indent): legacy indent=4 sidecars migrate on their next save."""
+    with open(path, 'w', encoding='utf-8') as f:
+        _write_value(f, data)
@@ -0,0 +1,54 @@
+# ohCHA_RigManager/01/src/utils/ohcha_timing.py
+# Description: [v1.1] Startup / Load Timing.
+#              - StageTimer: named stages (mark() or 'with timer.stage(...)'), printed as one breakdown.
+#              - add(): a stage measured before the last reset() (e.g. module imports) counted into this run.
+
+import time
+import contextlib
+from pymxs import runtime as rt
+
+
+class StageTimer:
+    def __init__(self, title: str):
+        self.title = title
+        self.reset()
+
+    def reset(self):
+        self._t0 = time.perf_counter()
+        self._last = self._t0
+        self.stages = []  # [(label, seconds)]
+
+    def mark(self, label: str) -> float:
+        """Closes the stage that started at the previous mark (or reset)."""
+        now = time.perf_counter()
+        dt = now - self._last
+        self.stages.append((label, dt))
+        self._last = now
+        return dt
+
+    def add(self, label: str, seconds: float):
+        """Records a stage that ran before reset(); the total includes it."""
+        self.stages.insert(0, (label, seconds))
+        self._t0 -= seconds
+
+    @contextlib.contextmanager
+    def stage(self, label: str):
+        t = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.stages.append((label, time.perf_counter() - t))
+            self._last = time.perf_counter()
+
+    @property
+    def total(self) -> float:
+        return self._last - self._t0
+
+    def report(self):
+        lines = [f"🕒 [{self.title}] {self.total * 1000:.1f} ms"]
+        for label, dt in self.stages:
+            lines.append(f"    - {label:<28} {dt * 1000:8.1f} ms")
+        rt.print("\n".join(lines))
+
+
+startup_timer = StageTimer("Startup")
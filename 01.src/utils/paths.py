@@ -1,15 +1,30 @@
 # ohCHA_RigManager/01/src/utils/paths.py
-# Description: [v20.96] Added 'find_script_path' for multi-format support.
+# Description: [v20.97] Memoized project root / script path resolution.
 
 import os
 from pymxs import runtime as rt
 
+_root_cache = None
+_script_path_cache = {}
+
+
+def clear_path_cache():
+    global _root_cache
+    _root_cache = None
+    _script_path_cache.clear()
+
 
 def get_project_root() -> str | None:
     """
     이 스크립트(paths.py)의 위치를 기준으로 프로젝트 루트 폴더
-    (ohCHA_RigManager)의 절대 경로를 찾습니다.
+    (ohCHA_RigManager)의 절대 경로를 찾습니다. (결과는 캐시됩니다)
     """
+    global _root_cache
+    if _root_cache is None: _root_cache = _resolve_project_root()
+    return _root_cache
+
+
+def _resolve_project_root() -> str | None:
     try:
         try:
             current_file_path = os.path.abspath(__file__)
@@ -48,7 +63,11 @@ def find_script_path(script_name_no_ext: str) -> str | None:
     """
     '01.src/scripts' 폴더에서 해당 이름의 스크립트를 찾습니다.
     우선순위: .mse (Encrypted) > .ms (Script) > .txt (Text)
+    Resolved paths are memoized; a cached path is re-resolved only if the file disappeared.
     """
+    cached = _script_path_cache.get(script_name_no_ext)
+    if cached and os.path.exists(cached): return cached
+
     root = get_project_root()
     if not root: return None
 
@@ -60,6 +79,7 @@ def find_script_path(script_name_no_ext: str) -> str | None:
     for ext in extensions:
         full_path = os.path.join(scripts_dir, f"{script_name_no_ext}{ext}")
         if os.path.exists(full_path):
+            _script_path_cache[script_name_no_ext] = full_path
             return full_path
 
     return None
\ No newline at end of file
@@ -33,6 +33,7 @@ class Translator:
             # [1] Edit Mesh Tab
             # ========================================================
             "em_refresh_btn": {"en": "Refresh List", "kr": "리스트 갱신", "jp": "リスト更新", "cn": "刷新列表"},
+            "btn_stop": {"en": "Stop", "kr": "중지", "jp": "停止", "cn": "停止"},
             "em_scene_meshes": {"en": "Scene Meshes:", "kr": "씬 메시 목록:", "jp": "シーンメッシュ:", "cn": "场景网格:"},
             "em_btn_finalize": {"en": "Finalize Mesh", "kr": "메시 확정", "jp": "メッシュ確定", "cn": "完成网格"},
             "em_grp_inspector": {"en": "Mesh Inspector", "kr": "메시 검사기", "jp": "メッシュ検査", "cn": "网格检查器"},
@@ -63,6 +64,30 @@ class Translator:
             "chk_pivot_inf": {"en": "Pivot not at (0,0,0).", "kr": "피벗 위치 오류.", "jp": "ピボット位置エラー。",
                               "cn": "轴心错误。"},
             "chk_pivot_fix": {"en": "Move to Origin", "kr": "원점이동", "jp": "原点移動", "cn": "移至原点"},
+            "chk_degen_lbl": {"en": "Degenerate Faces", "kr": "면적 0 면", "jp": "縮退フェース", "cn": "退化面"},
+            "chk_degen_inf": {"en": "Zero-area faces found.", "kr": "면적이 0인 면이 있습니다.", "jp": "面積ゼロのフェースがあります。",
+                              "cn": "存在零面积面。"},
+            "chk_isolated_lbl": {"en": "Isolated Vertices", "kr": "고립 버텍스", "jp": "孤立頂点", "cn": "孤立顶点"},
+            "chk_isolated_inf": {"en": "Vertices not used by any face.", "kr": "면에 속하지 않은 버텍스.",
+                                 "jp": "フェースに属さない頂点。", "cn": "不属于任何面的顶点。"},
+            "chk_nonmanifold_lbl": {"en": "Non-Manifold Edges", "kr": "비매니폴드 엣지", "jp": "非多様体エッジ", "cn": "非流形边"},
+            "chk_nonmanifold_inf": {"en": "Edges shared by more than two faces.", "kr": "세 개 이상의 면이 공유하는 엣지.",
+                                    "jp": "3つ以上のフェースが共有するエッジ。", "cn": "被两个以上面共享的边。"},
+            "chk_dupverts_lbl": {"en": "Duplicate Vertices", "kr": "중복 버텍스", "jp": "重複頂点", "cn": "重复顶点"},
+            "chk_dupverts_inf": {"en": "Overlapping vertices (weld threshold).", "kr": "겹친 버텍스 (용접 거리 이내).",
+                                 "jp": "重なった頂点 (溶接しきい値)。", "cn": "重叠顶点 (焊接阈值内)。"},
+            "chk_seams_lbl": {"en": "Unwelded Seams", "kr": "미용접 이음새", "jp": "未溶接シーム", "cn": "未焊接接缝"},
+            "chk_seams_inf": {"en": "Open border vertices lying on another border.", "kr": "다른 경계와 겹친 열린 경계 버텍스.",
+                              "jp": "他の境界と重なる開いた境界頂点。", "cn": "与其他边界重叠的开放边界顶点。"},
+            "em_btn_geo_checks": {"en": "Check Geometry", "kr": "지오메트리 검사", "jp": "ジオメトリ検査", "cn": "检查几何体"},
+            "em_btn_geo_all": {"en": "Check All", "kr": "전체 검사", "jp": "全て検査", "cn": "全部检查"},
+            "tip_em_geo_all": {"en": "Runs the geometry checks on every listed mesh (unchanged meshes reuse cached results).",
+                               "kr": "목록의 모든 메시를 검사합니다 (변경 없는 메시는 캐시 결과 사용).",
+                               "jp": "一覧の全メッシュを検査します (未変更のメッシュはキャッシュを使用)。",
+                               "cn": "检查列表中的所有网格 (未更改的网格使用缓存结果)。"},
+            "tip_em_geo_checks": {"en": "Runs the slower geometry checks on the selected mesh.",
+                                  "kr": "선택한 메시에 대해 느린 지오메트리 검사를 실행합니다.",
+                                  "jp": "選択メッシュに低速なジオメトリ検査を実行します。", "cn": "对所选网格执行较慢的几何检查。"},
             "em_welcome_msg": {"en": "Select a mesh.", "kr": "메시를 선택하세요.", "jp": "メッシュ選択。", "cn": "选择网格。"},
             "msg_no_mesh": {"en": "No meshes found.", "kr": "메시 없음.", "jp": "メッシュなし。", "cn": "未找到网格。"},
             "btn_show_details": {"en": "Details", "kr": "상세", "jp": "詳細", "cn": "详情"},
@@ -192,6 +217,14 @@ class Translator:
             "tooltip_import": {"en": "Import base weights.", "kr": "베이스 웨이트 가져오기.", "jp": "ベース読込。",
                                "cn": "导入基础。"},
             "tooltip_collapse": {"en": "Collapse all layers.", "kr": "모든 레이어 합치기.", "jp": "全統合。", "cn": "全部合并。"},
+            "ctx_merge_down": {"en": "Merge Down", "kr": "아래 레이어와 병합", "jp": "下のレイヤーと結合", "cn": "向下合并"},
+            "ctx_collapse_range": {"en": "Collapse Range...", "kr": "범위 합치기...", "jp": "範囲を統合...", "cn": "合并范围..."},
+            "ctx_feather_mask": {"en": "Feather Mask...", "kr": "마스크 페더...", "jp": "マスクをぼかす...", "cn": "羽化遮罩..."},
+            "ctx_clear_feather": {"en": "Clear Feather", "kr": "페더 제거", "jp": "ぼかし解除", "cn": "清除羽化"},
+            "pop_feather_radius_label": {"en": "Feather radius (vertex rings):", "kr": "페더 반경 (버텍스 링 수):",
+                                         "jp": "ぼかし半径 (頂点リング数):", "cn": "羽化半径 (顶点环数):"},
+            "pop_collapse_range_label": {"en": "Collapse down to layer:", "kr": "합칠 마지막 레이어:", "jp": "統合する最下レイヤー:",
+                                         "cn": "合并至图层:"},
             "tooltip_add_layer": {"en": "Add new layer.", "kr": "레이어 추가.", "jp": "追加。", "cn": "添加。"},
             "tooltip_rem_layer": {"en": "Remove layer.", "kr": "레이어 삭제.", "jp": "削除。", "cn": "删除。"},
             "tooltip_move_up": {"en": "Move Up", "kr": "위로", "jp": "上へ", "cn": "上移"},
@@ -240,7 +273,13 @@ class Translator:
             "btn_copy": {"en": "Copy", "kr": "복사", "jp": "コピー", "cn": "复制"},
             "tip_copy": {"en": "Copy Weight", "kr": "웨이트 복사", "jp": "ウェイトコピー", "cn": "复制权重"},
             "btn_paste": {"en": "Paste", "kr": "붙여넣기", "jp": "貼付", "cn": "粘贴"},
-            "tip_paste": {"en": "Paste Weight", "kr": "웨이트 붙여넣기", "jp": "ウェイト貼付", "cn": "粘贴权重"},
+            "tip_paste": {"en": "Paste Weight (Right-click: Paste Mode)", "kr": "웨이트 붙여넣기 (우클릭: 붙여넣기 모드)",
+                          "jp": "ウェイト貼付 (右クリック: 貼付モード)", "cn": "粘贴权重 (右键: 粘贴模式)"},
+            "ctx_paste_average": {"en": "Paste Averaged", "kr": "평균 붙여넣기", "jp": "平均で貼付", "cn": "平均粘贴"},
+            "ctx_paste_nearest": {"en": "Paste by Nearest Position", "kr": "가장 가까운 위치로 붙여넣기",
+                                  "jp": "最近傍位置で貼付", "cn": "按最近位置粘贴"},
+            "ctx_paste_index": {"en": "Paste by Vertex Index", "kr": "버텍스 인덱스로 붙여넣기",
+                                "jp": "頂点インデックスで貼付", "cn": "按顶点索引粘贴"},
             "btn_smooth": {"en": "Smooth", "kr": "스무스", "jp": "スムース", "cn": "平滑"},
             "tip_smooth": {"en": "Smooth Weights", "kr": "웨이트 스무스", "jp": "ウェイトスムース", "cn": "平滑权重"},
             "btn_heal": {"en": "Heal", "kr": "힐", "jp": "ヒール", "cn": "修复"},
@@ -253,6 +292,10 @@ class Translator:
             # [Bone List Explorer] ⭐️ Added Missing Keys
             "view_label": {"en": "View:", "kr": "보기:", "jp": "表示:", "cn": "视图:"},
             "search_ph": {"en": "Search bones...", "kr": "본 검색...", "jp": "ボーン検索...", "cn": "搜索骨骼..."},
+            "tip_search_syntax": {"en": "arm = contains, ^bip = starts with, /_l$/ or re:_l$ = regex, 'L: ' / 'R: ' = side filter",
+                                  "kr": "arm = 포함, ^bip = 시작, /_l$/ 또는 re:_l$ = 정규식, 'L: ' / 'R: ' = 좌우 필터",
+                                  "jp": "arm = 含む, ^bip = 前方一致, /_l$/ または re:_l$ = 正規表現, 'L: ' / 'R: ' = 左右フィルター",
+                                  "cn": "arm = 包含, ^bip = 开头, /_l$/ 或 re:_l$ = 正则, 'L: ' / 'R: ' = 左右过滤"},
 
             # [Layer Tool]
             "layer_btn_save": {"en": "Save Preset", "kr": "프리셋 저장", "jp": "プリセット保存", "cn": "保存预设"},
@@ -283,6 +326,12 @@ class Translator:
             "layer_msg_loaded": {"en": "Preset Loaded.", "kr": "프리셋 로드됨.", "jp": "プリセット読込。",
                                  "cn": "预设已加载。"},
             "layer_msg_fail": {"en": "Failed.", "kr": "실패.", "jp": "失敗。", "cn": "失败。"},
+            "layer_msg_preset_diff": {"en": "{} new layers, {} moved, {} unchanged.\nApply preset?",
+                                      "kr": "새 레이어 {}개, 이동 {}개, 변경 없음 {}개.\n프리셋을 적용하시겠습니까?",
+                                      "jp": "新規 {}、移動 {}、変更なし {}。\nプリセットを適用しますか？",
+                                      "cn": "新建 {} 个，移动 {} 个，未变 {} 个。\n应用预设？"},
+            "layer_msg_preset_same": {"en": "Scene already matches the preset.", "kr": "씬이 이미 프리셋과 같습니다.",
+                                      "jp": "シーンは既にプリセットと一致しています。", "cn": "场景已与预设一致。"},
 
             # [Naming Tool]
             "name_grp_sel": {"en": "Selection", "kr": "선택", "jp": "選択", "cn": "选择"},
@@ -307,11 +356,34 @@ class Translator:
             "name_msg_success": {"en": "Renamed {} objects.", "kr": "{}개 객체 이름 변경 완료.", "jp": "{} 個の名前を変更。",
                                  "cn": "已重命名 {} 个对象。"},
             "name_msg_no_sel": {"en": "No selection.", "kr": "선택된 객체 없음.", "jp": "選択なし。", "cn": "无选择。"},
+            "name_lbl_summary": {"en": "Changed {} · Unchanged {} · Collisions {}", "kr": "변경 {} · 유지 {} · 중복 {}",
+                                 "jp": "変更 {} · 変更なし {} · 重複 {}", "cn": "更改 {} · 未变 {} · 重名 {}"},
+            "name_lbl_tpl": {"en": "Template:", "kr": "템플릿:", "jp": "テンプレート:", "cn": "模板:"},
+            "name_lbl_regex": {"en": "Match:", "kr": "정규식:", "jp": "正規表現:", "cn": "正则:"},
+            "name_chk_resolve": {"en": "Resolve Duplicates", "kr": "중복 자동 해결", "jp": "重複を自動解決", "cn": "自动解决重名"},
+            "name_msg_collide": {"en": "{} new names collide with other names. Edit the rules or enable 'Resolve Duplicates'.",
+                                 "kr": "새 이름 {}개가 다른 이름과 겹칩니다. 규칙을 수정하거나 '중복 자동 해결'을 켜세요.",
+                                 "jp": "{} 個の新しい名前が重複しています。規則を修正するか「重複を自動解決」を有効にしてください。",
+                                 "cn": "{} 个新名称与其他名称重复。请修改规则或启用“自动解决重名”。"},
+            "tip_name_tpl": {"en": "Overrides the rules when set. Tokens: {name} {orig} {parent} {side} {##} {0}~{9}",
+                             "kr": "입력하면 규칙 대신 사용. 토큰: {name} {orig} {parent} {side} {##} {0}~{9}",
+                             "jp": "入力時は規則の代わりに使用。トークン: {name} {orig} {parent} {side} {##} {0}~{9}",
+                             "cn": "填写后替代规则。标记: {name} {orig} {parent} {side} {##} {0}~{9}"},
 
             # [Common]
             "btn_grp_add": {"en": "+ Grp", "kr": "+ 그룹", "jp": "+ G", "cn": "+ 组"},
             "btn_grp_rem": {"en": "- Grp", "kr": "- 그룹", "jp": "- G", "cn": "- 组"},
             "btn_grp_ren": {"en": "Ren", "kr": "이름", "jp": "名", "cn": "名"},
+            "btn_grp_rules": {"en": "Rules", "kr": "규칙", "jp": "ルール", "cn": "规则"},
+            "tip_grp_rules": {"en": "Build groups from rule presets (name / hierarchy / layer / region).",
+                              "kr": "규칙 프리셋으로 그룹 생성 (이름 / 계층 / 레이어 / 영역).",
+                              "jp": "ルールプリセットでグループ作成 (名前 / 階層 / レイヤー / 領域)。",
+                              "cn": "按规则预设生成组 (名称 / 层级 / 图层 / 区域)。"},
+            "ctx_rules_apply": {"en": "Apply Preset", "kr": "프리셋 적용", "jp": "プリセット適用", "cn": "应用预设"},
+            "ctx_rules_none": {"en": "(No presets)", "kr": "(프리셋 없음)", "jp": "(プリセットなし)", "cn": "(无预设)"},
+            "ctx_rules_save": {"en": "Save Groups as Preset...", "kr": "현재 그룹을 프리셋으로 저장...",
+                               "jp": "グループをプリセット保存...", "cn": "将当前组保存为预设..."},
+            "pop_rule_preset_label": {"en": "Preset Name:", "kr": "프리셋 이름:", "jp": "プリセット名:", "cn": "预设名称:"},
             "btn_assign": {"en": "Assign", "kr": "할당", "jp": "割当", "cn": "分配"},
             "ctx_remove_infl": {"en": "Remove Influence", "kr": "영향 제거", "jp": "影響削除", "cn": "移除影响"},
             "layer_btn_mask_add": {"en": "+ Mask", "kr": "+ 마스크", "jp": "+ マスク", "cn": "+ 蒙版"},
@@ -340,6 +412,9 @@ class Translator:
                                 "cn": "从 '{}' 导入？"},
             "msg_save_complete": {"en": "Saved '{}'.", "kr": "'{}' 저장 완료.", "jp": "'{}' 保存。", "cn": "'{}' 已保存。"},
             "msg_done": {"en": "Operation Done.", "kr": "작업 완료.", "jp": "作業完了。", "cn": "操作完成。"},
+            "msg_finalize_comp": {"en": "Finalize complete.", "kr": "메시 확정 완료.", "jp": "メッシュ確定完了。", "cn": "网格完成。"},
+            "msg_batch_result": {"en": "{} of {} meshes succeeded.", "kr": "{}/{} 메시 성공.", "jp": "{}/{} メッシュ成功。",
+                                 "cn": "{}/{} 个网格成功。"},
             "msg_error_paint": {"en": "Paint Failed.", "kr": "페인트 실패.", "jp": "ペイント失敗。", "cn": "绘制失败。"},
             "msg_error_manual_edit": {"en": "Edit Failed.", "kr": "편집 실패.", "jp": "編集失敗。", "cn": "编辑失败。"},
             "title_layer_selection": {"en": "Select Layer", "kr": "레이어 선택", "jp": "レイヤー選択", "cn": "选择图层"},